@@ -0,0 +1,200 @@
+"""
+요청 수용 제어 (admission control)
+
+과부하일 때 요청을 무한히 받아들이면 모든 요청의 지연시간이 함께 늘어나다가 클라이언트가
+시간 초과로 끊고, 그동안 get_db 는 SQLite 에 세션을 계속 더 연다. 경로를 종류별로 나누어
+동시에 처리하는 요청 수를 제한하고, 넘는 요청은 길이가 정해진 대기열에서 기다리게 한다.
+대기열이 가득 찼거나 정해진 대기 시간이 지나면 처리하지 않고 503 과 Retry-After 를
+돌려주므로, 받아들인 요청은 정상 지연시간으로 끝나고 나머지는 빨리 실패한다.
+
+경로 종류와 기본 한도 (환경변수 "동시 처리/대기열/대기 초", 예: ADMISSION_AUTH=4/32/3):
+- auth: 로그인, 가입, 토큰 갱신 (비밀번호 해시가 CPU 를 오래 씀)
+- images: 프로필 이미지와 썸네일
+- writes: 그 밖의 POST/PUT/PATCH/DELETE (SQLite 는 쓰기를 하나씩 처리)
+- reads: 그 밖의 GET
+/health, /metrics, /internal 경로와 CORS preflight(OPTIONS)는 제한하지 않는다.
+제한은 워커 프로세스별로 적용된다.
+"""
+import asyncio
+import os
+from collections import Counter, deque
+from typing import Dict, Optional
+
+from metrics import counter_lines, gauge_lines
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") == "1"
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+
+AUTH_PATHS = ("/api/login", "/api/signup", "/api/token/refresh")
+IMAGE_PREFIXES = ("/api/images/", "/api/avatars")
+EXEMPT_PREFIXES = ("/health/", "/metrics", "/internal/")
+ROUTE_CLASSES = ("auth", "images", "writes", "reads")
+
+# 받은 요청의 처리 결과 (admitted: 바로 처리, queued: 기다린 뒤 처리, queue_full/timeout: 503)
+RESULTS = ("admitted", "queued", "queue_full", "timeout")
+
+
+def parse_gate(value: str) -> tuple:
+    """"동시 처리/대기열/대기 초" 문자열을 (동시 처리, 대기열 길이, 대기 초) 로 변환"""
+    concurrency, queue_size, timeout = value.split("/")
+    return int(concurrency), int(queue_size), float(timeout)
+
+
+DEFAULT_GATES = {
+    "auth": parse_gate(os.getenv("ADMISSION_AUTH", f"{os.cpu_count() or 2}/32/3")),
+    "images": parse_gate(os.getenv("ADMISSION_IMAGES", "16/64/2")),
+    "writes": parse_gate(os.getenv("ADMISSION_WRITES", "8/64/2")),
+    "reads": parse_gate(os.getenv("ADMISSION_READS", "32/128/2")),
+}
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """요청이 속한 경로 종류 (제한하지 않는 요청은 None)"""
+    if method == "OPTIONS" or path.startswith(EXEMPT_PREFIXES):
+        return None
+    if path in AUTH_PATHS:
+        return "auth"
+    if path.startswith(IMAGE_PREFIXES):
+        return "images"
+    if method in ("GET", "HEAD"):
+        return "reads"
+    return "writes"
+
+
+class AdmissionGate:
+    """동시 처리 수 제한 + 길이가 정해진 FIFO 대기열
+
+    이벤트 루프 안에서만 쓰므로 잠금이 없다. 처리가 끝난 요청은 자리를 대기열의 첫 요청에게
+    바로 넘긴다 (새로 온 요청이 기다리던 요청을 앞지르지 않음).
+    """
+
+    def __init__(self, name: str, concurrency: int, queue_size: int, timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self._waiters: deque = deque()
+        self.results = Counter()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """자리를 얻으면 True, 대기열이 가득 찼거나 시간이 지나면 False"""
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            self.results["admitted"] += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.results["queue_full"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=self.timeout)
+        except asyncio.CancelledError:
+            # 기다리는 중 연결이 끊김: 이미 넘겨받은 자리는 돌려줌
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            raise
+        if waiter.done():
+            self.results["queued"] += 1
+            return True
+        waiter.cancel()
+        self._remove(waiter)
+        self.results["timeout"] += 1
+        return False
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # 자리를 그대로 넘김 (active 유지)
+                return
+        self.active -= 1
+
+    def _remove(self, waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class AdmissionController:
+    """경로 종류별 AdmissionGate 모음"""
+
+    def __init__(self, gates: Optional[Dict[str, tuple]] = None):
+        self.gates = {
+            name: AdmissionGate(name, *limits) for name, limits in (gates or DEFAULT_GATES).items()
+        }
+
+    def gate_for(self, method: str, path: str) -> Optional[AdmissionGate]:
+        name = route_class(method, path)
+        return self.gates.get(name) if name else None
+
+    def metrics_lines(self) -> list:
+        gates = [self.gates[name] for name in ROUTE_CLASSES if name in self.gates]
+        lines = counter_lines(
+            "admission_requests_total", "Requests by route class and admission result",
+            [({"class": gate.name, "result": result}, gate.results[result]) for gate in gates for result in RESULTS],
+        )
+        lines += gauge_lines(
+            "admission_in_flight", "Requests being processed by route class",
+            [({"class": gate.name}, gate.active) for gate in gates],
+        )
+        lines += gauge_lines(
+            "admission_queue_depth", "Requests waiting for a slot by route class",
+            [({"class": gate.name}, gate.queued) for gate in gates],
+        )
+        lines += gauge_lines(
+            "admission_concurrency_limit", "Configured concurrent requests by route class",
+            [({"class": gate.name}, gate.concurrency) for gate in gates],
+        )
+        return lines
+
+
+admission = AdmissionController()
+
+
+def _busy_response(retry_after: int):
+    body = b'{"detail":"Server is busy, please retry later"}'
+    return [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"retry-after", str(retry_after).encode()),
+    ], body
+
+
+class AdmissionMiddleware:
+    """경로 종류별 동시 처리 제한 (CORS 안쪽에 두어 503 에도 CORS 헤더가 붙도록)"""
+
+    def __init__(self, app, controller: AdmissionController = admission,
+                 retry_after: int = ADMISSION_RETRY_AFTER_SECONDS, enabled: bool = ADMISSION_ENABLED):
+        self.app = app
+        self.controller = controller
+        self.retry_after = retry_after
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        gate = self.controller.gate_for(scope["method"], scope["path"]) if (
+            self.enabled and scope["type"] == "http"
+        ) else None
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await gate.acquire():
+            headers, body = _busy_response(self.retry_after)
+            await send({"type": "http.response.start", "status": 503, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
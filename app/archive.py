@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+메시지 보관(아카이브)
+
+오래된 메시지를 월별 SQLite 파일(ARCHIVE_DIR/messages-YYYY-MM.db)로 옮겨 messages 테이블을
+작게 유지한다. 대화마다 "앞부분"만 옮긴다: 보관 기준일보다 오래되고 읽은 메시지 중, 그 대화의
+읽지 않은 메시지나 최근 메시지보다 앞선 것만 옮기고 대화의 마지막 메시지는 항상 남긴다.
+따라서 대화 목록과 읽지 않은 메시지 수는 messages 테이블만으로 계산되고, 대화 기록은
+"최근 구간(messages) + 그 이전(보관 파일)" 으로 나뉜다. 옮길 때 대화의 archived_through_id 에
+옮긴 가장 큰 ID 를 기록하므로, 보관된 적 있는 대화에서만 커서가 최근 구간을 지나면
+read_archived_messages 가 보관 파일에서 conversation_id 로 이어서 읽는다.
+
+옮긴 뒤에는 compact() 로 빈 페이지를 반환한다. auto_vacuum=INCREMENTAL 인 DB 는 잠금을 짧게
+나눠 잡는 incremental_vacuum 으로 서비스 중에도 실행할 수 있고, 기존 DB 는 한 번 --vacuum 으로
+전체 VACUUM 을 해야 incremental 모드로 바뀐다.
+
+    python archive.py --older-than-days 90 --compact
+    python archive.py --vacuum     # 점검 시간에 한 번 (전체 잠금)
+
+SQLite 전용이다. PostgreSQL 에서는 created_at 기준 파티션 테이블로 같은 효과를 내야 한다.
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table, Text, create_engine, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from metrics import instrument_engine
+from models import MessageArchive
+
+logger = logging.getLogger("archive")
+
+# 보관 설정
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR")  # 기본: 데이터베이스 파일 옆 archive/
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "5000"))
+ARCHIVE_VACUUM_PAGES = int(os.getenv("ARCHIVE_VACUUM_PAGES", "2000"))  # incremental_vacuum 한 번에 반환할 페이지
+
+# SQLAlchemy 가 SQLite 에 DateTime 을 저장하는 형식 (문자열 비교용)
+_SQLITE_DATETIME = "%Y-%m-%d %H:%M:%S.%f"
+
+# 보관 파일의 messages 테이블 (원본과 같은 컬럼, 대화별 조회용 인덱스)
+archive_metadata = MetaData()
+archived_messages = Table(
+    "messages", archive_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("conversation_id", Integer),
+    Column("sender_id", Integer, nullable=False),
+    Column("receiver_id", Integer, nullable=False),
+    Column("content", Text, nullable=False),
+    Column("is_read", Integer),
+    Column("created_at", DateTime),
+    Index("ix_archived_messages_conversation", "conversation_id", "id"),
+)
+
+_MESSAGE_COLUMNS = "id, conversation_id, sender_id, receiver_id, content, is_read, created_at"
+
+# 조회와 내보내기가 돌려주는 컬럼 (messages 테이블 조회 결과와 같은 모양)
+archived_message_columns = tuple(c for c in archived_messages.c if c.name != "conversation_id")
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def archive_dir(bind) -> str:
+    """보관 파일 디렉토리"""
+    if ARCHIVE_DIR:
+        return ARCHIVE_DIR
+    database = bind.url.database
+    return os.path.join(os.path.dirname(os.path.abspath(database)), "archive")
+
+
+def archive_filename(month: str) -> str:
+    return f"messages-{month}.db"
+
+
+def archive_engine(path: str):
+    """보관 파일 엔진 (파일마다 하나씩 재사용)"""
+    with _engines_lock:
+        engine = _engines.get(path)
+        if engine is None:
+            engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+            instrument_engine(engine)
+            _engines[path] = engine
+        return engine
+
+
+def _ensure_archive_file(connection, path: str) -> None:
+    """보관 파일 생성. conversation_id 가 없던 이전 파일은 컬럼을 추가하고 대화 키로 채움"""
+    engine = archive_engine(path)
+    archive_metadata.create_all(bind=engine)
+    with engine.begin() as archive_connection:
+        columns = {row[1] for row in archive_connection.exec_driver_sql("PRAGMA table_info(messages)")}
+        if "conversation_id" in columns:
+            return
+        archive_connection.exec_driver_sql("ALTER TABLE messages ADD COLUMN conversation_id INTEGER")
+        archive_connection.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_archived_messages_conversation ON messages (conversation_id, id)"
+        )
+
+    connection.exec_driver_sql("ATTACH DATABASE ? AS archive", (path,))
+    try:
+        connection.exec_driver_sql(
+            """
+            UPDATE archive.messages SET conversation_id = (
+                SELECT c.id FROM main.conversations AS c
+                WHERE c.min_user_id = min(sender_id, receiver_id) AND c.max_user_id = max(sender_id, receiver_id)
+            )
+            WHERE conversation_id IS NULL
+            """
+        )
+        _raise_watermarks(connection, "archive.messages")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.exec_driver_sql("DETACH DATABASE archive")
+
+
+def _raise_watermarks(connection, source: str, parameters: tuple = ()) -> None:
+    """source(conversation_id, id 를 가진 메시지)의 대화별 가장 큰 ID 로 archived_through_id 를 올림"""
+    connection.exec_driver_sql(
+        f"""
+        UPDATE main.conversations
+        SET archived_through_id = max(coalesce(archived_through_id, 0), moved.max_id)
+        FROM (SELECT conversation_id, max(id) AS max_id FROM {source} GROUP BY conversation_id) AS moved
+        WHERE moved.conversation_id = conversations.id
+        """,
+        parameters,
+    )
+
+
+def upgrade_archives(bind) -> None:
+    """기록된 모든 보관 파일을 현재 형식으로 (conversation_id 채우기, 워터마크 기록)"""
+    with bind.connect() as connection, Session(bind=bind) as db:
+        directory = archive_dir(bind)
+        for (filename,) in db.query(MessageArchive.filename).all():
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                _ensure_archive_file(connection, path)
+
+
+def _build_boundaries(connection, cutoff: datetime) -> None:
+    """대화별로 보관하지 않을 첫 메시지 ID 를 임시 테이블에 계산
+
+    경계는 기준일 이후이거나 읽지 않은 첫 메시지, 그런 메시지가 없으면 대화의 마지막 메시지다.
+    """
+    connection.exec_driver_sql("DROP TABLE IF EXISTS temp.archive_boundary")
+    connection.exec_driver_sql(
+        "CREATE TEMP TABLE archive_boundary (lo INTEGER, hi INTEGER, boundary INTEGER, PRIMARY KEY (lo, hi))"
+    )
+    connection.exec_driver_sql(
+        """
+        INSERT INTO temp.archive_boundary (lo, hi, boundary)
+        SELECT min(sender_id, receiver_id), max(sender_id, receiver_id),
+               coalesce(min(CASE WHEN created_at >= ? OR is_read = 0 THEN id END), max(id))
+        FROM main.messages
+        GROUP BY min(sender_id, receiver_id), max(sender_id, receiver_id)
+        """,
+        (cutoff.strftime(_SQLITE_DATETIME),),
+    )
+
+
+def _next_batch(connection, after_id: int, batch_size: int):
+    return connection.exec_driver_sql(
+        """
+        SELECT m.id, strftime('%Y-%m', m.created_at)
+        FROM main.messages AS m
+        JOIN temp.archive_boundary AS b
+          ON b.lo = min(m.sender_id, m.receiver_id) AND b.hi = max(m.sender_id, m.receiver_id)
+        WHERE m.id > ? AND m.id < b.boundary
+        ORDER BY m.id
+        LIMIT ?
+        """,
+        (after_id, batch_size),
+    ).all()
+
+
+def _record_month(connection, month: str, ids: list) -> None:
+    """message_archives 에 월별 보관 파일 행을 추가하거나 행 수와 ID 범위를 늘림"""
+    statement = sqlite_insert(MessageArchive.__table__).values(
+        month=month, filename=archive_filename(month), rows=len(ids), min_id=min(ids), max_id=max(ids),
+        updated_at=datetime.utcnow(),
+    )
+    excluded = statement.excluded
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[MessageArchive.month],
+        set_={
+            "rows": MessageArchive.rows + excluded.rows,
+            "min_id": func.min(func.coalesce(MessageArchive.min_id, excluded.min_id), excluded.min_id),
+            "max_id": func.max(func.coalesce(MessageArchive.max_id, excluded.max_id), excluded.max_id),
+            "updated_at": excluded.updated_at,
+        },
+    ))
+
+
+def _move_month(connection, path: str, month: str, ids: list) -> None:
+    """한 달 치 메시지를 보관 파일로 복사하고 보관 목록과 대화 워터마크를 기록한 뒤 원본에서 삭제
+
+    WAL 모드에서는 ATTACH 한 DB 사이의 커밋이 원자적이지 않으므로 INSERT OR IGNORE 로
+    복사해 중간에 실패해도 다시 실행하면 이어서 진행되게 한다. 보관 목록, 워터마크, 삭제는
+    같은 트랜잭션이라 어디서도 읽을 수 없는 상태로 메시지만 사라지는 일은 없다.
+    """
+    placeholders = ",".join("?" * len(ids))
+    connection.exec_driver_sql("ATTACH DATABASE ? AS archive", (path,))
+    try:
+        connection.exec_driver_sql(
+            f"INSERT OR IGNORE INTO archive.messages ({_MESSAGE_COLUMNS}) "
+            f"SELECT {_MESSAGE_COLUMNS} FROM main.messages WHERE id IN ({placeholders})",
+            tuple(ids),
+        )
+        _record_month(connection, month, ids)
+        _raise_watermarks(connection, f"main.messages WHERE id IN ({placeholders})", tuple(ids))
+        connection.exec_driver_sql(f"DELETE FROM main.messages WHERE id IN ({placeholders})", tuple(ids))
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.exec_driver_sql("DETACH DATABASE archive")
+
+
+def archive_messages(
+    bind, older_than_days: int = ARCHIVE_AFTER_DAYS, batch_size: int = ARCHIVE_BATCH_SIZE,
+    now: Optional[datetime] = None, on_batch: Optional[Callable] = None
+) -> dict:
+    """오래된 메시지를 월별 보관 파일로 이동 -> {월: 이동한 메시지 수}
+
+    on_batch 는 배치를 옮길 때마다 호출된다 (maintenance.py 의 임대 연장).
+    """
+    if bind.dialect.name != "sqlite":
+        raise RuntimeError("message archiving supports SQLite only")
+
+    cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+    directory = archive_dir(bind)
+    os.makedirs(directory, exist_ok=True)
+    moved = defaultdict(int)
+
+    # 워터마크는 대화 기준이므로 대화에 연결되지 않은 메시지를 먼저 연결
+    from database import backfill_conversations
+    backfill_conversations(bind)
+    upgrade_archives(bind)
+
+    with bind.connect() as connection:
+        _build_boundaries(connection, cutoff)
+        connection.commit()
+        last_id = 0
+        while True:
+            batch = _next_batch(connection, last_id, batch_size)
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            by_month = defaultdict(list)
+            for message_id, month in batch:
+                by_month[month].append(message_id)
+            for month, ids in sorted(by_month.items()):
+                path = os.path.join(directory, archive_filename(month))
+                _ensure_archive_file(connection, path)
+                _move_month(connection, path, month, ids)
+                moved[month] += len(ids)
+            if on_batch is not None:
+                on_batch()
+        connection.exec_driver_sql("DROP TABLE IF EXISTS temp.archive_boundary")
+
+    if moved:
+        logger.info("Archived %d messages older than %s into %d month(s)", sum(moved.values()), cutoff, len(moved))
+    return dict(moved)
+
+
+def read_archived_messages(db: Session, conversation_id: int, limit: int, before: Optional[int] = None):
+    """보관 파일에서 대화의 메시지를 최신순으로 조회 (before 보다 작은 ID)"""
+    archives = db.query(MessageArchive.filename, MessageArchive.min_id).order_by(MessageArchive.month.desc()).all()
+    if not archives:
+        return []
+
+    directory = archive_dir(db.get_bind())
+    rows = []
+    for filename, min_id in archives:
+        if before is not None and min_id is not None and min_id >= before:
+            continue
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            logger.warning("Archive file missing: %s", path)
+            continue
+        query = select(*archived_message_columns).where(archived_messages.c.conversation_id == conversation_id)
+        if before is not None:
+            query = query.where(archived_messages.c.id < before)
+        query = query.order_by(archived_messages.c.id.desc()).limit(limit - len(rows))
+        with archive_engine(path).connect() as connection:
+            rows += connection.execute(query).all()
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+def compact(bind, vacuum: bool = False, pages: int = ARCHIVE_VACUUM_PAGES, pause: float = 0.05) -> int:
+    """빈 페이지 반환 -> 반환한 페이지 수
+
+    auto_vacuum=INCREMENTAL 이면 pages 단위로 나눠 incremental_vacuum 을 실행해 쓰기 잠금을
+    짧게 유지한다. vacuum=True 면 전체 VACUUM 을 실행한다 (DB 전체 잠금, incremental 모드로 전환).
+    """
+    with bind.connect() as connection:
+        freed = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+        if vacuum:
+            connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.exec_driver_sql("VACUUM")
+        elif connection.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:
+            while connection.exec_driver_sql("PRAGMA freelist_count").scalar() > 0:
+                connection.exec_driver_sql(f"PRAGMA incremental_vacuum({int(pages)})")
+                connection.commit()
+                time.sleep(pause)
+        else:
+            logger.warning("auto_vacuum is not INCREMENTAL; run with --vacuum once to enable online compaction")
+            return 0
+        if bind.url.database and connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal":
+            connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        connection.commit()
+    return freed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="오래된 메시지를 월별 보관 파일로 이동")
+    parser.add_argument("--database", help="데이터베이스 URL (기본: DATABASE_URL)")
+    parser.add_argument("--older-than-days", type=int, default=ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--compact", action="store_true", help="이동 후 incremental_vacuum 으로 공간 반환")
+    parser.add_argument("--vacuum", action="store_true", help="전체 VACUUM (DB 잠금, incremental 모드로 전환)")
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = parse_args()
+    if args.database:
+        os.environ["DATABASE_URL"] = args.database
+    from database import engine, init_db
+
+    init_db()
+    started = time.perf_counter()
+    moved = archive_messages(engine, args.older_than_days, args.batch_size)
+    for month, count in sorted(moved.items()):
+        print(f"{month}: {count} messages")
+    print(f"archived {sum(moved.values())} messages in {time.perf_counter() - started:.1f}s")
+    if args.compact or args.vacuum:
+        freed = compact(engine, vacuum=args.vacuum)
+        print(f"freed {freed} pages")
+
+
+if __name__ == "__main__":
+    main()
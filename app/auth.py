@@ -1,23 +1,75 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 # JWT 설정
 SECRET_KEY = "your-secret-key-here-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 1
+# 리프레시 토큰 유효 기간 (사용할 때마다 새 토큰으로 교체되며 기간도 다시 시작)
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+# 교체된 토큰이 이 시간 안에 다시 오면 (여러 탭의 동시 갱신) 폐기하지 않고 같은 다음 토큰을 돌려줌
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = int(os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "10"))
 
-# 패스워드 해싱 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해시 설정. PASSWORD_SCHEMES 의 첫 번째가 새 해시에 쓰이고, 나머지는 기존 해시 검증용
+# (로그인에 성공하면 첫 번째 방식으로 다시 해시). 비용은 calibrate_hash.py 로 이 서버에서 정한다.
+PASSWORD_SCHEMES = [s.strip() for s in os.getenv("PASSWORD_SCHEMES", "bcrypt").split(",") if s.strip()]
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # KiB
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "1"))
+
+# passlib/bcrypt 와 python-jose(cryptography) 는 import 비용이 커서 처음 사용할 때 불러온다
+
+def build_pwd_context(
+    schemes=None, bcrypt_rounds: int = BCRYPT_ROUNDS, argon2_time_cost: int = ARGON2_TIME_COST,
+    argon2_memory_cost: int = ARGON2_MEMORY_COST, argon2_parallelism: int = ARGON2_PARALLELISM
+):
+    """해시 방식과 비용으로 CryptContext 생성
+
+    비용을 최솟값과 최댓값으로도 지정해, 설정과 다른 비용의 해시는 needs_update 가 참이 된다
+    (비용을 올리면 업그레이드, 내리면 다운그레이드). argon2 는 argon2-cffi 가 있어야 한다.
+    """
+    from passlib.context import CryptContext
+
+    schemes = list(schemes or PASSWORD_SCHEMES)
+    settings = {}
+    if "bcrypt" in schemes:
+        settings.update(
+            bcrypt__default_rounds=bcrypt_rounds, bcrypt__min_rounds=bcrypt_rounds, bcrypt__max_rounds=bcrypt_rounds
+        )
+    if "argon2" in schemes:
+        settings.update(
+            argon2__type="ID",
+            argon2__default_rounds=argon2_time_cost,
+            argon2__min_rounds=argon2_time_cost,
+            argon2__max_rounds=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """패스워드 해싱 설정"""
+    return build_pwd_context()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 -> (일치 여부, 현재 설정으로 다시 만든 해시 또는 None)"""
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict) -> str:
     """JWT 토큰 생성"""
@@ -34,11 +86,15 @@ def create_access_token(data: dict) -> str:
         "jti": f"token-{datetime.utcnow().timestamp()}"  # JWT ID
     })
     
+    from jose import jwt
+
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
     """JWT 토큰 검증"""
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token, 
@@ -50,3 +106,17 @@ def verify_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+def generate_refresh_token() -> str:
+    """리프레시 토큰 원문 (클라이언트에만 전달하고 DB 에는 해시만 저장)"""
+    return secrets.token_urlsafe(32)
+
+def successor_refresh_token(token: str) -> str:
+    """교체할 때 발급하는 다음 토큰 (원문을 저장하지 않고도 같은 토큰을 다시 만들 수 있도록 HMAC 으로 파생)"""
+    key = hashlib.sha256(b"refresh-token:" + SECRET_KEY.encode()).digest()
+    digest = hmac.new(key, token.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+def hash_refresh_token(token: str) -> str:
+    """리프레시 토큰 조회용 해시 (토큰 자체가 무작위이므로 솔트 없는 SHA-256 으로 충분)"""
+    return hashlib.sha256(token.encode()).hexdigest()
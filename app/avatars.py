@@ -0,0 +1,236 @@
+"""
+프로필 이미지: 기본 이미지(플레이스홀더), 서명된 URL, 썸네일
+
+프로필 이미지가 없는 사용자에게 외부 서비스(placehold.co)로 리다이렉트하는 대신, 이름 이니셜을
+역할 색 배경에 그린 PNG 를 직접 만들어 돌려준다. 크기는 AVATAR_SIZES 중 하나로 맞추고,
+(이니셜, 역할, 크기) 별로 한 번만 그려 LRU 캐시(AVATAR_CACHE_SIZE)에 보관한다. 같은 이니셜의
+사용자는 같은 이미지를 공유하므로 캐시 항목 수는 사용자 수보다 훨씬 적다.
+
+이니셜 글꼴은 AVATAR_FONT(TTF 경로)로 바꿀 수 있다. 글꼴에 없는 글자(예: 한글 이름에 라틴 글꼴)는
+네모 대신 역할 첫 글자(M)로 대신한다.
+
+응답의 imageUrl 은 (사용자 ID, 버전, 만료 시각)에 HMAC 서명을 붙인 URL 이다. <img> 는 인증 헤더를
+보낼 수 없고, 서명은 DB 없이 확인되므로 이미지 요청마다 토큰 디코딩과 사용자 조회를 하지 않는다.
+만료 시각은 AVATAR_URL_TTL_SECONDS 단위 구간의 끝으로 맞춰 같은 구간 안에서는 URL 이 바뀌지 않고
+(목록 캐시와 ETag 가 유지됨), 발급된 URL 은 최소 AVATAR_URL_TTL_SECONDS 동안 유효하다.
+업로드한 이미지의 작은 크기(썸네일)는 (사용자 ID, 버전, 크기) 별로 LRU 캐시(AVATAR_THUMBNAIL_CACHE_SIZE)에 보관한다.
+"""
+import base64
+import hashlib
+import hmac
+import io
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from metrics import counter_lines
+
+# 플레이스홀더 설정
+AVATAR_SIZES = tuple(sorted(int(s) for s in os.getenv("AVATAR_SIZES", "48,96,192,500").split(",") if s.strip()))
+AVATAR_CACHE_SIZE = int(os.getenv("AVATAR_CACHE_SIZE", "512"))
+AVATAR_MAX_AGE_SECONDS = int(os.getenv("AVATAR_MAX_AGE_SECONDS", "300"))
+AVATAR_FONT = os.getenv("AVATAR_FONT", "DejaVuSans-Bold.ttf")
+
+# 서명된 URL 과 썸네일 설정
+AVATAR_URL_TTL_SECONDS = int(os.getenv("AVATAR_URL_TTL_SECONDS", "3600"))
+AVATAR_THUMBNAIL_CACHE_SIZE = int(os.getenv("AVATAR_THUMBNAIL_CACHE_SIZE", "2048"))
+AVATAR_BATCH_MAX = int(os.getenv("AVATAR_BATCH_MAX", "100"))  # 일괄 조회 한 번에 받는 사용자 수
+UPLOADED_IMAGE_SIZE = 500  # 업로드한 이미지는 500x500 JPEG 로 저장됨 (crud.update_user_profile)
+
+ROLE_COLORS = {
+    "mentor": (79, 70, 229),   # indigo
+    "mentee": (16, 150, 110),  # green
+}
+DEFAULT_COLOR = (107, 114, 128)
+TEXT_COLOR = (255, 255, 255)
+
+# 그리는 방식이 바뀌면 올려서 클라이언트 캐시(ETag)를 무효화
+_RENDER_VERSION = 1
+
+
+def normalize_size(size: Optional[int]) -> int:
+    """요청 크기 이상인 가장 작은 고정 크기 (없으면 가장 큰 크기)"""
+    if size is None:
+        return AVATAR_SIZES[-1]
+    for candidate in AVATAR_SIZES:
+        if candidate >= size:
+            return candidate
+    return AVATAR_SIZES[-1]
+
+
+@lru_cache(maxsize=None)
+def _font(size: int):
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(AVATAR_FONT, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=4096)
+def _renderable(char: str) -> bool:
+    # 글꼴에 없는 글자는 .notdef 글리프로 그려지므로 사용하지 않는 코드 포인트와 모양을 비교
+    font = _font(32)
+    return bytes(font.getmask(char)) != bytes(font.getmask("\uffff"))
+
+
+def initials(name: Optional[str], role: str) -> str:
+    """이름의 앞 두 단어 첫 글자 (그릴 수 없으면 역할 첫 글자)"""
+    letters = "".join(word[0] for word in (name or "").split()[:2]).upper()
+    if letters and all(_renderable(char) for char in letters):
+        return letters
+    return (role[:1] or "?").upper()
+
+
+def render_placeholder(text: str, role: str, size: int) -> bytes:
+    """이니셜 PNG 생성"""
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (size, size), ROLE_COLORS.get(role, DEFAULT_COLOR))
+    draw = ImageDraw.Draw(image)
+    font = _font(max(8, int(size * (0.42 if len(text) > 1 else 0.5))))
+    draw.text((size / 2, size / 2), text, fill=TEXT_COLOR, font=font, anchor="mm")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+class PlaceholderCache:
+    """(이니셜, 역할, 크기) -> PNG 바이트 LRU 캐시"""
+
+    metric_name = "avatar_placeholder_lookups_total"
+    metric_help = "Placeholder avatar cache lookups"
+
+    def __init__(self, max_entries: int = AVATAR_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.lookups = Counter()
+
+    @staticmethod
+    def etag(text: str, role: str, size: int) -> str:
+        # 내용이 (이니셜, 역할, 크기, 그리기 버전)으로 정해지므로 그리기 전에 계산 가능 (강한 ETag)
+        digest = hashlib.sha1(repr((_RENDER_VERSION, text, role, size)).encode()).hexdigest()[:20]
+        return f'"avatar-{digest}"'
+
+    def get(self, text: str, role: str, size: int) -> bytes:
+        return self.lookup((text, role, size), render_placeholder, text, role, size)
+
+    def peek(self, key: tuple) -> Optional[bytes]:
+        """캐시에 있으면 바이트 (없으면 None, 그리지 않음)"""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.lookups["hit"] += 1
+            return body
+
+    def lookup(self, key: tuple, render, *args) -> bytes:
+        body = self.peek(key)
+        if body is not None:
+            return body
+        # 그리는 동안 잠금을 잡지 않음 (동시에 같은 항목을 그려도 결과는 같음)
+        body = render(*args)
+        with self._lock:
+            self.lookups["miss"] += 1
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics_lines(self) -> list:
+        samples = [({"result": result}, self.lookups[result]) for result in ("hit", "miss")]
+        return counter_lines(self.metric_name, self.metric_help, samples)
+
+
+placeholder_cache = PlaceholderCache()
+
+
+def placeholder_key(name: Optional[str], role: str, size: Optional[int]) -> Tuple[str, str, int]:
+    """사용자 이름/역할과 요청 크기 -> 캐시 키 (이니셜, 역할, 고정 크기)"""
+    return initials(name, role), role, normalize_size(size)
+
+
+def render_thumbnail(image: bytes, size: int) -> bytes:
+    """업로드한 JPEG 를 size x size 로 축소"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image)) as img:
+        img = img.convert("RGB")
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+class ThumbnailCache(PlaceholderCache):
+    """(사용자 ID, 버전, 크기) -> 축소한 JPEG 바이트 LRU 캐시"""
+
+    metric_name = "avatar_thumbnail_lookups_total"
+    metric_help = "Uploaded avatar thumbnail cache lookups"
+
+    def __init__(self, max_entries: int = AVATAR_THUMBNAIL_CACHE_SIZE):
+        super().__init__(max_entries)
+
+    def get(self, user_id: int, version: int, size: int, image: bytes) -> bytes:
+        if size >= UPLOADED_IMAGE_SIZE:
+            return image
+        return self.lookup((user_id, version, size), render_thumbnail, image, size)
+
+
+thumbnail_cache = ThumbnailCache()
+
+
+def avatar_body(user_id: int, version: int, name: Optional[str], role: str,
+                image: Optional[bytes], size: Optional[int]) -> Tuple[bytes, str]:
+    """사용자의 size 크기 프로필 이미지 -> (바이트, 미디어 타입)"""
+    if image:
+        return thumbnail_cache.get(user_id, version, normalize_size(size), image), "image/jpeg"
+    return placeholder_cache.get(*placeholder_key(name, role, size)), "image/png"
+
+
+# 서명된 URL
+
+@lru_cache(maxsize=None)
+def _signing_key() -> bytes:
+    # JWT 키와 용도를 분리한 파생 키
+    from auth import SECRET_KEY
+
+    return hashlib.sha256(b"avatar-url:" + SECRET_KEY.encode()).digest()
+
+
+def sign(user_id: int, version: int, expires: int) -> str:
+    message = f"{user_id}:{version}:{expires}".encode()
+    digest = hmac.new(_signing_key(), message, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def url_epoch(now: Optional[float] = None) -> int:
+    """현재 URL 구간 번호 (같은 구간에서는 같은 URL 을 발급)"""
+    return int((time.time() if now is None else now) // AVATAR_URL_TTL_SECONDS)
+
+
+def signed_url(user_id: int, version: int, now: Optional[float] = None) -> str:
+    """프로필 이미지 URL (다음 구간이 끝날 때까지 유효)"""
+    expires = (url_epoch(now) + 2) * AVATAR_URL_TTL_SECONDS
+    return f"/api/avatars/{user_id}?v={version}&exp={expires}&sig={sign(user_id, version, expires)}"
+
+
+def verify(user_id: int, version: int, expires: int, signature: str, now: Optional[float] = None) -> bool:
+    """서명이 맞고 만료되지 않았는지 (DB 조회 없음)"""
+    if expires <= (time.time() if now is None else now):
+        return False
+    return hmac.compare_digest(sign(user_id, version, expires), signature)
+
+
+def signed_etag(user_id: int, version: int, size: Optional[int]) -> str:
+    # 서명된 URL 의 내용은 (사용자 ID, 버전, 크기)로 정해지므로 DB 조회 없이 304 판단 가능
+    return f'"avatar-{user_id}-{version}-{normalize_size(size)}-{_RENDER_VERSION}"'
@@ -0,0 +1,154 @@
+"""
+응답 캐시
+
+멘토 목록처럼 읽기가 많고 변경이 드문 응답을 프로세스 내 LRU 캐시에 보관한다 (항목은
+CACHE_TTL_SECONDS 뒤 만료). CACHE_BACKEND_URL(예: redis://localhost:6379/0)을 설정하면
+여러 워커가 공유하는 Redis 백엔드를 사용한다.
+
+캐시 키에는 현재 세대(generation) 번호가 포함된다. 데이터가 바뀌면 세대를 올리는
+것만으로 이전 항목이 모두 무효화되며, ETag 역시 세대에서 파생되므로 변경이 없는
+동안에는 클라이언트가 If-None-Match 로 304 응답을 받을 수 있다 (conditional.py).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# 캐시 설정
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_BACKEND_URL = os.getenv("CACHE_BACKEND_URL")
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 캐시 백엔드
+
+    항목은 ttl 초가 지나면 만료된다 (0 이면 만료 없음). 세대는 프로세스마다 따로이므로
+    여러 워커가 이 백엔드를 쓰면 다른 워커의 변경은 TTL 이 지난 뒤 반영된다.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 재시작 후 이전 프로세스의 ETag 와 겹치지 않도록 시각에서 시작
+        self._generation = time.time_ns() // 1_000_000
+
+    def get_generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """여러 워커가 공유하는 Redis 캐시 백엔드 (redis 패키지 필요)
+
+    크기 제한은 Redis 의 maxmemory-policy(allkeys-lru)와 항목별 TTL 에 맡긴다.
+    """
+
+    def __init__(self, url: str, namespace: str, ttl: int = CACHE_TTL_SECONDS):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._namespace = namespace
+        self._ttl = ttl
+
+    def get_generation(self) -> int:
+        value = self._client.get(f"{self._namespace}:generation")
+        return int(value) if value else 0
+
+    def bump_generation(self) -> int:
+        return int(self._client.incr(f"{self._namespace}:generation"))
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(f"{self._namespace}:{key}")
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, value: Any) -> None:
+        self._client.set(f"{self._namespace}:{key}", json.dumps(value), ex=self._ttl)
+
+
+class ResponseCache:
+    """세대 기반 무효화와 ETag 를 지원하는 응답 캐시"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        return self.backend.get_generation()
+
+    def key(self, *parts) -> str:
+        """현재 세대가 포함된 캐시 키 생성"""
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+        return f"{self.generation}-{digest}"
+
+    @staticmethod
+    def etag(key: str) -> str:
+        return f'"{key}"'
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, value)
+
+    def metrics_lines(self, name: str) -> list:
+        return [
+            "# HELP cache_lookups_total Response cache lookups",
+            "# TYPE cache_lookups_total counter",
+            f'cache_lookups_total{{cache="{name}",result="hit"}} {self.hits}',
+            f'cache_lookups_total{{cache="{name}",result="miss"}} {self.misses}',
+        ]
+
+    def invalidate(self) -> int:
+        """세대를 올려 기존 항목과 ETag 를 모두 무효화하고 새 세대를 반환"""
+        return self.backend.bump_generation()
+
+
+def _create_backend(namespace: str):
+    if CACHE_BACKEND_URL:
+        return RedisCacheBackend(CACHE_BACKEND_URL, namespace)
+    return MemoryCacheBackend()
+
+
+# 멘토 목록 캐시 (키: skill, order_by, page)
+mentor_cache = ResponseCache(_create_backend("mentors"))
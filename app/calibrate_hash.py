@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 비용 보정
+
+이 서버에서 비밀번호 검증 한 번이 목표 시간(--target-ms) 안에 끝나는 가장 높은 비용을 찾아
+환경 변수로 출력한다. 로그인 지연 예산과 코어 수에 맞춰 비용을 정할 때 쓰고, 출력값을
+서버 환경에 넣고 재시작하면 기존 해시는 다음 로그인 때 새 비용으로 다시 저장된다.
+
+    python calibrate_hash.py --target-ms 250
+    python calibrate_hash.py --scheme argon2 --target-ms 300 --memory-cost 65536 --parallelism 2
+
+비용이 한 단계 오를 때 bcrypt 는 시간이 두 배, argon2 는 time_cost 만큼 선형으로 는다.
+검증 하나가 코어 하나를 그 시간만큼 쓰므로 코어당 로그인 처리량은 약 1000 / 검증 ms 이다.
+"""
+import argparse
+import statistics
+import time
+
+from auth import (
+    ARGON2_MEMORY_COST, ARGON2_PARALLELISM, ARGON2_TIME_COST, BCRYPT_ROUNDS, build_pwd_context
+)
+
+BCRYPT_MIN_ROUNDS = 4
+BCRYPT_MAX_ROUNDS = 18
+ARGON2_MAX_TIME_COST = 20
+
+_SAMPLE_PASSWORD = "calibration-password-123"
+
+
+def measure_verify(context, samples: int = 5) -> float:
+    """context 의 기본 방식으로 만든 해시를 검증하는 시간의 중앙값 (초)"""
+    hashed = context.hash(_SAMPLE_PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(_SAMPLE_PASSWORD, hashed)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target: float, samples: int = 5) -> tuple:
+    """검증 시간이 target 초 이하인 가장 높은 bcrypt rounds -> (rounds, 검증 시간)"""
+    lowest = build_pwd_context(["bcrypt"], bcrypt_rounds=BCRYPT_MIN_ROUNDS)
+    best = (BCRYPT_MIN_ROUNDS, measure_verify(lowest, samples))
+    for rounds in range(BCRYPT_MIN_ROUNDS + 1, BCRYPT_MAX_ROUNDS + 1):
+        # 한 단계마다 두 배가 되므로 확실히 넘을 단계는 재지 않음
+        if best[1] * 2 > target * 1.5:
+            break
+        seconds = measure_verify(build_pwd_context(["bcrypt"], bcrypt_rounds=rounds), samples)
+        if seconds > target:
+            break
+        best = (rounds, seconds)
+    return best
+
+
+def calibrate_argon2(target: float, memory_cost: int, parallelism: int, samples: int = 5) -> tuple:
+    """메모리와 병렬도를 고정하고 검증 시간이 target 초 이하인 가장 높은 time_cost -> (time_cost, 검증 시간)"""
+    best = None
+    for time_cost in range(1, ARGON2_MAX_TIME_COST + 1):
+        context = build_pwd_context(
+            ["argon2"], argon2_time_cost=time_cost, argon2_memory_cost=memory_cost, argon2_parallelism=parallelism
+        )
+        seconds = measure_verify(context, samples)
+        if seconds > target and best is not None:
+            break
+        best = (time_cost, seconds)
+        if seconds > target:
+            break
+    return best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="목표 검증 시간에 맞는 비밀번호 해시 비용 찾기")
+    parser.add_argument("--scheme", choices=("bcrypt", "argon2"), default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250, help="비밀번호 검증 한 번의 목표 시간")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--memory-cost", type=int, default=ARGON2_MEMORY_COST, help="argon2 메모리 (KiB)")
+    parser.add_argument("--parallelism", type=int, default=ARGON2_PARALLELISM, help="argon2 병렬도")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    target = args.target_ms / 1000
+    if args.scheme == "bcrypt":
+        rounds, seconds = calibrate_bcrypt(target, args.samples)
+        settings = {"PASSWORD_SCHEMES": "bcrypt", "BCRYPT_ROUNDS": rounds}
+        current = f"current BCRYPT_ROUNDS={BCRYPT_ROUNDS}"
+    else:
+        from passlib.exc import MissingBackendError
+
+        try:
+            time_cost, seconds = calibrate_argon2(
+                target, args.memory_cost, args.parallelism, args.samples
+            )
+        except MissingBackendError:
+            raise SystemExit("argon2 requires argon2-cffi (pip install argon2-cffi)")
+        # 기존 bcrypt 해시는 검증만 하고 로그인 때 argon2 로 다시 해시
+        settings = {
+            "PASSWORD_SCHEMES": "argon2,bcrypt", "ARGON2_TIME_COST": time_cost,
+            "ARGON2_MEMORY_COST": args.memory_cost, "ARGON2_PARALLELISM": args.parallelism,
+        }
+        current = f"current ARGON2_TIME_COST={ARGON2_TIME_COST}"
+    if seconds > target:
+        print(f"# even the lowest cost takes {seconds * 1000:.1f} ms (> {args.target_ms:g} ms)")
+    print(f"# verify {seconds * 1000:.1f} ms, about {1 / seconds:.1f} logins/s per core ({current})")
+    for name, value in settings.items():
+        print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding 에 따라 brotli(brotli 패키지 설치시) 또는 gzip 으로 응답 본문을 압축한다.
+COMPRESSION_MIN_SIZE 보다 작은 응답, 이미 인코딩된 응답, 이미지처럼 압축 효과가 없는
+응답은 그대로 전달한다. 스트리밍 응답은 청크 단위로 압축한다.
+"""
+import gzip
+import os
+import zlib
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 사용
+    brotli = None
+
+# 압축 설정
+COMPRESSION_ENCODINGS = [
+    e.strip() for e in os.getenv("COMPRESSION_ENCODINGS", "br,gzip").split(",") if e.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/x-ndjson", "application/javascript",
+    "image/svg+xml", "text/",
+)
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Accept-Encoding 헤더를 {인코딩: q값} 으로 변환"""
+    result = {}
+    for item in header.split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        result[name] = quality
+    return result
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """gzip/brotli 응답 압축 ASGI 미들웨어"""
+
+    def __init__(
+        self, app, minimum_size: int = COMPRESSION_MIN_SIZE,
+        encodings: list = COMPRESSION_ENCODINGS,
+        gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = [
+            e for e in encodings if e == "gzip" or (e == "br" and brotli is not None)
+        ]
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        """서버 선호 순서대로 클라이언트가 허용하는 인코딩 선택"""
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in self.encodings:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if quality > 0:
+                return encoding
+        return None
+
+    def compress(self, encoding: str, data: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level)
+
+    def compressor(self, encoding: str):
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = self.choose_encoding(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressionResponder(self, encoding, send).run(scope, receive)
+
+
+class _CompressionResponder:
+    """응답 하나의 압축 상태"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message = None
+        self.passthrough = False
+        self.compressor = None
+
+    async def run(self, scope, receive):
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    def _should_compress(self) -> bool:
+        status = self.start_message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        content_type = ""
+        for key, value in self.start_message["headers"]:
+            if key.lower() == b"content-encoding":
+                return False
+            if key.lower() == b"content-type":
+                content_type = value.decode("latin-1").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compressed_headers(self, content_length: Optional[int]) -> list:
+        headers = []
+        vary = []
+        for key, value in self.start_message["headers"]:
+            name = key.lower()
+            if name == b"content-length":
+                continue
+            if name == b"vary":
+                vary.append(value)
+                continue
+            if name == b"etag" and not value.startswith(b"W/"):
+                # 인코딩이 바뀌면 강한 ETag 는 약한 ETag 로 변환
+                value = b"W/" + value
+            headers.append((key, value))
+        vary.append(b"Accept-Encoding")
+        headers.append((b"content-encoding", self.encoding.encode()))
+        headers.append((b"vary", b", ".join(vary)))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        return headers
+
+    async def send_wrapper(self, message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not self._should_compress() or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            if not more_body:
+                compressed = self.middleware.compress(self.encoding, body)
+                self.start_message["headers"] = self._compressed_headers(len(compressed))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # 스트리밍 응답은 청크 단위로 압축
+            self.compressor = self.middleware.compressor(self.encoding)
+            self.start_message["headers"] = self._compressed_headers(None)
+            await self.send(self.start_message)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.flush()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -0,0 +1,46 @@
+"""
+조건부 GET 지원
+
+행 버전(사용자 version, 매칭 요청 updated_at 등)에서 ETag 를 만들고, If-None-Match 가
+일치하면 응답 본문을 만들기 전에 304 를 반환한다.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# 조건부 응답 공통 캐시 정책 (항상 재검증)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """버전 정보로부터 ETag 생성"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag 와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    etag = _strip_weak(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _strip_weak(candidate) == etag:
+            return True
+    return False
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """변경이 없으면 304 응답, 있으면 None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+    return None
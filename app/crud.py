@@ -1,10 +1,35 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from models import User, MatchRequest
-from typing import Optional, List
+from sqlalchemy import and_, or_, func, select, update
+from sqlalchemy.engine import Row
+from models import User, MatchRequest, RefreshToken
+from typing import Optional, List, Tuple
 import base64
-from PIL import Image
+import binascii
 import io
+import uuid
+from datetime import datetime, timedelta
+
+from auth import (
+    REFRESH_TOKEN_EXPIRE_DAYS, REFRESH_TOKEN_REUSE_GRACE_SECONDS, generate_refresh_token, hash_refresh_token,
+    successor_refresh_token
+)
+
+from directory import mentor_directory
+
+# 멘토 목록 페이지 크기 (기본값, 최대값)
+MENTOR_PAGE_SIZE = 50
+MENTOR_MAX_PAGE_SIZE = 100
+
+# 매칭 요청 목록 조회시 가져올 컬럼
+MATCH_REQUEST_LIST_COLUMNS = (
+    MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id,
+    MatchRequest.message, MatchRequest.status, MatchRequest.created_at
+)
+
+# 매칭 요청 상태와 요청 목록 페이지 크기 (기본값, 최대값)
+MATCH_REQUEST_STATUSES = ("pending", "accepted", "rejected", "cancelled", "expired")
+REQUEST_PAGE_SIZE = 50
+REQUEST_MAX_PAGE_SIZE = 100
 
 def create_user(db: Session, email: str, password_hash: str, name: str, role: str) -> User:
     """새 사용자 생성"""
@@ -16,7 +41,7 @@ def create_user(db: Session, email: str, password_hash: str, name: str, role: st
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
+    mentor_directory.apply(user)
     return user
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -27,23 +52,41 @@ def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     """ID로 사용자 조회"""
     return db.query(User).filter(User.id == user_id).first()
 
+def update_password_hash(db: Session, user_id: int, password_hash: str) -> None:
+    """비밀번호 해시 교체 (로그인 시 재해시, 프로필 버전은 올리지 않음)"""
+    db.execute(update(User).where(User.id == user_id).values(password_hash=password_hash))
+    db.commit()
+
+def get_avatar_sources(db: Session, user_ids: List[int], include_image: bool = True) -> List[Row]:
+    """프로필 이미지를 만드는 데 필요한 컬럼 (id, version, name, role, image) 을 SELECT 한 번으로 조회
+
+    include_image 가 거짓이면 BLOB 대신 이미지가 있는지 여부만 읽는다 (썸네일 캐시 확인용).
+    """
+    image = User.profile_image if include_image else User.profile_image.isnot(None)
+    return db.execute(
+        select(User.id, User.version, User.name, User.role, image.label("image")).where(User.id.in_(user_ids))
+    ).all()
+
 def update_user_profile(
     db: Session, user_id: int, name: str, bio: Optional[str] = None, 
     image_base64: Optional[str] = None, skills: Optional[str] = None
 ) -> User:
-    """사용자 프로필 업데이트"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return None
-    
-    user.name = name
+    """사용자 프로필 업데이트
+
+    version 은 UPDATE 문 안에서 version + 1 로 올린다. 같은 사용자의 수정이 동시에 와도
+    나중 UPDATE 가 앞의 것을 덮어쓸 뿐 실패하지 않고, 수정마다 version 이 하나씩 오른다.
+    """
+    values = {"name": name, "version": User.version + 1}
     if bio is not None:
-        user.bio = bio
+        values["bio"] = bio
     if skills is not None:
-        user.skills = skills
+        values["skills"] = skills
     
     # 이미지 처리
     if image_base64:
+        # PIL 은 이미지 업로드에서만 쓰므로 처음 필요할 때 import (워커 시작 시간 단축)
+        from PIL import Image
+
         try:
             # Base64 디코딩
             image_data = base64.b64decode(image_base64)
@@ -64,33 +107,19 @@ def update_user_profile(
                 # JPEG로 변환하여 저장
                 output = io.BytesIO()
                 img.convert('RGB').save(output, format='JPEG', quality=85)
-                user.profile_image = output.getvalue()
+                values["profile_image"] = output.getvalue()
         except Exception as e:
             # 이미지 처리 실패시 기본 이미지 유지
             pass
     
+    # 세션에 있는 사용자 객체도 RETURNING 결과로 갱신됨 (UPDATE 한 문장)
+    user = _update_returning(db, User, (User.id == user_id,), values)
+    if not user:
+        return None
     db.commit()
-    db.refresh(user)
+    mentor_directory.apply(user)
     return user
 
-def get_mentors(db: Session, skill: Optional[str] = None, order_by: Optional[str] = None) -> List[User]:
-    """멘토 리스트 조회"""
-    query = db.query(User).filter(User.role == "mentor")
-    
-    # 스킬 필터링
-    if skill:
-        query = query.filter(User.skills.contains(skill))
-    
-    # 정렬
-    if order_by == "name":
-        query = query.order_by(User.name)
-    elif order_by == "skill":
-        query = query.order_by(User.skills)
-    else:
-        query = query.order_by(User.id)
-    
-    return query.all()
-
 def create_match_request(db: Session, mentor_id: int, mentee_id: int, message: str) -> MatchRequest:
     """매칭 요청 생성"""
     # 이미 대기중인 요청이 있는지 확인
@@ -112,37 +141,98 @@ def create_match_request(db: Session, mentor_id: int, mentee_id: int, message: s
     )
     db.add(match_request)
     db.commit()
-    db.refresh(match_request)
     return match_request
 
-def get_incoming_requests(db: Session, mentor_id: int) -> List[MatchRequest]:
-    """멘토에게 온 요청 목록"""
-    return db.query(MatchRequest).filter(
-        MatchRequest.mentor_id == mentor_id
-    ).order_by(MatchRequest.created_at.desc()).all()
+def encode_request_cursor(row) -> str:
+    """요청 목록 다음 페이지 커서 (마지막 항목의 생성 시각과 ID)"""
+    return base64.urlsafe_b64encode(f"{row.created_at.isoformat()}|{row.id}".encode()).decode()
+
+def decode_request_cursor(cursor: str) -> tuple:
+    """커서 해석 -> (생성 시각, ID), 잘못된 커서는 ValueError"""
+    try:
+        created_at, _, request_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return datetime.fromisoformat(created_at), int(request_id)
+    except (UnicodeDecodeError, binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+
+def _request_queue(
+    db: Session, owner_column, owner_id: int, statuses: Optional[List[str]],
+    limit: Optional[int], cursor: Optional[tuple]
+) -> List[Row]:
+    """상태별 요청 목록 (최신순, 커서 이후 limit 개)"""
+    query = db.query(*MATCH_REQUEST_LIST_COLUMNS).filter(owner_column == owner_id)
+    if statuses:
+        query = query.filter(MatchRequest.status.in_(statuses))
+    if cursor:
+        created_at, request_id = cursor
+        query = query.filter(or_(
+            MatchRequest.created_at < created_at,
+            and_(MatchRequest.created_at == created_at, MatchRequest.id < request_id)
+        ))
+    query = query.order_by(MatchRequest.created_at.desc(), MatchRequest.id.desc())
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+def get_incoming_requests(
+    db: Session, mentor_id: int, statuses: Optional[List[str]] = None,
+    limit: Optional[int] = None, cursor: Optional[tuple] = None
+) -> List[Row]:
+    """멘토에게 온 요청 목록 (statuses 가 없으면 전체 상태)"""
+    return _request_queue(db, MatchRequest.mentor_id, mentor_id, statuses, limit, cursor)
+
+def get_outgoing_requests(
+    db: Session, mentee_id: int, statuses: Optional[List[str]] = None,
+    limit: Optional[int] = None, cursor: Optional[tuple] = None
+) -> List[Row]:
+    """멘티가 보낸 요청 목록 (statuses 가 없으면 전체 상태)"""
+    return _request_queue(db, MatchRequest.mentee_id, mentee_id, statuses, limit, cursor)
+
+def get_request_list_version(
+    db: Session, mentor_id: Optional[int] = None, mentee_id: Optional[int] = None
+) -> tuple:
+    """요청 목록의 버전 (개수, 최종 수정 시각, 최대 ID) 조회"""
+    query = db.query(
+        func.count(MatchRequest.id), func.max(MatchRequest.updated_at), func.max(MatchRequest.id)
+    )
+    if mentor_id is not None:
+        query = query.filter(MatchRequest.mentor_id == mentor_id)
+    if mentee_id is not None:
+        query = query.filter(MatchRequest.mentee_id == mentee_id)
+    return tuple(query.one())
+
+def _update_returning(db: Session, model, criteria, values: dict):
+    """조건에 맞는 행 하나를 갱신하고 갱신된 객체를 반환 (없으면 None)
 
-def get_outgoing_requests(db: Session, mentee_id: int) -> List[MatchRequest]:
-    """멘티가 보낸 요청 목록"""
-    return db.query(MatchRequest).filter(
-        MatchRequest.mentee_id == mentee_id
-    ).order_by(MatchRequest.created_at.desc()).all()
+    RETURNING 을 지원하면 (SQLite 3.35+, PostgreSQL) UPDATE 한 문장으로 끝내고,
+    아니면 조회 후 갱신한다. 세션에 이미 있는 객체는 RETURNING 으로 받은 값으로 덮어쓴다
+    (version + 1 같은 SQL 식을 메모리의 옛 값으로 계산하지 않도록).
+    """
+    if db.get_bind().dialect.update_returning:
+        statement = update(model).where(*criteria).values(**values).returning(model)
+        return db.execute(
+            statement, execution_options={"synchronize_session": "fetch", "populate_existing": True}
+        ).scalar_one_or_none()
+    obj = db.query(model).filter(*criteria).first()
+    if obj is not None:
+        for key, value in values.items():
+            setattr(obj, key, value)
+        db.flush()
+    return obj
 
 def update_request_status(
     db: Session, request_id: int, status: str, mentor_id: int
 ) -> Optional[MatchRequest]:
     """요청 상태 업데이트"""
-    match_request = db.query(MatchRequest).filter(
-        and_(
-            MatchRequest.id == request_id,
-            MatchRequest.mentor_id == mentor_id
-        )
-    ).first()
+    match_request = _update_returning(
+        db, MatchRequest,
+        (MatchRequest.id == request_id, MatchRequest.mentor_id == mentor_id),
+        {"status": status}
+    )
     
     if not match_request:
         return None
     
-    match_request.status = status
-    
     # 수락한 경우 다른 모든 요청 자동 거절
     if status == "accepted":
         db.query(MatchRequest).filter(
@@ -154,88 +244,278 @@ def update_request_status(
         ).update({"status": "rejected"})
     
     db.commit()
-    db.refresh(match_request)
+    if status == "accepted":
+        mentor_directory.touch()
     return match_request
 
 def delete_match_request(db: Session, request_id: int, mentee_id: int) -> Optional[MatchRequest]:
     """매칭 요청 삭제 (취소)"""
-    match_request = db.query(MatchRequest).filter(
-        and_(
+    match_request = _update_returning(
+        db, MatchRequest,
+        (
             MatchRequest.id == request_id,
             MatchRequest.mentee_id == mentee_id,
             MatchRequest.status == "pending"
-        )
-    ).first()
+        ),
+        {"status": "cancelled"}
+    )
     
     if not match_request:
         return None
     
-    match_request.status = "cancelled"
     db.commit()
-    db.refresh(match_request)
     return match_request
 
+# 리프레시 토큰 관련 CRUD 함수들
+
+def create_refresh_token(db: Session, user_id: int, family_id: Optional[str] = None) -> str:
+    """리프레시 토큰 발급 후 원문 반환 (family_id 가 없으면 새 로그인)"""
+    token = generate_refresh_token()
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(token),
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+    db.commit()
+    return token
+
+def _revoke_family(db: Session, family_id: str, now: datetime) -> None:
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None)
+    ).update({"revoked_at": now})
+
+def rotate_refresh_token(db: Session, token: str) -> Optional[Tuple[Row, str]]:
+    """리프레시 토큰을 새 토큰으로 교체 -> (사용자 행, 새 토큰), 유효하지 않으면 None
+
+    토큰 해시로 한 번 갱신(UPDATE ... RETURNING)하므로 동시에 같은 토큰을 써도 하나만 교체한다.
+    다음 토큰은 이전 토큰에서 파생되므로, 교체된 토큰이 REFRESH_TOKEN_REUSE_GRACE_SECONDS 안에
+    다시 오면 (여러 탭이 동시에 갱신) 이미 발급한 다음 토큰을 그대로 돌려준다. 그 뒤에 다시 오면
+    탈취된 것으로 보고 같은 family 를 모두 폐기한다.
+    """
+    token_hash = hash_refresh_token(token)
+    new_token = successor_refresh_token(token)
+    now = datetime.utcnow()
+    current = _update_returning(
+        db, RefreshToken,
+        (
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        ),
+        {"used_at": now}
+    )
+    
+    if current is None:
+        previous = db.query(RefreshToken.user_id, RefreshToken.family_id, RefreshToken.used_at).filter(
+            RefreshToken.token_hash == token_hash
+        ).first()
+        if not previous or previous.used_at is None:
+            return None
+        if now - previous.used_at <= timedelta(seconds=REFRESH_TOKEN_REUSE_GRACE_SECONDS):
+            # 다음 토큰이 아직 쓰이지 않았으면 같은 토큰을 다시 전달
+            successor = db.query(RefreshToken.id).filter(
+                RefreshToken.token_hash == hash_refresh_token(new_token),
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now
+            ).first()
+            if successor:
+                user = db.query(User.id, User.email, User.name, User.role).filter(
+                    User.id == previous.user_id
+                ).first()
+                return (user, new_token) if user else None
+        # 재사용 감지
+        _revoke_family(db, previous.family_id, now)
+        db.commit()
+        return None
+    
+    user = db.query(User.id, User.email, User.name, User.role).filter(User.id == current.user_id).first()
+    if not user:
+        db.rollback()
+        return None
+    
+    db.add(RefreshToken(
+        user_id=user.id,
+        token_hash=hash_refresh_token(new_token),
+        family_id=current.family_id,
+        expires_at=now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+    db.commit()
+    return user, new_token
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """로그아웃: 토큰과 같은 로그인에서 이어진 토큰을 모두 폐기"""
+    family_id = db.query(RefreshToken.family_id).filter(
+        RefreshToken.token_hash == hash_refresh_token(token)
+    ).scalar()
+    if family_id is None:
+        return False
+    _revoke_family(db, family_id, datetime.utcnow())
+    db.commit()
+    return True
+
 # 메시지 관련 CRUD 함수들
 
+def _conversation_pair(user1_id: int, user2_id: int) -> Tuple[int, int]:
+    """대화 키 (작은 ID, 큰 ID)"""
+    return (user1_id, user2_id) if user1_id < user2_id else (user2_id, user1_id)
+
+def _touch_conversation(db: Session, user1_id: int, user2_id: int, at: datetime) -> int:
+    """두 사용자의 대화 ID (없으면 생성), 마지막 메시지 시각을 at 으로 갱신
+
+    INSERT ... ON CONFLICT DO UPDATE ... RETURNING 을 지원하면 (SQLite 3.35+, PostgreSQL)
+    한 문장으로 끝내고, 아니면 조회 후 생성 또는 갱신한다.
+    """
+    from models import Conversation
+    low, high = _conversation_pair(user1_id, user2_id)
+    dialect = db.get_bind().dialect
+    if dialect.name in ("sqlite", "postgresql") and dialect.insert_returning:
+        if dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(Conversation).values(
+            min_user_id=low, max_user_id=high, created_at=at, last_message_at=at
+        ).on_conflict_do_update(
+            index_elements=["min_user_id", "max_user_id"], set_={"last_message_at": at}
+        ).returning(Conversation.id)
+        return db.execute(statement).scalar_one()
+    conversation = db.query(Conversation).filter(
+        Conversation.min_user_id == low, Conversation.max_user_id == high
+    ).first()
+    if conversation is None:
+        conversation = Conversation(min_user_id=low, max_user_id=high, created_at=at)
+        db.add(conversation)
+    conversation.last_message_at = at
+    db.flush()
+    return conversation.id
+
+def _conversation_id(user1_id: int, user2_id: int):
+    """두 사용자의 대화 ID 스칼라 서브쿼리 (고유 인덱스 조회 한 번)"""
+    from models import Conversation
+    low, high = _conversation_pair(user1_id, user2_id)
+    return select(Conversation.id).where(
+        Conversation.min_user_id == low, Conversation.max_user_id == high
+    ).scalar_subquery()
+
 def create_message(db: Session, sender_id: int, receiver_id: int, content: str):
-    """새 메시지 생성"""
+    """새 메시지 생성 (대화 upsert + 메시지 INSERT)"""
     from models import Message
+    now = datetime.utcnow()
     message = Message(
+        conversation_id=_touch_conversation(db, sender_id, receiver_id, now),
         sender_id=sender_id,
         receiver_id=receiver_id,
-        content=content
+        content=content,
+        created_at=now
     )
     db.add(message)
     db.commit()
-    db.refresh(message)
     return message
 
-def get_messages_between_users(db: Session, user1_id: int, user2_id: int, limit: int = 50):
-    """두 사용자 간의 메시지 조회"""
+def get_messages_between_users(
+    db: Session, user1_id: int, user2_id: int, limit: int = 50, before: Optional[int] = None
+):
+    """두 사용자 간의 메시지 조회 (최신순, before 보다 작은 ID)
+
+    대화 ID 를 고유 인덱스로 찾은 뒤 (conversation_id, id) 인덱스를 역순으로 limit 개만 읽는다.
+    messages 테이블에 남은 최근 구간으로 limit 을 채우지 못하고 대화가 보관된 적 있으면
+    (archived_through_id) 그 워터마크 아래부터 보관 파일에서 이어서 읽는다.
+    한 대화 안에서는 ID 순서가 작성 순서와 같다.
+    """
+    from models import Conversation, Message
+    query = db.query(
+        Message.id, Message.sender_id, Message.receiver_id,
+        Message.content, Message.is_read, Message.created_at
+    ).filter(Message.conversation_id == _conversation_id(user1_id, user2_id))
+    if before is not None:
+        query = query.filter(Message.id < before)
+    messages = query.order_by(Message.id.desc()).limit(limit).all()
+
+    if len(messages) < limit:
+        low, high = _conversation_pair(user1_id, user2_id)
+        conversation = db.query(Conversation.id, Conversation.archived_through_id).filter(
+            Conversation.min_user_id == low, Conversation.max_user_id == high
+        ).first()
+        if conversation is not None and conversation.archived_through_id is not None:
+            from archive import read_archived_messages
+            oldest = messages[-1].id if messages else before
+            watermark = conversation.archived_through_id + 1
+            before = watermark if oldest is None else min(oldest, watermark)
+            messages += read_archived_messages(db, conversation.id, limit - len(messages), before=before)
+    return messages
+
+def get_session_counts(
+    db: Session, user_id: int, role: str, unread: bool = True, requests: bool = True
+) -> dict:
+    """읽지 않은 메시지 수와 상태별 요청 수(없는 상태는 0)를 SELECT 한 번으로 조회
+
+    /api/bootstrap 과 /api/match-requests/counts 가 함께 쓴다. 멘토는 받은 요청, 멘티는 보낸
+    요청을 센다. 각 개수는 스칼라 서브쿼리라 인덱스만 읽는다.
+    """
     from models import Message
-    return db.query(Message).filter(
-        or_(
-            and_(Message.sender_id == user1_id, Message.receiver_id == user2_id),
-            and_(Message.sender_id == user2_id, Message.receiver_id == user1_id)
+    columns = []
+    if unread:
+        columns.append(
+            select(func.count(Message.id))
+            .where(Message.receiver_id == user_id, Message.is_read == 0)
+            .scalar_subquery().label("unread")
+        )
+    if requests:
+        owner = MatchRequest.mentor_id if role == "mentor" else MatchRequest.mentee_id
+        columns.extend(
+            select(func.count(MatchRequest.id))
+            .where(owner == user_id, MatchRequest.status == request_status)
+            .scalar_subquery().label(request_status)
+            for request_status in MATCH_REQUEST_STATUSES
         )
-    ).order_by(Message.created_at.desc()).limit(limit).all()
+    if not columns:
+        return {}
+    return dict(db.execute(select(*columns)).one()._mapping)
 
-def get_conversations(db: Session, user_id: int):
-    """사용자의 대화 목록 조회"""
-    from models import Message
-    from sqlalchemy import func, case
+def get_conversations(db: Session, user_id: int, limit: Optional[int] = None):
+    """사용자의 대화 목록 조회 (최근 대화 순, limit 이 있으면 그 수만큼)
+
+    conversations 테이블에서 바로 읽고, 대화마다 마지막 메시지는 기본 키로, 읽지 않은 메시지 수는
+    (receiver_id, is_read, conversation_id) 인덱스로 센다. messages 전체를 그룹화하지 않는다.
+    """
+    from models import Conversation, Message
+    from sqlalchemy import case
     
-    # 최근 메시지와 함께 대화 상대 목록 조회
-    subquery = db.query(
-        case(
-            (Message.sender_id == user_id, Message.receiver_id),
-            else_=Message.sender_id
-        ).label('other_user_id'),
-        func.max(Message.created_at).label('last_message_time')
-    ).filter(
-        or_(Message.sender_id == user_id, Message.receiver_id == user_id)
-    ).group_by('other_user_id').subquery()
+    other_user_id = case(
+        (Conversation.min_user_id == user_id, Conversation.max_user_id),
+        else_=Conversation.min_user_id
+    )
+    last_message_id = select(func.max(Message.id)).where(
+        Message.conversation_id == Conversation.id
+    ).correlate(Conversation).scalar_subquery()
+    unread_count = select(func.count(Message.id)).where(
+        Message.receiver_id == user_id,
+        Message.is_read == 0,
+        Message.conversation_id == Conversation.id
+    ).correlate(Conversation).scalar_subquery()
     
-    # 각 대화의 최신 메시지 조회
     conversations = db.query(
-        subquery.c.other_user_id,
-        subquery.c.last_message_time,
+        other_user_id.label('other_user_id'),
+        Conversation.last_message_at.label('last_message_time'),
         Message.content.label('last_message'),
-        func.count(
-            case((and_(Message.receiver_id == user_id, Message.is_read == 0), 1))
-        ).label('unread_count')
+        User.name.label('user_name'),
+        User.role.label('user_role'),
+        unread_count.label('unread_count')
+    ).select_from(Conversation).join(
+        User, User.id == other_user_id
     ).join(
-        Message,
-        and_(
-            Message.created_at == subquery.c.last_message_time,
-            or_(
-                and_(Message.sender_id == user_id, Message.receiver_id == subquery.c.other_user_id),
-                and_(Message.sender_id == subquery.c.other_user_id, Message.receiver_id == user_id)
-            )
-        )
-    ).group_by(subquery.c.other_user_id, subquery.c.last_message_time, Message.content).all()
+        Message, Message.id == last_message_id
+    ).filter(
+        or_(Conversation.min_user_id == user_id, Conversation.max_user_id == user_id)
+    ).order_by(Conversation.last_message_at.desc(), Conversation.id.desc())
+    
+    if limit is not None:
+        conversations = conversations.limit(limit)
     
-    return conversations
+    return conversations.all()
 
 def mark_messages_as_read(db: Session, sender_id: int, receiver_id: int):
     """메시지를 읽음 처리"""
@@ -1,19 +1,198 @@
-from sqlalchemy import create_engine
+import hashlib
+import logging
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import case, create_engine, event, exists, func, insert, inspect, select, text, update
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker
-from models import Base
+from models import Base, Conversation, Message
+from metrics import instrument_engine
 
-# SQLite 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./mentor_mentee.db"
+# SQLite 데이터베이스 설정 (DATABASE_URL 환경변수로 변경 가능)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./mentor_mentee.db")
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_engine(engine)
+
+# 여러 워커 프로세스가 같은 SQLite 파일을 쓸 때: WAL 로 읽기와 쓰기가 서로 막지 않게 하고,
+# 잠긴 경우 바로 실패하지 않고 SQLITE_BUSY_TIMEOUT_MS 동안 대기
+SQLITE_WAL = os.getenv("SQLITE_WAL", "1") == "1"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        # 새 DB 는 빈 페이지를 조금씩 반환할 수 있게 생성 (archive.compact, 기존 DB 에는 영향 없음)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        if SQLITE_WAL and engine.url.database not in (None, "", ":memory:"):
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.close()
+# 커밋 후 객체를 만료시키지 않음: 쓰기 함수가 방금 쓴 행을 다시 SELECT 하지 않도록
+# (기본값은 모두 파이썬 쪽에서 채우고, ID 는 INSERT 결과로 받음)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+logger = logging.getLogger("database")
+
+# 기존 데이터베이스에 추가해야 하는 컬럼 (테이블, 컬럼, DDL)
+COLUMN_MIGRATIONS = [
+    ("users", "version", "ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 1"),
+    ("messages", "conversation_id", "ALTER TABLE messages ADD COLUMN conversation_id INTEGER REFERENCES conversations(id)"),
+    ("conversations", "archived_through_id", "ALTER TABLE conversations ADD COLUMN archived_through_id INTEGER"),
+]
+
+# conversation_id 를 채울 때 한 트랜잭션에서 갱신할 메시지 수
+CONVERSATION_BACKFILL_BATCH_SIZE = int(os.getenv("CONVERSATION_BACKFILL_BATCH_SIZE", "5000"))
+
+@contextmanager
+def _init_lock(bind):
+    """프로세스 간 초기화 잠금 (같은 DB 를 여러 프로세스가 동시에 초기화하지 않도록)"""
+    url = bind.url
+    try:
+        import fcntl
+    except ImportError:  # Windows 에서는 잠금 없이 진행
+        fcntl = None
+    if fcntl is None or url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        yield
+        return
+
+    with open(f"{url.database}.init.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def schema_version() -> str:
+    """모델과 마이그레이션 정의에서 계산한 스키마 버전 (정의가 바뀌면 값도 바뀜)"""
+    digest = hashlib.sha1()
+    for table in Base.metadata.sorted_tables:
+        digest.update(table.name.encode())
+        for column in table.columns:
+            digest.update(f"{column.name}:{column.type!r}:{column.nullable}".encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(f"{index.name}:{[c.name for c in index.columns]}".encode())
+    for migration in COLUMN_MIGRATIONS:
+        digest.update(repr(migration).encode())
+    return digest.hexdigest()[:16]
+
+def stored_schema_version(bind):
+    """DB 에 기록된 스키마 버전 (기록이 없으면 None)"""
+    try:
+        with bind.connect() as connection:
+            return connection.execute(text("SELECT version FROM schema_version")).scalar()
+    except DBAPIError:
+        return None
+
+def init_db(bind=None):
+    """데이터베이스 테이블 생성
+
+    기록된 스키마 버전이 현재 모델과 같으면 테이블 조회(create_all)와 마이그레이션을 건너뛴다.
+    """
+    bind = bind or engine
+    version = schema_version()
+    if stored_schema_version(bind) == version:
+        return
+    with _init_lock(bind):
+        # 잠금을 기다리는 동안 다른 프로세스가 끝냈을 수 있음
+        if stored_schema_version(bind) == version:
+            return
+        Base.metadata.create_all(bind=bind)
+        migrate_db(bind)
+        with bind.begin() as connection:
+            connection.execute(text("CREATE TABLE IF NOT EXISTS schema_version (version VARCHAR(32) NOT NULL)"))
+            connection.execute(text("DELETE FROM schema_version"))
+            connection.execute(text("INSERT INTO schema_version (version) VALUES (:version)"), {"version": version})
+
+def migrate_db(bind):
+    """create_all 이 추가하지 않는 컬럼과 인덱스를 기존 테이블에 추가"""
+    added = set()
+    with bind.begin() as connection:
+        inspector = inspect(connection)
+        tables = set(inspector.get_table_names())
+        for table, column, ddl in COLUMN_MIGRATIONS:
+            if table not in tables:
+                continue
+            columns = {c["name"] for c in inspector.get_columns(table)}
+            if column not in columns:
+                connection.execute(text(ddl))
+                added.add((table, column))
+        for table in Base.metadata.sorted_tables:
+            if table.name not in tables:
+                continue
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+    if {"messages", "conversations"} <= tables:
+        backfill_conversations(bind)
+    if ("conversations", "archived_through_id") in added and "message_archives" in tables:
+        # 이미 만든 보관 파일에 conversation_id 를 채우고 대화별 보관 워터마크 기록
+        from archive import upgrade_archives
+        upgrade_archives(bind)
+
+def backfill_conversations(bind, batch_size: int = CONVERSATION_BACKFILL_BATCH_SIZE) -> int:
+    """conversation_id 가 없는 메시지에 대화를 만들어 연결 -> 연결한 메시지 수
+
+    대화 테이블이 생기기 전의 메시지(또는 그 뒤에 직접 INSERT 한 메시지)를 옮기는 마이그레이션이다.
+    없는 (작은 ID, 큰 ID) 쌍의 대화를 한 번에 만든 뒤, 메시지는 ID 순서로 batch_size 개씩
+    나눠 커밋하므로 큰 테이블에서도 쓰기 잠금을 오래 잡지 않는다. 다시 실행해도 안전하다.
+    """
+    low = case((Message.sender_id < Message.receiver_id, Message.sender_id), else_=Message.receiver_id)
+    high = case((Message.sender_id < Message.receiver_id, Message.receiver_id), else_=Message.sender_id)
+    pending = Message.conversation_id.is_(None)
+
+    with bind.begin() as connection:
+        missing = (
+            select(low, high, func.min(Message.created_at), func.max(Message.created_at))
+            .where(pending, ~exists().where(Conversation.min_user_id == low, Conversation.max_user_id == high))
+            .group_by(low, high)
+        )
+        connection.execute(
+            insert(Conversation).from_select(
+                ["min_user_id", "max_user_id", "created_at", "last_message_at"], missing
+            )
+        )
+
+    conversation_id = (
+        select(Conversation.id)
+        .where(Conversation.min_user_id == low, Conversation.max_user_id == high)
+        .scalar_subquery()
+    )
+    updated = 0
+    while True:
+        with bind.begin() as connection:
+            ids = connection.execute(
+                select(Message.id).where(pending).order_by(Message.id).limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            connection.execute(
+                update(Message)
+                .where(pending, Message.id.between(ids[0], ids[-1]))
+                .values(conversation_id=conversation_id)
+            )
+            # 이미 있던 대화에 더 최근 메시지가 붙었을 수 있음
+            touched = select(Message.conversation_id).where(Message.id.between(ids[0], ids[-1])).distinct()
+            connection.execute(
+                update(Conversation)
+                .where(Conversation.id.in_(touched))
+                .values(last_message_at=func.coalesce(
+                    select(func.max(Message.created_at))
+                    .where(Message.conversation_id == Conversation.id)
+                    .scalar_subquery(),
+                    Conversation.last_message_at,
+                ))
+            )
+            updated += len(ids)
 
-def init_db():
-    """데이터베이스 테이블 생성"""
-    Base.metadata.create_all(bind=engine)
+    if updated:
+        logger.info("Linked %d messages to conversations", updated)
+    return updated
 
 def get_db():
     """데이터베이스 세션 의존성"""
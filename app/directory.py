@@ -0,0 +1,247 @@
+"""
+메모리 내 멘토 디렉터리
+
+멘토 목록(GET /api/mentors)은 가장 많이 호출되는 읽기지만 데이터는 작고 드물게 바뀐다.
+멘토를 처음 조회할 때 한 번 읽어 __slots__ 레코드로 보관하고, 이후 필터/정렬/페이지는
+DB 없이 메모리에서 처리한다.
+
+- 스킬 문자열은 sys.intern 으로 한 번만 저장하고, 스킬 → 멘토 ID 역색인으로 필터링한다.
+- crud 의 create_user, update_user_profile, update_request_status 가 커밋 후 레코드를
+  갱신(apply/touch)하고 응답 캐시 세대를 올린다.
+- 다른 워커의 변경은 (id, version) 만 읽는 증분 새로고침으로 반영한다. 공유 캐시
+  백엔드의 세대가 다른 프로세스에 의해 바뀌었거나, MENTOR_DIRECTORY_REFRESH_SECONDS
+  가 지나면 새로고침한다.
+"""
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from cache import mentor_cache
+from models import User
+
+# 주기적 증분 새로고침 간격 (0 이면 캐시 세대가 바뀔 때만, serve.py 가 여러 워커일 때 설정)
+MENTOR_DIRECTORY_REFRESH_SECONDS = float(os.getenv("MENTOR_DIRECTORY_REFRESH_SECONDS", "0"))
+# 변경된 멘토를 다시 읽을 때 IN 절 하나에 넣는 ID 수
+MENTOR_DIRECTORY_FETCH_BATCH = 500
+
+_LOAD_COLUMNS = (User.id, User.email, User.name, User.bio, User.skills, User.created_at, User.version)
+
+
+class MentorRecord:
+    """멘토 한 명 (user_to_dict 가 읽는 속성을 제공)"""
+
+    __slots__ = ("id", "email", "name", "bio", "skill_names", "created_at", "version")
+    role = "mentor"
+
+    def __init__(self, id, email, name, bio, skill_names, created_at, version):
+        self.id = id
+        self.email = email
+        self.name = name
+        self.bio = bio
+        self.skill_names = skill_names  # intern 된 스킬 문자열 튜플
+        self.created_at = created_at
+        self.version = version
+
+    @property
+    def skills(self) -> Optional[str]:
+        return ",".join(self.skill_names) if self.skill_names else None
+
+
+def _sort_key(name: str):
+    """정렬 키 함수 (같은 값은 ID 순)"""
+    if name == "name":
+        return lambda r: (r.name.lower(), r.id)
+    if name == "skill":
+        return lambda r: ((r.skills or "").lower(), r.id)
+    if name == "created":
+        # SQLite 처럼 NULL 을 가장 앞에 둠
+        return lambda r: (r.created_at is not None, r.created_at or 0, r.id)
+    return None
+
+
+class MentorDirectory:
+    """멘토 레코드, 스킬 역색인, 정렬 순서 캐시"""
+
+    def __init__(self, cache=mentor_cache, refresh_seconds: float = MENTOR_DIRECTORY_REFRESH_SECONDS):
+        self.cache = cache
+        self.refresh_seconds = refresh_seconds
+        self._records: Dict[int, MentorRecord] = {}
+        self._skill_index: Dict[str, Set[int]] = {}
+        self._orders: Dict[str, List[MentorRecord]] = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._synced_generation = None
+        self._refreshed_at = 0.0
+        self.refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # 레코드 관리
+
+    def _record(self, row) -> MentorRecord:
+        skill_names = tuple(sys.intern(s) for s in row.skills.split(",")) if row.skills else ()
+        return MentorRecord(row.id, row.email, row.name, row.bio, skill_names, row.created_at, row.version)
+
+    def _put(self, record: MentorRecord) -> None:
+        self._drop(record.id)
+        self._records[record.id] = record
+        for skill in record.skill_names:
+            self._skill_index.setdefault(skill, set()).add(record.id)
+
+    def _drop(self, mentor_id: int) -> None:
+        old = self._records.pop(mentor_id, None)
+        if old is None:
+            return
+        for skill in old.skill_names:
+            ids = self._skill_index.get(skill)
+            if ids is not None:
+                ids.discard(mentor_id)
+                if not ids:
+                    del self._skill_index[skill]
+
+    def load_rows(self, rows: Iterable) -> None:
+        """(id, email, name, bio, skills, created_at, version) 행으로 전체 교체"""
+        with self._lock:
+            self._records.clear()
+            self._skill_index.clear()
+            self._orders.clear()
+            for row in rows:
+                self._put(self._record(row))
+            self._loaded = True
+            self._synced_generation = self.cache.generation
+            self._refreshed_at = time.monotonic()
+
+    def load(self, db) -> None:
+        # 적재 중 다른 프로세스가 바꾼 내용은 다음 조회 때 새로고침으로 반영
+        generation = self.cache.generation
+        rows = db.query(*_LOAD_COLUMNS).filter(User.role == "mentor").yield_per(5000)
+        self.load_rows(rows)
+        self._synced_generation = generation
+
+    def refresh(self, db) -> bool:
+        """버전이 바뀐 멘토만 다시 읽음 (변경이 있었으면 True)"""
+        generation = self.cache.generation
+        versions = dict(db.query(User.id, User.version).filter(User.role == "mentor").all())
+        with self._lock:
+            removed = [mentor_id for mentor_id in self._records if mentor_id not in versions]
+            changed = [
+                mentor_id for mentor_id, version in versions.items()
+                if mentor_id not in self._records or self._records[mentor_id].version != version
+            ]
+        for start in range(0, len(changed), MENTOR_DIRECTORY_FETCH_BATCH):
+            batch = changed[start:start + MENTOR_DIRECTORY_FETCH_BATCH]
+            rows = db.query(*_LOAD_COLUMNS).filter(User.id.in_(batch)).all()
+            with self._lock:
+                for row in rows:
+                    self._put(self._record(row))
+        with self._lock:
+            for mentor_id in removed:
+                self._drop(mentor_id)
+            if changed or removed:
+                self._orders.clear()
+        self.refreshes += 1
+        self._refreshed_at = time.monotonic()
+        self._synced_generation = generation
+        if changed or removed:
+            # 이 워커의 응답 캐시에 남은 이전 결과도 무효화
+            self._invalidate()
+        return bool(changed or removed)
+
+    def _invalidate(self) -> None:
+        """응답 캐시 세대를 올림. 다른 프로세스가 그 사이 올리지 않았을 때만 동기화된 것으로 봄"""
+        before = self._synced_generation
+        generation = self.cache.invalidate()
+        if before is not None and generation == before + 1:
+            self._synced_generation = generation
+
+    def ensure_current(self, db) -> None:
+        """처음이면 적재, 다른 프로세스의 변경 가능성이 있으면 증분 새로고침"""
+        if not self._loaded:
+            self.load(db)
+        elif self.cache.generation != self._synced_generation or (
+            self.refresh_seconds and time.monotonic() - self._refreshed_at >= self.refresh_seconds
+        ):
+            self.refresh(db)
+
+    # crud 훅 (커밋 후 호출)
+
+    def apply(self, user) -> None:
+        """생성/수정된 사용자를 반영"""
+        if user.role != "mentor":
+            return
+        if self._loaded:
+            with self._lock:
+                self._put(self._record(user))
+                self._orders.clear()
+        self._invalidate()
+
+    def touch(self) -> None:
+        """레코드는 그대로 두고 목록 캐시만 무효화 (예: 요청 수락)"""
+        self._invalidate()
+
+    # 조회
+
+    def _ordered(self, order_by: Optional[str]) -> List[MentorRecord]:
+        name = (order_by or "id").lstrip("-")
+        key = _sort_key(name) if name != "id" else None
+        cache_key = name if key is not None else "id"
+        order = self._orders.get(cache_key)
+        if order is None:
+            if key is None:
+                order = [self._records[i] for i in sorted(self._records)]
+            else:
+                order = sorted(self._records.values(), key=key)
+            self._orders[cache_key] = order
+        return order
+
+    def _matching_ids(self, skill: str) -> Set[int]:
+        """대소문자 구분 없는 부분 일치"""
+        needle = skill.lower()
+        if "," in needle:
+            # 스킬 경계를 넘는 검색어는 전체 문자열로 비교
+            return {r.id for r in self._records.values() if r.skills and needle in r.skills.lower()}
+        ids: Set[int] = set()
+        for name, mentor_ids in self._skill_index.items():
+            if needle in name.lower():
+                ids |= mentor_ids
+        return ids
+
+    def query(
+        self, db, skill: Optional[str] = None, order_by: Optional[str] = None,
+        page: Optional[int] = None, page_size: int = 50
+    ) -> Tuple[List[MentorRecord], int]:
+        """조건에 맞는 멘토 (페이지)와 전체 수"""
+        self.ensure_current(db)
+        with self._lock:
+            order = self._ordered(order_by)
+            skill = skill.strip() if skill else None
+            if skill:
+                ids = self._matching_ids(skill)
+                if len(ids) * 8 < len(order):
+                    # 결과가 적으면 일치한 레코드만 정렬
+                    key = _sort_key((order_by or "id").lstrip("-")) or (lambda r: r.id)
+                    order = sorted((self._records[i] for i in ids), key=key)
+                else:
+                    order = [r for r in order if r.id in ids]
+            if order_by and order_by.startswith("-"):
+                order = order[::-1]
+            total = len(order)
+            if page:
+                order = order[(page - 1) * page_size:page * page_size]
+            return list(order), total
+
+    def metrics_lines(self) -> list:
+        return [
+            "# HELP mentor_directory_records Mentors held in the in-memory directory",
+            "# TYPE mentor_directory_records gauge",
+            f"mentor_directory_records {len(self._records)}",
+            "# HELP mentor_directory_refreshes_total Incremental directory refreshes",
+            "# TYPE mentor_directory_refreshes_total counter",
+            f"mentor_directory_refreshes_total {self.refreshes}",
+        ]
+
+
+mentor_directory = MentorDirectory()
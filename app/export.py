@@ -0,0 +1,175 @@
+"""
+데이터 내보내기 (NDJSON/CSV 스트리밍)
+
+사용자 한 명(또는 관리자용 전체)의 프로필, 매칭 요청, 메시지를 서버 측 커서(yield_per)로
+조금씩 읽어 한 줄씩 내보낸다. 행을 모두 메모리에 올리지 않으므로 기록 크기와 관계없이
+메모리 사용량이 일정하다. 보관 파일(archive.py)로 옮긴 메시지도 포함한다.
+
+레코드마다 "type" 필드(user, match_request, message)가 있으며, CSV 는 모든 종류의 필드를
+합친 EXPORT_COLUMNS 열을 사용하고 해당하지 않는 칸은 비워 둔다.
+"""
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import or_, select
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 사용
+    orjson = None
+
+from database import SessionLocal
+from models import Conversation, MatchRequest, Message, MessageArchive, User
+
+# 내보내기 설정
+EXPORT_YIELD_PER = int(os.getenv("EXPORT_YIELD_PER", "1000"))  # DB 에서 한 번에 가져오는 행 수
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "65536"))  # 응답 청크 크기(바이트)
+# 전체 사용자 내보내기(GET /internal/export)에 필요한 X-Admin-Key 값 (없으면 비활성화)
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY")
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+EXPORT_COLUMNS = [
+    "type", "id", "email", "name", "role", "bio", "skills",
+    "mentor_id", "mentee_id", "message", "status",
+    "sender_id", "receiver_id", "content", "is_read",
+    "created_at", "updated_at",
+]
+
+_USER_COLUMNS = (User.id, User.email, User.name, User.role, User.bio, User.skills, User.created_at)
+_MATCH_REQUEST_COLUMNS = (
+    MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.message,
+    MatchRequest.status, MatchRequest.created_at, MatchRequest.updated_at,
+)
+_MESSAGE_COLUMNS = (
+    Message.id, Message.sender_id, Message.receiver_id, Message.content, Message.is_read, Message.created_at
+)
+
+
+def _stream(db, query):
+    """서버 측 커서로 EXPORT_YIELD_PER 행씩 읽기"""
+    return db.execute(query.execution_options(yield_per=EXPORT_YIELD_PER))
+
+
+def _record(record_type: str, row) -> dict:
+    record = {"type": record_type}
+    record.update(row._mapping)
+    return record
+
+
+def _archived_message_records(db, user_id: Optional[int]) -> Iterator[dict]:
+    from archive import archive_engine, archive_dir, archived_message_columns, archived_messages
+
+    archives = db.execute(select(MessageArchive.filename).order_by(MessageArchive.month)).scalars().all()
+    if not archives:
+        return
+    directory = archive_dir(db.get_bind())
+    query = select(*archived_message_columns).order_by(archived_messages.c.id)
+    if user_id is not None:
+        # 보관 파일은 (conversation_id, id) 로만 색인하므로 사용자의 보관된 대화 ID 로 거름
+        conversation_ids = db.execute(select(Conversation.id).where(
+            or_(Conversation.min_user_id == user_id, Conversation.max_user_id == user_id),
+            Conversation.archived_through_id.is_not(None),
+        )).scalars().all()
+        if not conversation_ids:
+            return
+        query = query.where(archived_messages.c.conversation_id.in_(conversation_ids))
+    for filename in archives:
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            continue
+        with archive_engine(path).connect() as connection:
+            for row in _stream(connection, query):
+                yield _record("message", row)
+
+
+def export_records(db, user_id: Optional[int] = None) -> Iterator[dict]:
+    """내보낼 레코드 (user_id 가 None 이면 전체 사용자)"""
+    users = select(*_USER_COLUMNS).order_by(User.id)
+    match_requests = select(*_MATCH_REQUEST_COLUMNS).order_by(MatchRequest.id)
+    messages = select(*_MESSAGE_COLUMNS).order_by(Message.id)
+    if user_id is not None:
+        users = users.where(User.id == user_id)
+        match_requests = match_requests.where(
+            or_(MatchRequest.mentor_id == user_id, MatchRequest.mentee_id == user_id)
+        )
+        messages = messages.where(or_(Message.sender_id == user_id, Message.receiver_id == user_id))
+
+    for row in _stream(db, users):
+        yield _record("user", row)
+    for row in _stream(db, match_requests):
+        yield _record("match_request", row)
+    # 보관된 메시지가 더 오래되었으므로 먼저 내보냄
+    yield from _archived_message_records(db, user_id)
+    for row in _stream(db, messages):
+        yield _record("message", row)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def ndjson_lines(records: Iterator[dict]) -> Iterator[bytes]:
+    for record in records:
+        if orjson is not None:
+            # 보관 테이블의 컬럼 이름은 str 하위 클래스(quoted_name)이므로 OPT_NON_STR_KEYS 필요
+            yield orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        else:
+            yield json.dumps(record, ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n"
+
+
+def csv_lines(records: Iterator[dict]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for record in records:
+        writer.writerow({
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in record.items()
+        })
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _chunked(lines: Iterator[bytes], chunk_size: int) -> Iterator[bytes]:
+    """작은 줄들을 chunk_size 바이트 정도로 묶어 전송 횟수를 줄임"""
+    parts, size = [], 0
+    for line in lines:
+        parts.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b"".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield b"".join(parts)
+
+
+def stream_export(user_id: Optional[int], export_format: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """StreamingResponse 본문 생성기 (chunk_size 기본값은 EXPORT_CHUNK_SIZE)
+
+    응답을 보내는 동안 세션을 유지해야 하므로 요청 의존성(get_db) 대신 자체 세션을 연다.
+    """
+    encode = ndjson_lines if export_format == "ndjson" else csv_lines
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    db = SessionLocal()
+    try:
+        yield from _chunked(encode(export_records(db, user_id)), chunk_size)
+    finally:
+        db.close()
+
+
+def export_filename(user_id: Optional[int], export_format: str) -> str:
+    subject = f"user-{user_id}" if user_id is not None else "all-users"
+    return f"export-{subject}-{datetime.utcnow():%Y%m%d%H%M%S}.{export_format}"
@@ -0,0 +1,341 @@
+"""
+POST 요청 멱등성 키 (Idempotency-Key)
+
+응답 시간 초과로 클라이언트가 POST /api/messages, POST /api/match-requests 를 다시 보내면
+메시지가 중복되거나 "Already have a pending request" 오류가 난다. 요청에 Idempotency-Key
+헤더가 있으면 (사용자, 키) 별로 첫 응답을 저장해 두고, 같은 키로 다시 오면 쓰기 경로를 타지
+않고 저장된 응답을 그대로 돌려준다 (Idempotent-Replayed: true 헤더).
+
+- 저장소는 idempotency_keys 테이블이고, 완료된 응답은 프로세스 내 LRU 캐시에도 보관한다.
+- 같은 키의 요청이 동시에 오면 INSERT 의 유일 제약으로 한 요청만 처리하고, 나머지는
+  IDEMPOTENCY_WAIT_SECONDS 까지 완료를 기다렸다가 같은 응답을 받는다 (시간 초과시 409).
+- 같은 키를 다른 본문으로 다시 쓰면 422.
+- 5xx, 401, 408, 409, 429 응답은 저장하지 않으므로 재시도가 다시 처리된다.
+- 항목은 IDEMPOTENCY_TTL_SECONDS 뒤 만료되며, 만료된 행은 조금씩 나누어 삭제한다.
+- 저장소 쓰기(선점, 완료, 해제, 만료 삭제)는 SQLite 잠금을 기다릴 수 있으므로 이벤트 루프가
+  아닌 스레드 풀에서 실행한다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional, Tuple
+
+import anyio
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from database import SessionLocal
+from metrics import counter_lines
+from models import IdempotencyKey
+
+# 멱등성 키 설정
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "5"))
+# 처리 중 상태가 이보다 오래되면 처리하던 워커가 중단된 것으로 보고 다른 요청이 이어받음
+IDEMPOTENCY_LOCK_SECONDS = 60
+IDEMPOTENCY_MAX_KEY_LENGTH = 255
+IDEMPOTENT_PATHS = ("/api/messages", "/api/match-requests")
+
+# 새 키를 이만큼 받을 때마다 만료된 행을 최대 _PURGE_BATCH 개 삭제
+_PURGE_EVERY = 500
+_PURGE_BATCH = 1000
+_POLL_SECONDS = 0.05
+_UNSTORED_STATUSES = (401, 408, 409, 429)
+
+CLAIMED, DONE, PENDING, MISMATCH = "claimed", "done", "pending", "mismatch"
+
+# 처리 결과별 요청 수 (processed, replayed, conflict, mismatch)
+results = Counter()
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    content_type: Optional[str]
+    body: bytes
+    expires_at: datetime
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    return hashlib.sha256(method.encode() + b" " + path.encode() + b"\n" + body).hexdigest()
+
+
+class IdempotencyStore:
+    """idempotency_keys 테이블과 완료된 응답의 LRU 앞단 캐시"""
+
+    def __init__(
+        self, session_factory=SessionLocal, cache_size: int = IDEMPOTENCY_CACHE_SIZE,
+        ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS
+    ):
+        self.session_factory = session_factory
+        self.cache_size = cache_size
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._cache: "OrderedDict[Tuple[int, str], StoredResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._claims = 0
+
+    def cached(self, user_id: int, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            stored = self._cache.get((user_id, key))
+            if stored is None:
+                return None
+            if stored.expires_at <= datetime.utcnow():
+                del self._cache[(user_id, key)]
+                return None
+            self._cache.move_to_end((user_id, key))
+            return stored
+
+    def _remember(self, user_id: int, key: str, stored: StoredResponse) -> None:
+        with self._lock:
+            self._cache[(user_id, key)] = stored
+            self._cache.move_to_end((user_id, key))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def claim(self, user_id: int, key: str, fingerprint: str) -> Tuple[str, Optional[StoredResponse]]:
+        """키 선점 시도 -> (CLAIMED|DONE|PENDING|MISMATCH, 저장된 응답)"""
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            for _ in range(2):
+                db.add(IdempotencyKey(
+                    user_id=user_id, key=key, fingerprint=fingerprint, created_at=now, expires_at=now + self.ttl
+                ))
+                try:
+                    db.commit()
+                except IntegrityError:
+                    db.rollback()
+                else:
+                    self._after_claim()
+                    return CLAIMED, None
+
+                row = db.execute(
+                    select(IdempotencyKey).where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+                ).scalar_one_or_none()
+                if row is None:
+                    continue
+                if row.expires_at <= now:
+                    # 만료된 키는 지우고 새로 선점
+                    db.execute(delete(IdempotencyKey).where(
+                        IdempotencyKey.id == row.id, IdempotencyKey.expires_at <= now
+                    ))
+                    db.commit()
+                    continue
+                if row.fingerprint != fingerprint:
+                    return MISMATCH, None
+                if row.status_code is not None:
+                    stored = StoredResponse(
+                        row.fingerprint, row.status_code, row.content_type, row.response_body or b"", row.expires_at
+                    )
+                    self._remember(user_id, key, stored)
+                    return DONE, stored
+                if row.created_at <= now - timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS):
+                    # 중단된 처리 이어받기 (조건부 UPDATE 라 한 요청만 성공)
+                    taken = db.execute(
+                        update(IdempotencyKey)
+                        .where(IdempotencyKey.id == row.id, IdempotencyKey.created_at == row.created_at,
+                               IdempotencyKey.status_code.is_(None))
+                        .values(created_at=now)
+                    ).rowcount
+                    db.commit()
+                    if taken:
+                        return CLAIMED, None
+                return PENDING, None
+        return PENDING, None
+
+    def complete(
+        self, user_id: int, key: str, fingerprint: str, status_code: int, content_type: Optional[str], body: bytes
+    ) -> None:
+        with self.session_factory() as db:
+            db.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+                .values(status_code=status_code, content_type=content_type, response_body=body)
+            )
+            db.commit()
+        expires_at = datetime.utcnow() + self.ttl
+        self._remember(user_id, key, StoredResponse(fingerprint, status_code, content_type, body, expires_at))
+
+    def release(self, user_id: int, key: str) -> None:
+        """응답을 저장하지 않고 키를 놓음 (같은 키로 다시 처리 가능)"""
+        with self.session_factory() as db:
+            db.execute(delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id, IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None)
+            ))
+            db.commit()
+
+    def _after_claim(self) -> None:
+        self._claims += 1
+        if self._claims % _PURGE_EVERY == 0:
+            self.purge_expired()
+
+    def purge_expired(self, limit: int = _PURGE_BATCH) -> int:
+        """만료된 행을 최대 limit 개 삭제 (쓰기 잠금을 오래 잡지 않도록 나누어 실행)"""
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            expired = select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(limit)
+            deleted = db.execute(delete(IdempotencyKey).where(IdempotencyKey.id.in_(expired))).rowcount
+            db.commit()
+        return deleted
+
+
+def _json_response(status_code: int, detail: str, headers: Optional[list] = None):
+    body = json.dumps({"detail": detail}).encode()
+    return status_code, body, [
+        (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())
+    ] + (headers or [])
+
+
+class IdempotencyMiddleware:
+    """IDEMPOTENT_PATHS 의 POST 요청에 Idempotency-Key 적용 (CORS 안쪽에 둠)"""
+
+    def __init__(self, app, store: Optional[IdempotencyStore] = None, paths=IDEMPOTENT_PATHS):
+        self.app = app
+        self.store = store or IdempotencyStore()
+        self.paths = set(paths)
+        self._inflight = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        key = headers.get(b"idempotency-key", b"").decode("latin-1").strip()
+        # 토큰이 없거나 잘못되었으면 엔드포인트가 401 을 반환하도록 그대로 전달
+        user_id = _token_subject(headers.get(b"authorization", b"").decode("latin-1")) if key else None
+        if not key or user_id is None:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > IDEMPOTENCY_MAX_KEY_LENGTH:
+            await _send(send, *_json_response(400, "Idempotency-Key is too long"))
+            return
+
+        body = await _read_body(receive)
+        fingerprint = request_fingerprint(scope["method"], scope["path"], body)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            stored = self.store.cached(user_id, key)
+            if stored is not None:
+                await self._replay(send, stored, fingerprint)
+                return
+            state, stored = await run_in_threadpool(self.store.claim, user_id, key, fingerprint)
+            if state == CLAIMED:
+                break
+            if state == DONE:
+                await self._replay(send, stored, fingerprint)
+                return
+            if state == MISMATCH:
+                results["mismatch"] += 1
+                await _send(send, *_json_response(422, "Idempotency-Key was used with a different request"))
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                results["conflict"] += 1
+                await _send(send, *_json_response(
+                    409, "A request with this Idempotency-Key is in progress", [(b"retry-after", b"1")]
+                ))
+                return
+            # 같은 프로세스에서 처리 중이면 완료 알림을, 아니면 주기적으로 DB 를 확인
+            event = self._inflight.get((user_id, key))
+            try:
+                if event is not None:
+                    await asyncio.wait_for(event.wait(), remaining)
+                else:
+                    await asyncio.sleep(min(_POLL_SECONDS, remaining))
+            except asyncio.TimeoutError:
+                pass
+
+        results["processed"] += 1
+        await self._process(scope, body, send, user_id, key, fingerprint)
+
+    async def _process(self, scope, body: bytes, send, user_id: int, key: str, fingerprint: str):
+        event = self._inflight[(user_id, key)] = asyncio.Event()
+        response = {"status": 500, "content_type": None, "body": []}
+
+        async def receive_body():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type":
+                        response["content_type"] = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, send_wrapper)
+        except BaseException:
+            # 연결이 끊겨 취소된 경우에도 키는 놓아야 하므로 취소를 막고 실행
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(self.store.release, user_id, key)
+            raise
+        else:
+            status_code = response["status"]
+            if status_code < 500 and status_code not in _UNSTORED_STATUSES:
+                await run_in_threadpool(
+                    self.store.complete,
+                    user_id, key, fingerprint, status_code, response["content_type"], b"".join(response["body"])
+                )
+            else:
+                await run_in_threadpool(self.store.release, user_id, key)
+        finally:
+            del self._inflight[(user_id, key)]
+            event.set()
+
+    async def _replay(self, send, stored: StoredResponse, fingerprint: str):
+        if stored.fingerprint != fingerprint:
+            results["mismatch"] += 1
+            await _send(send, *_json_response(422, "Idempotency-Key was used with a different request"))
+            return
+        results["replayed"] += 1
+        headers = [(b"content-length", str(len(stored.body)).encode()), (b"idempotent-replayed", b"true")]
+        if stored.content_type:
+            headers.append((b"content-type", stored.content_type.encode("latin-1")))
+        await _send(send, stored.status_code, stored.body, headers)
+
+
+def metrics_lines() -> list:
+    samples = [({"result": result}, results[result]) for result in ("processed", "replayed", "conflict", "mismatch")]
+    return counter_lines("idempotency_requests_total", "Requests carrying an Idempotency-Key by outcome", samples)
+
+
+def _token_subject(authorization: str) -> Optional[int]:
+    # DB 조회 없이 JWT 서명만 검증해 사용자 식별
+    from auth import verify_token
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token)
+    try:
+        return int(payload["sub"]) if payload else None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+async def _send(send, status_code: int, body: bytes, headers: list):
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
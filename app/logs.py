@@ -0,0 +1,235 @@
+"""
+구조화 로그 (JSON) 와 비차단 로그 파이프라인
+
+- setup_logging: 루트 로거(와 uvicorn 로거)에는 큐에 넣기만 하는 QueueHandler 를 두고, 실제
+  파일/터미널 쓰기는 백그라운드 스레드의 QueueListener 가 한다. 디스크가 느려도 이벤트 루프는
+  기다리지 않는다. 원래 달려 있던 핸들러는 stop() 에서 되돌린다.
+- JsonFormatter: 한 줄에 JSON 객체 하나 (시각, 레벨, 로거, 메시지, 요청 정보, 예외)
+- AccessLogMiddleware: 요청마다 request_id, 경로(route 템플릿), 상태, 지연시간, SQL 문 수를
+  담은 access 로그를 남긴다. 성공 응답은 ACCESS_LOG_SAMPLE_RATE 비율만 남기고, 4xx/5xx 와
+  ACCESS_LOG_SLOW_MS 보다 느린 요청은 항상 남긴다. 요청 처리 중 남긴 다른 로그에도 같은
+  request_id 가 붙고, 응답에는 X-Request-ID 헤더로 돌려준다.
+"""
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 사용
+    orjson = None
+
+from metrics import current_stats
+
+# 로그 설정
+LOG_QUEUE = os.getenv("LOG_QUEUE", "1") == "1"  # 0 이면 로깅 설정을 건드리지 않음
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")  # json 또는 text
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FILE = os.getenv("LOG_FILE")  # 없으면 stderr
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+ACCESS_LOG_SLOW_MS = float(os.getenv("ACCESS_LOG_SLOW_MS", "1000"))
+
+REQUEST_ID_HEADER = b"x-request-id"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# LogRecord 기본 속성 (나머지는 extra 로 넘긴 필드로 보고 JSON 에 포함)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+access_logger = logging.getLogger("access")
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """처리 중인 요청의 request_id 를 레코드에 추가 (로그를 남기는 쪽 컨텍스트에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """LogRecord -> 한 줄 JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and value is not None:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode()
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """메시지와 예외만 문자열로 만들어 큐에 넣음 (extra 필드는 그대로 유지)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LogPipeline:
+    """QueueHandler -> QueueListener(백그라운드 스레드) -> 실제 핸들러"""
+
+    def __init__(self, handlers, level: str = LOG_LEVEL):
+        self.queue = queue.SimpleQueue()
+        self.handler = _QueueHandler(self.queue)
+        self.handler.addFilter(RequestContextFilter())
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.level = level
+        self._saved = {}
+
+    def start(self) -> "LogPipeline":
+        root = logging.getLogger()
+        for name in ("",) + _UVICORN_LOGGERS:
+            logger = logging.getLogger(name)
+            self._saved[name] = (logger.handlers[:], logger.propagate, logger.level, logger.disabled)
+            logger.handlers = [self.handler]
+            if name:
+                logger.propagate = False
+        # uvicorn 의 access 로그는 AccessLogMiddleware 가 대신함
+        logging.getLogger("uvicorn.access").disabled = True
+        root.setLevel(self.level)
+        self.listener.start()
+        return self
+
+    def stop(self) -> None:
+        # 큐에 남은 레코드를 모두 쓴 뒤 원래 핸들러로 복구
+        self.listener.stop()
+        for name, (handlers, propagate, level, disabled) in self._saved.items():
+            logger = logging.getLogger(name)
+            logger.handlers = handlers
+            logger.propagate = propagate
+            logger.setLevel(level)
+            logger.disabled = disabled
+        self._saved.clear()
+
+
+def default_handler() -> logging.Handler:
+    handler = logging.handlers.WatchedFileHandler(LOG_FILE) if LOG_FILE else logging.StreamHandler(sys.stderr)
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"))
+    return handler
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def setup_logging(handlers=None) -> Optional[LogPipeline]:
+    """비차단 로그 파이프라인 시작 (이미 시작했으면 그대로)"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline(handlers or [default_handler()]).start()
+        return _pipeline
+
+
+def shutdown_logging() -> None:
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+            _pipeline = None
+
+
+def _request_id_from(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == REQUEST_ID_HEADER:
+            candidate = value.decode("latin-1")
+            if _VALID_REQUEST_ID.match(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+class AccessLogMiddleware:
+    """요청별 access 로그 (MetricsMiddleware 안쪽에 두어 SQL 통계를 함께 기록)"""
+
+    def __init__(
+        self, app, sample_rate: float = ACCESS_LOG_SAMPLE_RATE, slow_ms: float = ACCESS_LOG_SLOW_MS,
+        logger: logging.Logger = access_logger
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.logger = logger
+
+    def should_log(self, status_code: int, duration_ms: float) -> bool:
+        if status_code >= 400 or duration_ms >= self.slow_ms:
+            return True
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _request_id_from(scope)
+        token = _request_id.set(request_id)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER, request_id.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            if self.logger.isEnabledFor(logging.INFO) and self.should_log(status_code, duration_ms):
+                route = scope.get("route")
+                stats = current_stats()
+                self.logger.info(
+                    "%s %s %d", scope["method"], scope["path"], status_code,
+                    extra={
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "route": getattr(route, "path", None) or "unmatched",
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round(duration_ms, 2),
+                        "db_statements": stats.statements if stats else None,
+                        "db_ms": round(stats.sql_seconds * 1000, 2) if stats else None,
+                    },
+                )
+            _request_id.reset(token)
@@ -1,29 +1,76 @@
-from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File
+from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Header, Query, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import RedirectResponse, StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from contextlib import asynccontextmanager
+import base64
+import hmac
 import io
+import os
+import time
 
-from database import get_db, init_db
+from database import engine, get_db, init_db
 from models import User, MatchRequest
 from schemas import (
     UserSignup, UserLogin, UserProfile, UserResponse, 
-    MatchRequestCreate, MatchRequestResponse, TokenResponse,
+    MatchRequestCreate, MatchRequestResponse, TokenResponse, RefreshTokenRequest,
     MessageCreate, MessageResponse, ConversationResponse
 )
-from auth import create_access_token, verify_token, get_password_hash, verify_password
+from cache import mentor_cache
+from directory import mentor_directory
+from compression import CompressionMiddleware
+from conditional import make_etag, etag_headers, etag_matches, not_modified
+from ratelimit import rate_limit, rate_limiter
+from metrics import MetricsMiddleware, registry
+import avatars
+import export
+import idempotency
+import logs
+import maintenance
+from idempotency import IdempotencyMiddleware
+from admission import AdmissionMiddleware, admission
+from serializers import (
+    FastJSONResponse, user_to_dict, match_request_to_dict,
+    message_to_dict, conversation_to_dict
+)
+from auth import create_access_token, verify_token, get_password_hash, verify_and_update_password
 from crud import (
-    create_user, get_user_by_email, get_user_by_id,
-    update_user_profile, get_mentors,
-    create_match_request, get_incoming_requests, get_outgoing_requests,
+    create_user, get_user_by_email, get_user_by_id, get_avatar_sources,
+    update_user_profile, update_password_hash, MENTOR_PAGE_SIZE, MENTOR_MAX_PAGE_SIZE,
+    create_match_request, get_incoming_requests, get_outgoing_requests, get_request_list_version,
+    encode_request_cursor, decode_request_cursor,
+    MATCH_REQUEST_STATUSES, REQUEST_PAGE_SIZE, REQUEST_MAX_PAGE_SIZE,
     update_request_status, delete_match_request,
     create_message, get_messages_between_users, get_conversations,
-    mark_messages_as_read, get_unread_message_count
+    mark_messages_as_read, get_unread_message_count, get_session_counts,
+    create_refresh_token, rotate_refresh_token, revoke_refresh_token
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작/종료 처리"""
+    # 로그 쓰기는 백그라운드 스레드에서 (디스크 지연이 요청 지연이 되지 않도록)
+    if logs.LOG_QUEUE:
+        logs.setup_logging()
+    # 데이터베이스 초기화 (serve.py 로 실행하면 마스터 프로세스가 이미 수행함)
+    if os.getenv("SERVER_DB_READY") != "1":
+        init_db()
+    # 주기 정리 작업 (워커가 여러 개여도 작업마다 한 워커만 실행)
+    if maintenance.MAINTENANCE_ENABLED:
+        maintenance.scheduler.start()
+    app.state.ready = True
+    yield
+    # 종료 중에는 준비 상태 해제 (로드밸런서가 새 트래픽을 보내지 않도록)
+    app.state.ready = False
+    await maintenance.scheduler.stop()
+    logs.shutdown_logging()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="멘토-멘티 매칭 앱 API",
     description="멘토와 멘티를 매칭하는 웹 애플리케이션의 백엔드 API",
     version="1.0.0",
@@ -32,6 +79,12 @@ app = FastAPI(
     openapi_url="/v3/api-docs"
 )
 
+# Idempotency-Key 로 POST 재시도 응답 재사용 (CORS 헤더가 재사용 응답에도 붙도록 CORS 안쪽)
+app.add_middleware(IdempotencyMiddleware)
+
+# 경로 종류별 동시 처리 제한, 넘치면 503 + Retry-After (멱등성 키 저장소 조회보다 먼저)
+app.add_middleware(AdmissionMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -39,15 +92,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count", "Idempotent-Replayed", "X-Request-ID", "Retry-After"],
 )
 
+# 응답 압축 (gzip/brotli)
+app.add_middleware(CompressionMiddleware)
+
+# 요청별 JSON access 로그 (MetricsMiddleware 안쪽: 요청의 SQL 통계를 함께 기록)
+app.add_middleware(logs.AccessLogMiddleware)
+
+# 요청 지연시간/SQL 계측
+app.add_middleware(MetricsMiddleware)
+registry.collectors.append(rate_limiter.metrics_lines)
+registry.collectors.append(lambda: mentor_cache.metrics_lines("mentors"))
+registry.collectors.append(mentor_directory.metrics_lines)
+registry.collectors.append(idempotency.metrics_lines)
+registry.collectors.append(maintenance.scheduler.metrics_lines)
+registry.collectors.append(avatars.placeholder_cache.metrics_lines)
+registry.collectors.append(avatars.thumbnail_cache.metrics_lines)
+registry.collectors.append(admission.metrics_lines)
+
 # 보안 스키마
 security = HTTPBearer()
 
-# 데이터베이스 초기화
-@app.on_event("startup")
-async def startup_event():
-    init_db()
 
 # 현재 사용자 가져오기
 async def get_current_user(
@@ -80,34 +147,70 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
             detail="Email already registered"
         )
     
-    # 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    # 사용자 생성 (해싱은 CPU 를 오래 쓰므로 이벤트 루프 밖에서)
+    hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
     create_user(db, user_data.email, hashed_password, user_data.name, user_data.role)
     
     return {"message": "User created successfully"}
 
-@app.post("/api/login", response_model=TokenResponse)
+def _access_token(user) -> str:
+    return create_access_token({
+        "sub": str(user.id),
+        "email": user.email,
+        "name": user.name,
+        "role": user.role
+    })
+
+@app.post("/api/login", response_model=TokenResponse, dependencies=[Depends(rate_limit("login", by="ip"))])
 async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     user = get_user_by_email(db, user_data.email)
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await run_in_threadpool(
+            verify_and_update_password, user_data.password, user.password_hash
+        )
     
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    token = create_access_token({
-        "sub": str(user.id),
-        "email": user.email,
-        "name": user.name,
-        "role": user.role
-    })
+    # 해시 방식이나 비용 설정이 바뀌었으면 새 설정으로 다시 저장
+    if new_hash:
+        update_password_hash(db, user.id, new_hash)
+    
+    return {"token": _access_token(user), "refreshToken": create_refresh_token(db, user.id)}
+
+@app.post("/api/token/refresh", response_model=TokenResponse)
+async def refresh_token(data: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """리프레시 토큰으로 새 액세스 토큰 발급 (비밀번호 검증 없이 토큰 교체만 수행)"""
+    rotated = rotate_refresh_token(db, data.refreshToken)
+    if not rotated:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+        )
     
-    return {"token": token}
+    user, new_refresh_token = rotated
+    return {"token": _access_token(user), "refreshToken": new_refresh_token}
+
+@app.post("/api/logout", status_code=204)
+async def logout(data: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """리프레시 토큰 폐기 (이미 발급된 액세스 토큰은 만료까지 유효)"""
+    revoke_refresh_token(db, data.refreshToken)
+    return Response(status_code=204)
 
 # 2. 사용자 정보 엔드포인트
 @app.get("/api/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(request: Request, response: Response, current_user: User = Depends(get_current_user)):
+    # 사용자 버전과 이미지 URL 구간이 같으면 직렬화 없이 304
+    etag = make_etag("me", current_user.id, current_user.version, avatars.url_epoch())
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers.update(etag_headers(etag))
+    
     return UserResponse(
         id=current_user.id,
         email=current_user.email,
@@ -115,7 +218,7 @@ async def get_me(current_user: User = Depends(get_current_user)):
         profile={
             "name": current_user.name,
             "bio": current_user.bio or "",
-            "imageUrl": f"/api/images/{current_user.role}/{current_user.id}",
+            "imageUrl": avatars.signed_url(current_user.id, current_user.version),
             "skills": current_user.skills.split(",") if current_user.skills else []
         }
     )
@@ -138,14 +241,17 @@ async def update_profile(
         profile={
             "name": updated_user.name,
             "bio": updated_user.bio or "",
-            "imageUrl": f"/api/images/{updated_user.role}/{updated_user.id}",
+            "imageUrl": avatars.signed_url(updated_user.id, updated_user.version),
             "skills": updated_user.skills.split(",") if updated_user.skills else []
         }
     )
 
+# 인증 헤더로 조회하는 기존 경로 (응답의 imageUrl 은 아래 /api/avatars 의 서명된 URL)
 @app.get("/api/images/{role}/{user_id}")
 async def get_profile_image(
+    request: Request,
     role: str, user_id: int,
+    size: Optional[int] = Query(None, ge=1),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -158,16 +264,98 @@ async def get_profile_image(
             io.BytesIO(user.profile_image),
             media_type="image/jpeg"
         )
-    else:
-        # 기본 이미지 리다이렉트
-        placeholder_url = f"https://placehold.co/500x500.jpg?text={role.upper()}"
-        return RedirectResponse(url=placeholder_url)
+    
+    # 기본 이미지: 이니셜 PNG 를 직접 생성 (같은 이니셜/역할/크기는 캐시에서)
+    key = avatars.placeholder_key(user.name, user.role, size)
+    etag = avatars.placeholder_cache.etag(*key)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={avatars.AVATAR_MAX_AGE_SECONDS}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    body = await run_in_threadpool(avatars.placeholder_cache.get, *key)
+    return Response(content=body, media_type="image/png", headers=headers)
+
+@app.get("/api/avatars")
+async def get_avatar_thumbnails(
+    ids: str = Query(..., description="사용자 ID (쉼표 구분)"),
+    size: int = Query(96, ge=1),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """여러 사용자의 프로필 썸네일을 data URI 로 한 번에 조회 ({사용자 ID: data URI})
+
+    메타데이터 SELECT 하나로 이미지 유무와 버전을 확인하고, 썸네일 캐시에 없는 업로드 이미지만
+    SELECT 하나로 읽는다. 없는 사용자는 결과에서 빠진다.
+    """
+    try:
+        user_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be integers")
+    if not user_ids or len(user_ids) > avatars.AVATAR_BATCH_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ids must contain 1 to {avatars.AVATAR_BATCH_MAX} user IDs"
+        )
+    size = avatars.normalize_size(size)
+    sources = get_avatar_sources(db, user_ids, include_image=False)
+    cached = {
+        source.id: avatars.thumbnail_cache.peek((source.id, source.version, size))
+        for source in sources if source.image
+    }
+    missing = [user_id for user_id, body in cached.items() if body is None]
+    images = {source.id: source.image for source in get_avatar_sources(db, missing)} if missing else {}
+
+    def render():
+        result = {}
+        for source in sources:
+            if source.image:
+                body = cached[source.id] or avatars.thumbnail_cache.get(
+                    source.id, source.version, size, images[source.id]
+                )
+                media_type = "image/jpeg"
+            else:
+                body, media_type = avatars.avatar_body(source.id, source.version, source.name, source.role, None, size)
+            result[str(source.id)] = f"data:{media_type};base64,{base64.b64encode(body).decode()}"
+        return result
+
+    return FastJSONResponse(await run_in_threadpool(render))
+
+@app.get("/api/avatars/{user_id}")
+async def get_signed_avatar(
+    request: Request,
+    user_id: int,
+    v: int = Query(..., description="사용자 버전"),
+    exp: int = Query(..., description="만료 시각 (Unix 초)"),
+    sig: str = Query(..., description="서명"),
+    size: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    """서명된 URL 의 프로필 이미지 (인증 헤더 없이 <img> 로 사용)
+
+    서명 확인과 304 판단은 DB 없이 하고, 이미지는 필요한 컬럼만 SELECT 한 번으로 읽는다.
+    """
+    if not avatars.verify(user_id, v, exp, sig):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired image URL")
+    etag = avatars.signed_etag(user_id, v, size)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max(0, exp - int(time.time()))}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    sources = get_avatar_sources(db, [user_id])
+    if not sources:
+        raise HTTPException(status_code=404, detail="User not found")
+    source = sources[0]
+    body, media_type = await run_in_threadpool(
+        avatars.avatar_body, source.id, source.version, source.name, source.role, source.image, size
+    )
+    return Response(content=body, media_type=media_type, headers=headers)
 
 # 3. 멘토 리스트 조회
-@app.get("/api/mentors", response_model=List[UserResponse])
+@app.get("/api/mentors", response_model=List[UserResponse], response_class=FastJSONResponse)
 async def get_mentors_list(
+    request: Request,
     skill: Optional[str] = None,
-    order_by: Optional[str] = None,
+    order_by: Optional[str] = Query(None, description="id, name, skill, created (앞에 - 를 붙이면 내림차순)"),
+    page: Optional[int] = Query(None, ge=1),
+    page_size: int = Query(MENTOR_PAGE_SIZE, ge=1, le=MENTOR_MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -177,24 +365,33 @@ async def get_mentors_list(
             detail="Only mentees can access mentor list"
         )
     
-    mentors = get_mentors(db, skill, order_by)
-    
-    return [
-        UserResponse(
-            id=mentor.id,
-            email=mentor.email,
-            role=mentor.role,
-            profile={
-                "name": mentor.name,
-                "bio": mentor.bio or "",
-                "imageUrl": f"/api/images/{mentor.role}/{mentor.id}",
-                "skills": mentor.skills.split(",") if mentor.skills else []
-            }
-        ) for mentor in mentors
-    ]
+    # 캐시 키와 ETag 는 현재 캐시 세대에서 파생. 다른 워커의 변경을 새로고침으로 먼저 반영해야
+    # (변경이 있으면 세대가 오름) 캐시된 응답이나 304 가 이전 목록을 계속 내보내지 않는다
+    mentor_directory.ensure_current(db)
+    skill = skill.strip().lower() if skill else None
+    # 응답의 이미지 URL 이 구간마다 바뀌므로 구간 번호도 키에 포함
+    cache_key = mentor_cache.key(skill, order_by, page, page_size if page else None, avatars.url_epoch())
+    etag = mentor_cache.etag(cache_key)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    result = mentor_cache.get(cache_key)
+    if result is None:
+        # 필터/정렬/페이지는 메모리 내 디렉터리에서 처리 (DB 는 적재/새로고침 때만)
+        mentors, total = mentor_directory.query(db, skill, order_by, page, page_size)
+        result = {"items": [user_to_dict(mentor) for mentor in mentors], "total": total}
+        mentor_cache.set(cache_key, result)
+    
+    headers = etag_headers(etag)
+    headers["X-Total-Count"] = str(result["total"])
+    return FastJSONResponse(result["items"], headers=headers)
 
 # 4. 매칭 요청 엔드포인트
-@app.post("/api/match-requests", response_model=MatchRequestResponse)
+@app.post(
+    "/api/match-requests", response_model=MatchRequestResponse,
+    dependencies=[Depends(rate_limit("match_requests"))]
+)
 async def create_match_request_endpoint(
     request_data: MatchRequestCreate,
     current_user: User = Depends(get_current_user),
@@ -214,9 +411,15 @@ async def create_match_request_endpoint(
             detail="Mentor not found"
         )
     
-    match_request = create_match_request(
-        db, request_data.mentorId, current_user.id, request_data.message
-    )
+    try:
+        match_request = create_match_request(
+            db, request_data.mentorId, current_user.id, request_data.message
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     return MatchRequestResponse(
         id=match_request.id,
@@ -226,8 +429,47 @@ async def create_match_request_endpoint(
         status=match_request.status
     )
 
-@app.get("/api/match-requests/incoming", response_model=List[MatchRequestResponse])
+def _parse_status_filter(value: str) -> Optional[List[str]]:
+    """status 파라미터 ("pending", "accepted,rejected", "all") 해석"""
+    if value == "all":
+        return None
+    statuses = sorted({s.strip() for s in value.split(",") if s.strip()})
+    if not statuses or any(s not in MATCH_REQUEST_STATUSES for s in statuses):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status")
+    return statuses
+
+def _request_queue_response(
+    request: Request, db: Session, kind: str, owner: dict,
+    status_filter: str, limit: int, cursor: Optional[str]
+):
+    statuses = _parse_status_filter(status_filter)
+    try:
+        position = decode_request_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
+    # 요청 목록 버전이 같으면 조회/직렬화 없이 304
+    etag = make_etag(kind, *owner.values(), statuses, limit, cursor, *get_request_list_version(db, **owner))
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    # 한 개 더 조회해 다음 페이지가 있는지 확인
+    fetch = get_incoming_requests if kind == "incoming" else get_outgoing_requests
+    requests = fetch(db, *owner.values(), statuses=statuses, limit=limit + 1, cursor=position)
+    headers = etag_headers(etag)
+    if len(requests) > limit:
+        requests = requests[:limit]
+        headers["X-Next-Cursor"] = encode_request_cursor(requests[-1])
+    
+    return FastJSONResponse([match_request_to_dict(req) for req in requests], headers=headers)
+
+@app.get("/api/match-requests/incoming", response_model=List[MatchRequestResponse], response_class=FastJSONResponse)
 async def get_incoming_requests_endpoint(
+    request: Request,
+    status_filter: str = Query("pending", alias="status", description="상태 (쉼표로 여러 개, all 은 전체)"),
+    limit: int = Query(REQUEST_PAGE_SIZE, ge=1, le=REQUEST_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -237,20 +479,16 @@ async def get_incoming_requests_endpoint(
             detail="Only mentors can access incoming requests"
         )
     
-    requests = get_incoming_requests(db, current_user.id)
-    
-    return [
-        MatchRequestResponse(
-            id=req.id,
-            mentorId=req.mentor_id,
-            menteeId=req.mentee_id,
-            message=req.message,
-            status=req.status
-        ) for req in requests
-    ]
+    return _request_queue_response(
+        request, db, "incoming", {"mentor_id": current_user.id}, status_filter, limit, cursor
+    )
 
-@app.get("/api/match-requests/outgoing", response_model=List[MatchRequestResponse])
+@app.get("/api/match-requests/outgoing", response_model=List[MatchRequestResponse], response_class=FastJSONResponse)
 async def get_outgoing_requests_endpoint(
+    request: Request,
+    status_filter: str = Query("pending", alias="status", description="상태 (쉼표로 여러 개, all 은 전체)"),
+    limit: int = Query(REQUEST_PAGE_SIZE, ge=1, le=REQUEST_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -260,17 +498,17 @@ async def get_outgoing_requests_endpoint(
             detail="Only mentees can access outgoing requests"
         )
     
-    requests = get_outgoing_requests(db, current_user.id)
-    
-    return [
-        MatchRequestResponse(
-            id=req.id,
-            mentorId=req.mentor_id,
-            menteeId=req.mentee_id,
-            message=req.message,
-            status=req.status
-        ) for req in requests
-    ]
+    return _request_queue_response(
+        request, db, "outgoing", {"mentee_id": current_user.id}, status_filter, limit, cursor
+    )
+
+@app.get("/api/match-requests/counts")
+async def get_request_counts(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """상태별 요청 수 (멘토는 받은 요청, 멘티는 보낸 요청)"""
+    return get_session_counts(db, current_user.id, current_user.role, unread=False)
 
 @app.put("/api/match-requests/{request_id}/accept", response_model=MatchRequestResponse)
 async def accept_request(
@@ -354,7 +592,10 @@ async def cancel_request(
     )
 
 # 5. 메시지 엔드포인트
-@app.post("/api/messages", response_model=MessageResponse)
+@app.post(
+    "/api/messages", response_model=MessageResponse,
+    dependencies=[Depends(rate_limit("messages"))]
+)
 async def send_message(
     message_data: MessageCreate,
     current_user: User = Depends(get_current_user),
@@ -390,9 +631,20 @@ async def send_message(
         receiver_name=receiver.name
     )
 
-@app.get("/api/messages/{user_id}", response_model=List[MessageResponse])
+# /api/messages/{user_id} 보다 먼저 등록해야 "unread-count" 가 user_id 로 해석되지 않음
+@app.get("/api/messages/unread-count")
+async def get_unread_count(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    count = get_unread_message_count(db, current_user.id)
+    return {"unread_count": count}
+
+@app.get("/api/messages/{user_id}", response_model=List[MessageResponse], response_class=FastJSONResponse)
 async def get_messages_with_user(
     user_id: int,
+    before: Optional[int] = Query(None, description="이 메시지 ID 보다 이전 메시지 조회 (페이지 커서)"),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -405,59 +657,116 @@ async def get_messages_with_user(
         )
     
     # 메시지 조회
-    messages = get_messages_between_users(db, current_user.id, user_id)
+    messages = get_messages_between_users(db, current_user.id, user_id, limit, before)
     
     # 읽음 처리 (상대방이 보낸 메시지들)
     mark_messages_as_read(db, user_id, current_user.id)
     
-    # 응답 생성
-    result = []
-    for message in reversed(messages):  # 시간 순으로 정렬
-        sender = get_user_by_id(db, message.sender_id)
-        receiver = get_user_by_id(db, message.receiver_id)
-        
-        result.append(MessageResponse(
-            id=message.id,
-            sender_id=message.sender_id,
-            receiver_id=message.receiver_id,
-            content=message.content,
-            is_read=bool(message.is_read),
-            created_at=message.created_at.isoformat(),
-            sender_name=sender.name if sender else "Unknown",
-            receiver_name=receiver.name if receiver else "Unknown"
-        ))
-    
-    return result
-
-@app.get("/api/conversations", response_model=List[ConversationResponse])
+    # 응답 생성 (대화 참여자는 두 명뿐이므로 이름을 추가 조회하지 않음)
+    names = {current_user.id: current_user.name, other_user.id: other_user.name}
+    # 더 이전 메시지가 있을 수 있으면 다음 페이지 커서 전달
+    headers = {"X-Next-Cursor": str(messages[-1].id)} if len(messages) == limit else None
+    return FastJSONResponse([
+        message_to_dict(
+            message,
+            names.get(message.sender_id, "Unknown"),
+            names.get(message.receiver_id, "Unknown")
+        ) for message in reversed(messages)  # 시간 순으로 정렬
+    ], headers=headers)
+
+@app.get("/api/conversations", response_model=List[ConversationResponse], response_class=FastJSONResponse)
 async def get_user_conversations(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     conversations = get_conversations(db, current_user.id)
-    
-    result = []
-    for conv in conversations:
-        other_user = get_user_by_id(db, conv.other_user_id)
-        if other_user:
-            result.append(ConversationResponse(
-                user_id=other_user.id,
-                user_name=other_user.name,
-                user_role=other_user.role,
-                last_message=conv.last_message,
-                last_message_time=conv.last_message_time.isoformat() if conv.last_message_time else None,
-                unread_count=conv.unread_count
-            ))
-    
-    return result
+    return FastJSONResponse([conversation_to_dict(conv) for conv in conversations])
 
-@app.get("/api/messages/unread-count")
-async def get_unread_count(
+# 페이지 로드시 필요한 정보 한 번에 조회
+BOOTSTRAP_FIELDS = ("user", "unread_count", "request_counts", "conversations")
+BOOTSTRAP_CONVERSATION_LIMIT = int(os.getenv("BOOTSTRAP_CONVERSATION_LIMIT", "5"))
+
+@app.get("/api/bootstrap", response_class=FastJSONResponse)
+async def bootstrap(
+    fields: Optional[str] = Query(None, description="user, unread_count, request_counts, conversations (쉼표 구분, 기본 전체)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    count = get_unread_message_count(db, current_user.id)
-    return {"unread_count": count}
+    """프로필, 읽지 않은 메시지 수, 상태별 요청 수, 최근 대화를 한 요청으로 조회
+
+    인증은 한 번만 하고, 개수는 SELECT 하나, 최근 대화는 SELECT 하나로 가져온다.
+    """
+    selected = set(f.strip() for f in fields.split(",") if f.strip()) if fields else set(BOOTSTRAP_FIELDS)
+    unknown = selected - set(BOOTSTRAP_FIELDS)
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}" if unknown else "No fields selected"
+        )
+    
+    result = {}
+    if "user" in selected:
+        result["user"] = user_to_dict(current_user)
+    if selected & {"unread_count", "request_counts"}:
+        counts = get_session_counts(
+            db, current_user.id, current_user.role,
+            unread="unread_count" in selected, requests="request_counts" in selected
+        )
+        if "unread_count" in selected:
+            result["unread_count"] = counts.pop("unread")
+        if "request_counts" in selected:
+            result["request_counts"] = counts
+    if "conversations" in selected:
+        conversations = get_conversations(db, current_user.id, limit=BOOTSTRAP_CONVERSATION_LIMIT)
+        result["conversations"] = [conversation_to_dict(conv) for conv in conversations]
+    
+    return FastJSONResponse(result)
+
+# 데이터 내보내기 (NDJSON/CSV 스트리밍)
+def _export_response(user_id: Optional[int], export_format: str) -> StreamingResponse:
+    return StreamingResponse(
+        export.stream_export(user_id, export_format),
+        media_type=export.EXPORT_FORMATS[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{export.export_filename(user_id, export_format)}"'
+        },
+    )
+
+@app.get("/api/export", dependencies=[Depends(rate_limit("export"))])
+async def export_my_data(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_user)
+):
+    return _export_response(current_user.id, format)
+
+@app.get("/internal/export", include_in_schema=False)
+async def export_all_data(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    x_admin_key: Optional[str] = Header(None)
+):
+    if not export.ADMIN_API_KEY or not x_admin_key or not hmac.compare_digest(x_admin_key, export.ADMIN_API_KEY):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return _export_response(None, format)
+
+# 상태 확인 (liveness: 프로세스 응답 여부, readiness: 트래픽을 받을 수 있는지)
+@app.get("/health/live", include_in_schema=False)
+async def health_live():
+    return {"status": "ok"}
+
+@app.get("/health/ready", include_in_schema=False)
+def health_ready():
+    if not getattr(app.state, "ready", False):
+        return FastJSONResponse({"status": "not ready"}, status_code=503)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception:
+        return FastJSONResponse({"status": "database unavailable"}, status_code=503)
+    return {"status": "ready"}
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 if __name__ == "__main__":
     import uvicorn
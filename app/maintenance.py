@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+주기 정리 작업 스케줄러
+
+서버 프로세스 안에서 돌며 오래된 데이터를 정리한다.
+
+- expire_requests: MATCH_REQUEST_TTL_DAYS 가 지난 대기(pending) 요청을 "expired" 로 변경
+  (멘티가 새 요청을 보낼 수 있게 되고, 멘토의 대기 목록이 줄어든다)
+- purge_requests: 거절/취소/만료된 지 MATCH_REQUEST_RETENTION_DAYS 가 지난 요청 삭제
+  (수락된 요청은 매칭 기록이므로 남긴다)
+- purge_tokens: 만료된 리프레시 토큰과 Idempotency-Key 응답 삭제
+- optimize: SQLite 는 PRAGMA optimize (통계가 없으면 ANALYZE), 그 밖의 DB 는 ANALYZE
+- archive_messages: 오래된 메시지 보관 + incremental_vacuum (archive.py, 기본 비활성화)
+
+워커가 여러 개여도 작업마다 한 워커만 실행한다. maintenance_jobs 테이블의 행을
+UPDATE ... WHERE (임대 만료) AND (실행 시각 도래) 한 문장으로 차지한 워커가 실행하고,
+끝나면 다음 실행 시각을 기록한 뒤 임대를 푼다. 오래 걸리는 작업은 배치 사이에 임대를
+연장하므로(소유자가 자신일 때만) 실행 중에는 다른 워커가 가져가지 않고, 실행 중 워커가 죽으면
+MAINTENANCE_LEASE_SECONDS 뒤 다른 워커가 이어받는다.
+
+쓰기 잠금을 오래 잡지 않도록 행은 기본 키 순서로 MAINTENANCE_BATCH_SIZE 개씩 읽고, 배치마다
+따로 커밋하며 배치 사이에 잠시 쉰다. 한 번 실행에 처리하는 배치 수도 제한한다.
+
+    python maintenance.py                    # 등록된 작업을 일정과 관계없이 한 번씩 실행
+    python maintenance.py --job optimize
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, inspect, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from metrics import counter_lines
+from models import IdempotencyKey, MaintenanceJob, MatchRequest, RefreshToken
+
+logger = logging.getLogger("maintenance")
+
+# 스케줄러 설정
+MAINTENANCE_ENABLED = os.getenv("MAINTENANCE_ENABLED", "1") == "1"
+MAINTENANCE_TICK_SECONDS = float(os.getenv("MAINTENANCE_TICK_SECONDS", "60"))
+MAINTENANCE_LEASE_SECONDS = int(os.getenv("MAINTENANCE_LEASE_SECONDS", "600"))
+MAINTENANCE_RETRY_SECONDS = int(os.getenv("MAINTENANCE_RETRY_SECONDS", "300"))  # 실패한 작업 재시도 간격
+MAINTENANCE_BATCH_SIZE = int(os.getenv("MAINTENANCE_BATCH_SIZE", "500"))
+MAINTENANCE_MAX_BATCHES = int(os.getenv("MAINTENANCE_MAX_BATCHES", "200"))  # 한 번 실행에 처리할 최대 배치 수
+MAINTENANCE_BATCH_PAUSE = float(os.getenv("MAINTENANCE_BATCH_PAUSE", "0.05"))
+
+# 정리 기준 (0 이면 해당 작업 비활성화)
+MATCH_REQUEST_TTL_DAYS = int(os.getenv("MATCH_REQUEST_TTL_DAYS", "14"))
+MATCH_REQUEST_RETENTION_DAYS = int(os.getenv("MATCH_REQUEST_RETENTION_DAYS", "90"))
+MAINTENANCE_ARCHIVE_INTERVAL_SECONDS = int(os.getenv("MAINTENANCE_ARCHIVE_INTERVAL_SECONDS", "0"))
+
+TERMINAL_REQUEST_STATUSES = ("rejected", "cancelled", "expired")
+
+
+class LeaseLost(Exception):
+    """실행 중 임대가 만료되어 다른 워커가 작업을 가져감"""
+
+
+class BatchRunner:
+    """기본 키 순서로 배치를 나누어 짧은 트랜잭션으로 처리 (배치마다 heartbeat 호출)"""
+
+    def __init__(
+        self, batch_size: int = MAINTENANCE_BATCH_SIZE, max_batches: int = MAINTENANCE_MAX_BATCHES,
+        pause: float = MAINTENANCE_BATCH_PAUSE, heartbeat: Optional[Callable] = None
+    ):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.pause = pause
+        self.heartbeat = heartbeat
+
+    def with_heartbeat(self, heartbeat: Callable) -> "BatchRunner":
+        return BatchRunner(self.batch_size, self.max_batches, self.pause, heartbeat)
+
+    def beat(self) -> None:
+        if self.heartbeat is not None:
+            self.heartbeat()
+
+    def run(self, db: Session, id_column, criteria, write: Callable) -> int:
+        """criteria 에 맞는 행의 ID 를 배치로 읽어 write(db, ids) 실행 -> 처리한 행 수
+
+        ID 조회는 읽기만 하므로 쓰기 잠금은 write 와 커밋 사이에만 잡힌다.
+        """
+        total, last_id = 0, None
+        for _ in range(self.max_batches):
+            query = select(id_column).where(*criteria).order_by(id_column).limit(self.batch_size)
+            if last_id is not None:
+                query = query.where(id_column > last_id)
+            ids = db.execute(query).scalars().all()
+            db.commit()  # 다음 배치 전에 읽기 트랜잭션 종료
+            if not ids:
+                break
+            last_id = ids[-1]
+            total += write(db, ids) or 0
+            db.commit()
+            self.beat()
+            if len(ids) < self.batch_size:
+                break
+            if self.pause:
+                time.sleep(self.pause)
+        else:
+            logger.info("Stopped after %d batches; remaining rows are handled on the next run", self.max_batches)
+        return total
+
+
+def expire_pending_requests(
+    db: Session, runner: BatchRunner, ttl_days: int = MATCH_REQUEST_TTL_DAYS, now: Optional[datetime] = None
+) -> int:
+    """ttl_days 보다 오래 대기 중인 요청을 만료 처리 -> 만료한 요청 수"""
+    if ttl_days <= 0:
+        return 0
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=ttl_days)
+
+    def expire(db, ids):
+        # 그 사이 수락/취소된 요청은 건드리지 않도록 상태를 다시 확인
+        return db.execute(
+            update(MatchRequest)
+            .where(MatchRequest.id.in_(ids), MatchRequest.status == "pending")
+            .values(status="expired", updated_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    return runner.run(
+        db, MatchRequest.id, (MatchRequest.status == "pending", MatchRequest.created_at < cutoff), expire
+    )
+
+
+def purge_terminal_requests(
+    db: Session, runner: BatchRunner, retention_days: int = MATCH_REQUEST_RETENTION_DAYS,
+    now: Optional[datetime] = None
+) -> int:
+    """retention_days 보다 오래된 거절/취소/만료 요청 삭제 -> 삭제한 요청 수"""
+    if retention_days <= 0:
+        return 0
+    cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+
+    def purge(db, ids):
+        return db.execute(
+            delete(MatchRequest)
+            .where(MatchRequest.id.in_(ids), MatchRequest.status.in_(TERMINAL_REQUEST_STATUSES))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    return runner.run(
+        db, MatchRequest.id,
+        (MatchRequest.status.in_(TERMINAL_REQUEST_STATUSES), MatchRequest.updated_at < cutoff),
+        purge,
+    )
+
+
+def purge_expired_tokens(db: Session, runner: BatchRunner, now: Optional[datetime] = None) -> int:
+    """만료된 리프레시 토큰과 Idempotency-Key 응답 삭제 -> 삭제한 행 수"""
+    now = now or datetime.utcnow()
+    total = 0
+    for model in (RefreshToken, IdempotencyKey):
+        def purge(db, ids, model=model):
+            return db.execute(
+                delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+            ).rowcount
+
+        total += runner.run(db, model.id, (model.expires_at <= now,), purge)
+    return total
+
+
+def optimize_database(db: Session, runner: BatchRunner) -> int:
+    """쿼리 플래너 통계 갱신"""
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite":
+        # 통계가 한 번도 없으면 PRAGMA optimize 가 아무것도 하지 않으므로 처음에는 ANALYZE
+        if "sqlite_stat1" in inspect(bind).get_table_names():
+            db.connection().exec_driver_sql("PRAGMA optimize")
+        else:
+            db.connection().exec_driver_sql("ANALYZE")
+    else:
+        db.connection().exec_driver_sql("ANALYZE")
+    db.commit()
+    return 0
+
+
+def archive_old_messages(db: Session, runner: BatchRunner) -> int:
+    """오래된 메시지를 보관 파일로 옮기고 빈 페이지 반환 (archive.py)"""
+    import archive
+
+    bind = db.get_bind()
+    moved = archive.archive_messages(bind, batch_size=runner.batch_size, on_batch=runner.beat)
+    if moved:
+        archive.compact(bind, pause=runner.pause)
+    return sum(moved.values())
+
+
+class Job:
+    """주기 작업 (interval 초마다, func(db, runner) -> 처리한 행 수)"""
+
+    __slots__ = ("name", "interval", "func")
+
+    def __init__(self, name: str, interval: float, func: Callable):
+        self.name = name
+        self.interval = interval
+        self.func = func
+
+
+def default_jobs() -> list:
+    jobs = [
+        Job("expire_requests", 3600, expire_pending_requests),
+        Job("purge_requests", 6 * 3600, purge_terminal_requests),
+        Job("purge_tokens", 3600, purge_expired_tokens),
+        Job("optimize", 24 * 3600, optimize_database),
+    ]
+    if MAINTENANCE_ARCHIVE_INTERVAL_SECONDS > 0:
+        jobs.append(Job("archive_messages", MAINTENANCE_ARCHIVE_INTERVAL_SECONDS, archive_old_messages))
+    return jobs
+
+
+class MaintenanceScheduler:
+    """DB 임대로 워커 간 한 번만 실행되는 주기 작업 스케줄러"""
+
+    def __init__(
+        self, jobs=None, session_factory=SessionLocal, runner: Optional[BatchRunner] = None,
+        lease_seconds: int = MAINTENANCE_LEASE_SECONDS, owner: Optional[str] = None
+    ):
+        self.jobs = {job.name: job for job in (default_jobs() if jobs is None else jobs)}
+        self.session_factory = session_factory
+        self.runner = runner or BatchRunner()
+        self.lease = timedelta(seconds=lease_seconds)
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._rows_ready = False
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        # 이 프로세스에서 실행한 결과 (작업, 결과) 별 횟수, 처리한 행 수, 실행 시간
+        self.runs = Counter()
+        self.rows = Counter()
+        self.seconds = defaultdict(float)
+
+    def _ensure_rows(self, db: Session) -> None:
+        if self._rows_ready:
+            return
+        existing = set(db.execute(select(MaintenanceJob.name)).scalars())
+        for name in self.jobs.keys() - existing:
+            db.add(MaintenanceJob(name=name))
+        try:
+            db.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 추가함
+            db.rollback()
+        self._rows_ready = True
+
+    def claim(self, db: Session, job: Job, now: datetime) -> bool:
+        """실행할 차례이고 다른 워커가 실행 중이 아니면 임대를 잡음"""
+        claimed = db.execute(
+            update(MaintenanceJob)
+            .where(
+                MaintenanceJob.name == job.name,
+                or_(MaintenanceJob.lease_expires_at.is_(None), MaintenanceJob.lease_expires_at <= now),
+                or_(MaintenanceJob.next_run_at.is_(None), MaintenanceJob.next_run_at <= now),
+            )
+            .values(owner=self.owner, lease_expires_at=now + self.lease)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        return claimed == 1
+
+    def renew(self, job: Job, now: Optional[datetime] = None) -> bool:
+        """아직 임대를 가지고 있으면 만료 시각을 연장"""
+        now = now or datetime.utcnow()
+        with self.session_factory() as db:
+            renewed = db.execute(
+                update(MaintenanceJob)
+                .where(MaintenanceJob.name == job.name, MaintenanceJob.owner == self.owner)
+                .values(lease_expires_at=now + self.lease)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+        return renewed == 1
+
+    def _heartbeat(self, job: Job) -> Callable:
+        """배치마다 불리지만 임대의 1/3 이 지났을 때만 연장하는 함수 (임대를 잃으면 LeaseLost)"""
+        interval = self.lease.total_seconds() / 3
+        last = time.monotonic()
+
+        def heartbeat():
+            nonlocal last
+            if time.monotonic() - last < interval:
+                return
+            if not self.renew(job):
+                raise LeaseLost(job.name)
+            last = time.monotonic()
+
+        return heartbeat
+
+    def _finish(self, db: Session, job: Job, status: str, rows: int) -> None:
+        now = datetime.utcnow()
+        delay = job.interval if status == "ok" else min(job.interval, MAINTENANCE_RETRY_SECONDS)
+        db.execute(
+            update(MaintenanceJob)
+            .where(MaintenanceJob.name == job.name, MaintenanceJob.owner == self.owner)
+            .values(
+                owner=None, lease_expires_at=None, next_run_at=now + timedelta(seconds=delay),
+                last_finished_at=now, last_status=status, last_rows=rows,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+    def run_job(self, job: Job, runner: Optional[BatchRunner] = None) -> tuple:
+        """작업 하나를 바로 실행 -> (결과, 처리한 행 수)"""
+        started = time.perf_counter()
+        rows, status = 0, "ok"
+        with self.session_factory() as db:
+            try:
+                rows = job.func(db, runner or self.runner) or 0
+            except LeaseLost:
+                db.rollback()
+                status = "lease_lost"
+                logger.warning("Maintenance job %s stopped: lease taken over by another worker", job.name)
+            except Exception:
+                db.rollback()
+                status = "error"
+                logger.exception("Maintenance job %s failed", job.name)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.runs[(job.name, status)] += 1
+            self.rows[job.name] += rows
+            self.seconds[job.name] += elapsed
+        if rows or status != "ok":
+            logger.info("Maintenance job %s: %s, %d rows in %.2fs", job.name, status, rows, elapsed)
+        return status, rows
+
+    def run_pending(self, now: Optional[datetime] = None) -> list:
+        """차례가 된 작업 중 임대를 잡은 것만 실행 -> 실행한 작업 이름 목록"""
+        ran = []
+        with self.session_factory() as db:
+            self._ensure_rows(db)
+            for job in self.jobs.values():
+                if not self.claim(db, job, now or datetime.utcnow()):
+                    continue
+                status, rows = self.run_job(job, self.runner.with_heartbeat(self._heartbeat(job)))
+                self._finish(db, job, status, rows)
+                ran.append(job.name)
+        return ran
+
+    async def run_forever(self, tick: float = MAINTENANCE_TICK_SECONDS) -> None:
+        # 워커들이 동시에 깨어나지 않도록 첫 실행을 흩뜨림
+        await asyncio.sleep(random.uniform(0, tick))
+        while True:
+            try:
+                await asyncio.to_thread(self.run_pending)
+            except Exception:
+                logger.exception("Maintenance scheduler tick failed")
+            await asyncio.sleep(tick)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def metrics_lines(self) -> list:
+        with self._lock:
+            runs = [({"job": job, "result": status}, count) for (job, status), count in sorted(self.runs.items())]
+            rows = [({"job": job}, count) for job, count in sorted(self.rows.items())]
+            seconds = [({"job": job}, round(value, 6)) for job, value in sorted(self.seconds.items())]
+        return (
+            counter_lines("maintenance_job_runs_total", "Maintenance job runs in this process by result", runs)
+            + counter_lines("maintenance_job_rows_total", "Rows changed by maintenance jobs", rows)
+            + counter_lines("maintenance_job_seconds_total", "Time spent running maintenance jobs", seconds)
+        )
+
+
+scheduler = MaintenanceScheduler()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="주기 정리 작업을 지금 바로 실행")
+    parser.add_argument("--job", action="append", help="실행할 작업 (여러 번 지정 가능, 기본: 전체)")
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = parse_args()
+    from database import init_db
+
+    init_db()
+    jobs = {job.name: job for job in default_jobs() + [Job("archive_messages", 0, archive_old_messages)]}
+    for name in args.job or [name for name in jobs if name != "archive_messages"]:
+        if name not in jobs:
+            raise SystemExit(f"unknown job: {name} (choose from {', '.join(jobs)})")
+        status, rows = scheduler.run_job(jobs[name])
+        print(f"{name}: {status}, {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
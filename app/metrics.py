@@ -0,0 +1,292 @@
+"""
+요청 성능 계측
+
+- MetricsMiddleware: 경로(route 템플릿)별 지연시간 히스토그램과 상태코드별 요청 수 기록
+- SQLAlchemy 이벤트 훅: 요청마다 실행한 SQL 문 수와 시간 집계
+- N+1 감지: 한 요청 안에서 같은 SQL 문이 N1_THRESHOLD 회 이상 반복되면 경고 및 카운트
+- 느린 쿼리 로그: SLOW_QUERY_MS 를 설정하면 그보다 오래 걸린 쿼리를 EXPLAIN QUERY PLAN 과 함께 기록
+
+모든 값은 GET /metrics 에서 Prometheus 텍스트 형식으로 노출된다.
+"""
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger("metrics")
+
+# 계측 설정
+N1_THRESHOLD = int(os.getenv("N1_THRESHOLD", "5"))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))  # 0 이면 느린 쿼리 로그 비활성화
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            yield bound, running
+
+
+class RequestStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    __slots__ = ("path", "route", "statements", "sql_seconds", "statement_counts")
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.route = None
+        self.statements = 0
+        self.sql_seconds = 0.0
+        self.statement_counts = Counter()
+
+
+_current_stats: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """현재 요청의 SQL 통계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+class MetricsRegistry:
+    """프로세스 전체 지표 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.statements = defaultdict(lambda: Histogram(STATEMENT_BUCKETS))
+        self.sql_seconds = defaultdict(float)
+        self.requests = Counter()
+        self.n_plus_one = Counter()
+        self.slow_queries = 0
+        # 다른 모듈이 등록하는 추가 지표 수집 함수 (Prometheus 텍스트 줄 목록 반환)
+        self.collectors = []
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            self.latency[(method, route)].observe(seconds)
+            self.statements[(method, route)].observe(stats.statements)
+            self.sql_seconds[(method, route)] += stats.sql_seconds
+            self.requests[(method, route, status)] += 1
+            repeated = [
+                (statement, count) for statement, count in stats.statement_counts.items()
+                if count >= N1_THRESHOLD
+            ]
+            if repeated:
+                self.n_plus_one[(method, route)] += 1
+        for statement, count in repeated:
+            logger.warning(
+                "Possible N+1 query in %s %s: %d executions of %s", method, route, count, statement
+            )
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP http_request_duration_seconds Request latency by route",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), histogram in sorted(self.latency.items()):
+                lines += _histogram_lines("http_request_duration_seconds", histogram, method=method, route=route)
+
+            lines += [
+                "# HELP http_requests_total Requests by route and status",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(_sample("http_requests_total", count, method=method, route=route, status=status))
+
+            lines += [
+                "# HELP db_statements_per_request SQL statements executed per request",
+                "# TYPE db_statements_per_request histogram",
+            ]
+            for (method, route), histogram in sorted(self.statements.items()):
+                lines += _histogram_lines("db_statements_per_request", histogram, method=method, route=route)
+
+            lines += [
+                "# HELP db_statement_seconds_total Time spent executing SQL by route",
+                "# TYPE db_statement_seconds_total counter",
+            ]
+            for (method, route), seconds in sorted(self.sql_seconds.items()):
+                lines.append(_sample("db_statement_seconds_total", seconds, method=method, route=route))
+
+            lines += [
+                "# HELP db_n_plus_one_requests_total Requests that repeated one statement N1_THRESHOLD+ times",
+                "# TYPE db_n_plus_one_requests_total counter",
+            ]
+            for (method, route), count in sorted(self.n_plus_one.items()):
+                lines.append(_sample("db_n_plus_one_requests_total", count, method=method, route=route))
+
+            lines += [
+                "# HELP db_slow_queries_total Queries slower than SLOW_QUERY_MS",
+                "# TYPE db_slow_queries_total counter",
+                _sample("db_slow_queries_total", self.slow_queries),
+            ]
+
+        for collector in self.collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+
+def counter_lines(name: str, help_text: str, samples) -> list:
+    """(라벨 dict, 값) 목록을 Prometheus 카운터 텍스트로 변환 (collectors 용)"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    lines += [_sample(name, value, **labels) for labels, value in samples]
+    return lines
+
+
+def gauge_lines(name: str, help_text: str, samples) -> list:
+    """(라벨 dict, 값) 목록을 Prometheus 게이지 텍스트로 변환 (collectors 용)"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+    lines += [_sample(name, value, **labels) for labels, value in samples]
+    return lines
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _sample(name: str, value, **labels) -> str:
+    return f"{name}{_format_labels(labels)} {value}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels) -> list:
+    lines = [
+        _sample(f"{name}_bucket", count, **labels, le=bound)
+        for bound, count in histogram.cumulative()
+    ]
+    lines.append(_sample(f"{name}_bucket", histogram.count, **labels, le="+Inf"))
+    lines.append(_sample(f"{name}_sum", round(histogram.total, 6), **labels))
+    lines.append(_sample(f"{name}_count", histogram.count, **labels))
+    return lines
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """요청별 지연시간과 SQL 통계를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app, registry: MetricsRegistry = registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope["path"])
+        token = _current_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            route = scope.get("route")
+            # 매칭되지 않은 경로는 하나로 묶어 라벨 수 폭증 방지
+            stats.route = getattr(route, "path", None) or "unmatched"
+            self.registry.record_request(
+                scope["method"], stats.route, status_code, time.perf_counter() - start, stats
+            )
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(statement: str) -> str:
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _parameter_types(parameters, executemany: bool) -> str:
+    """바인딩 값의 개수와 타입만 (값에는 비밀번호 해시, 토큰, 메시지 내용이 있으므로 기록하지 않음)"""
+    if executemany:
+        return f"{len(parameters)} rows"
+    values = parameters.values() if isinstance(parameters, dict) else parameters or ()
+    return f"{len(values)} ({', '.join(type(value).__name__ for value in values)})"
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    # 이벤트가 다시 발생하지 않도록 DBAPI 커서로 직접 실행
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "; ".join(" ".join(str(col) for col in row) for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def instrument_engine(engine, registry: MetricsRegistry = registry) -> None:
+    """엔진에 SQL 계측 이벤트 훅 등록"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.sql_seconds += elapsed
+            stats.statement_counts[_normalize(statement)] += 1
+
+        if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+            with registry._lock:
+                registry.slow_queries += 1
+            plan = ""
+            if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                try:
+                    plan = _explain(conn, statement, parameters)
+                except Exception as e:  # 계획 조회 실패가 요청을 깨뜨리지 않도록
+                    plan = f"<explain failed: {e}>"
+            logger.warning(
+                "Slow query (%.1f ms) on %s: %s | params=%s | plan=%s",
+                elapsed * 1000, stats.path if stats else "-", _normalize(statement),
+                _parameter_types(parameters, executemany), plan
+            )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, LargeBinary, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, LargeBinary, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -17,6 +17,7 @@ class User(Base):
     skills = Column(Text)  # comma-separated skills for mentors
     profile_image = Column(LargeBinary)
     created_at = Column(DateTime, default=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1)  # 수정될 때마다 증가 (ETag 용)
     
     # 관계 설정
     sent_requests = relationship("MatchRequest", foreign_keys="MatchRequest.mentee_id", back_populates="mentee")
@@ -29,18 +30,46 @@ class MatchRequest(Base):
     mentor_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     mentee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     message = Column(Text, nullable=False)
-    status = Column(String(50), default="pending")  # "pending", "accepted", "rejected", "cancelled"
+    status = Column(String(50), default="pending")  # "pending", "accepted", "rejected", "cancelled", "expired"
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # 관계 설정
     mentor = relationship("User", foreign_keys=[mentor_id], back_populates="received_requests")
     mentee = relationship("User", foreign_keys=[mentee_id], back_populates="sent_requests")
+    
+    # 상태별 요청 목록/개수 조회용 (받은 요청, 보낸 요청)
+    __table_args__ = (
+        Index("ix_match_requests_mentor_status_created", "mentor_id", "status", "created_at"),
+        Index("ix_match_requests_mentee_status_created", "mentee_id", "status", "created_at"),
+    )
+
+class Conversation(Base):
+    """두 사용자 사이의 대화 (작은 ID, 큰 ID 순서쌍이 키)
+
+    메시지는 conversation_id 로 대화에 속하므로 대화 기록은 (conversation_id, id) 인덱스 범위
+    하나로 읽고, 대화 목록은 이 테이블에서 바로 최근 순으로 읽는다.
+    """
+    __tablename__ = "conversations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    min_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    max_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_message_at = Column(DateTime, default=datetime.utcnow)
+    archived_through_id = Column(Integer)  # 보관 파일로 옮긴 가장 큰 메시지 ID (없으면 보관된 적 없음, archive.py)
+    
+    __table_args__ = (
+        UniqueConstraint("min_user_id", "max_user_id", name="uq_conversations_pair"),
+        Index("ix_conversations_min_user_last", "min_user_id", "last_message_at"),
+        Index("ix_conversations_max_user_last", "max_user_id", "last_message_at"),
+    )
 
 class Message(Base):
     __tablename__ = "messages"
     
     id = Column(Integer, primary_key=True, index=True)
+    conversation_id = Column(Integer, ForeignKey("conversations.id"))
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
@@ -50,3 +79,72 @@ class Message(Base):
     # 관계 설정
     sender = relationship("User", foreign_keys=[sender_id])
     receiver = relationship("User", foreign_keys=[receiver_id])
+    
+    # 대화 기록(최신순 페이지)과 읽지 않은 메시지 수 조회용
+    __table_args__ = (
+        Index("ix_messages_conversation_id", "conversation_id", "id"),
+        Index("ix_messages_receiver_unread", "receiver_id", "is_read", "conversation_id"),
+    )
+
+class MessageArchive(Base):
+    """월별 메시지 보관 파일 목록 (archive.py)"""
+    __tablename__ = "message_archives"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(String(7), unique=True, nullable=False)  # "YYYY-MM"
+    filename = Column(String(255), nullable=False)
+    rows = Column(Integer, nullable=False, default=0)
+    min_id = Column(Integer)
+    max_id = Column(Integer)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RefreshToken(Base):
+    """리프레시 토큰 (원문 대신 SHA-256 해시 저장)
+
+    사용할 때마다 새 토큰으로 교체(rotation)되며, 같은 로그인에서 이어진 토큰은 family_id 를
+    공유한다. 이미 교체된 토큰이 다시 쓰이면 탈취로 보고 family 전체를 폐기한다.
+    """
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False)
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    used_at = Column(DateTime)  # 새 토큰으로 교체된 시각
+    revoked_at = Column(DateTime)  # 로그아웃 또는 재사용 감지로 폐기된 시각
+
+class IdempotencyKey(Base):
+    """Idempotency-Key 로 처리한 POST 요청의 응답 (idempotency.py)
+
+    status_code 가 비어 있으면 처리 중이다. 같은 사용자의 같은 키는 하나만 저장된다.
+    """
+    __tablename__ = "idempotency_keys"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    key = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)  # 메서드, 경로, 본문의 SHA-256
+    status_code = Column(Integer)
+    content_type = Column(String(100))
+    response_body = Column(LargeBinary)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    
+    __table_args__ = (UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),)
+
+class MaintenanceJob(Base):
+    """주기 작업 일정과 실행 임대(lease) (maintenance.py)
+
+    lease_expires_at 이 지나지 않은 동안에는 owner 워커만 작업을 실행한다.
+    """
+    __tablename__ = "maintenance_jobs"
+    
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(255))
+    lease_expires_at = Column(DateTime)
+    next_run_at = Column(DateTime)
+    last_finished_at = Column(DateTime)
+    last_status = Column(String(20))  # "ok" or "error"
+    last_rows = Column(Integer)
@@ -0,0 +1,213 @@
+"""
+쓰기 엔드포인트 요청 제한
+
+토큰 버킷 방식으로 사용자(JWT 의 sub) 또는 IP(로그인) 단위 요청 수를 제한한다.
+한도를 넘으면 crud 에 도달하기 전에 429 와 Retry-After 를 반환한다.
+RATE_LIMIT_BACKEND_URL(예: redis://localhost:6379/0)을 설정하면 여러 워커가 같은
+버킷을 공유한다.
+
+한도는 "용량/초" 형식의 환경변수로 지정한다. 예: RATE_LIMIT_MESSAGES=30/60 은
+60초 동안 30회(순간적으로는 최대 30회 연속) 허용.
+"""
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response, status
+
+from auth import verify_token
+from metrics import counter_lines
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+RATE_LIMIT_BACKEND_URL = os.getenv("RATE_LIMIT_BACKEND_URL")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# 리버스 프록시 뒤에서는 X-Forwarded-For 의 첫 주소를 클라이언트 IP 로 사용
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "0") == "1"
+
+
+def parse_limit(value: str) -> Tuple[int, float]:
+    """"용량/초" 문자열을 (용량, 초당 충전량) 으로 변환"""
+    capacity, _, seconds = value.partition("/")
+    capacity = int(capacity)
+    return capacity, capacity / float(seconds or 1)
+
+
+DEFAULT_LIMITS = {
+    "login": parse_limit(os.getenv("RATE_LIMIT_LOGIN", "10/60")),
+    "messages": parse_limit(os.getenv("RATE_LIMIT_MESSAGES", "30/60")),
+    "match_requests": parse_limit(os.getenv("RATE_LIMIT_MATCH_REQUESTS", "10/60")),
+    "export": parse_limit(os.getenv("RATE_LIMIT_EXPORT", "5/3600")),
+}
+
+
+class MemoryRateLimitBackend:
+    """프로세스 내 토큰 버킷 저장소"""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, capacity: int, rate: float, cost: int = 1) -> Tuple[bool, float, float]:
+        """토큰 소비 시도 -> (허용 여부, 재시도까지 남은 초, 남은 토큰)"""
+        now = self.clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens >= cost:
+                tokens -= cost
+                allowed, retry_after = True, 0.0
+            else:
+                allowed, retry_after = False, (cost - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._prune()
+            return allowed, retry_after, tokens
+
+    def _prune(self) -> None:
+        # 가장 오래 전에 갱신된 버킷부터 절반 제거 (오래된 버킷은 이미 가득 찼을 가능성이 높음)
+        oldest = sorted(self._buckets.items(), key=lambda item: item[1][1])
+        for key, _ in oldest[: len(oldest) // 2]:
+            del self._buckets[key]
+
+
+class RedisRateLimitBackend:
+    """여러 워커가 공유하는 Redis 토큰 버킷 저장소 (redis 패키지 필요)"""
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local cost = tonumber(ARGV[4])
+    local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local allowed = 0
+    local retry = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+        allowed = 1
+    else
+        retry = (cost - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(retry), tostring(tokens)}
+    """
+
+    def __init__(self, url: str, namespace: str = "ratelimit"):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+        self._namespace = namespace
+
+    def consume(self, key: str, capacity: int, rate: float, cost: int = 1) -> Tuple[bool, float, float]:
+        allowed, retry_after, tokens = self._script(
+            keys=[f"{self._namespace}:{key}"], args=[capacity, rate, time.time(), cost]
+        )
+        return bool(allowed), float(retry_after), float(tokens)
+
+
+class RateLimiter:
+    """범위(scope)별 한도와 허용/거부 카운터를 가진 요청 제한기"""
+
+    def __init__(self, backend, limits: dict):
+        self.backend = backend
+        self.limits = dict(limits)
+        self.allowed = defaultdict(int)
+        self.limited = defaultdict(int)
+
+    def hit(self, scope: str, identity: str) -> Tuple[bool, float, float]:
+        capacity, rate = self.limits[scope]
+        allowed, retry_after, remaining = self.backend.consume(f"{scope}:{identity}", capacity, rate)
+        if allowed:
+            self.allowed[scope] += 1
+        else:
+            self.limited[scope] += 1
+        return allowed, retry_after, remaining
+
+    def snapshot(self) -> dict:
+        return {
+            scope: {
+                "capacity": capacity,
+                "refill_per_second": rate,
+                "allowed": self.allowed[scope],
+                "limited": self.limited[scope],
+            }
+            for scope, (capacity, rate) in self.limits.items()
+        }
+
+    def metrics_lines(self) -> list:
+        samples = []
+        for scope in self.limits:
+            samples.append(({"scope": scope, "result": "allowed"}, self.allowed[scope]))
+            samples.append(({"scope": scope, "result": "limited"}, self.limited[scope]))
+        return counter_lines("rate_limit_decisions_total", "Rate limiter decisions by scope", samples)
+
+
+def _create_backend():
+    if RATE_LIMIT_BACKEND_URL:
+        return RedisRateLimitBackend(RATE_LIMIT_BACKEND_URL)
+    return MemoryRateLimitBackend()
+
+
+rate_limiter = RateLimiter(_create_backend(), DEFAULT_LIMITS)
+
+
+def client_ip(request: Request) -> str:
+    """요청한 클라이언트 IP"""
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    # DB 조회 없이 JWT 서명만 검증해 사용자 식별
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token)
+    return payload.get("sub") if payload else None
+
+
+def rate_limit(scope: str, by: str = "user"):
+    """경로 dependencies 에 넣어 쓰는 요청 제한 의존성
+
+    by="user" 는 JWT 의 사용자 ID, by="ip" 는 클라이언트 IP 기준이다.
+    토큰이 없거나 잘못된 경우에는 IP 기준으로 제한한다.
+    """
+    async def dependency(request: Request, response: Response):
+        if not RATE_LIMIT_ENABLED:
+            return
+        identity = None
+        if by == "user":
+            subject = _token_subject(request)
+            identity = f"user:{subject}" if subject else None
+        if identity is None:
+            identity = f"ip:{client_ip(request)}"
+
+        allowed, retry_after, remaining = rate_limiter.hit(scope, identity)
+        capacity, _ = rate_limiter.limits[scope]
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={
+                    "Retry-After": str(max(1, math.ceil(retry_after))),
+                    "X-RateLimit-Limit": str(capacity),
+                    "X-RateLimit-Remaining": "0",
+                },
+            )
+        response.headers["X-RateLimit-Limit"] = str(capacity)
+        response.headers["X-RateLimit-Remaining"] = str(int(remaining))
+
+    return dependency
@@ -16,6 +16,11 @@ class UserLogin(BaseModel):
 # 토큰 응답 스키마
 class TokenResponse(BaseModel):
     token: str
+    refreshToken: Optional[str] = None
+
+# 리프레시 토큰 요청 스키마 (갱신, 로그아웃)
+class RefreshTokenRequest(BaseModel):
+    refreshToken: str
 
 # 프로필 스키마
 class ProfileData(BaseModel):
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+대용량 시드 데이터 생성
+
+멘토/멘티, 매칭 요청, 메시지를 Core 일괄 삽입(executemany)으로 생성한다. 비밀번호 해시는
+한 번만 계산해 모든 사용자가 공유하므로 bcrypt 비용이 사용자 수에 비례하지 않는다.
+같은 --seed 와 --base-time 이면 같은 데이터가 만들어진다 (bcrypt 솔트 제외).
+
+대화 크기는 Zipf 분포를 따라 소수의 대화에 메시지가 몰린다.
+
+    python seed.py --mentors 2000 --mentees 20000 --requests 50000 --messages 10000000
+    python seed.py --database sqlite:///./load.db --messages 1000000 --seed 7
+"""
+import argparse
+import io
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, NamedTuple
+
+from sqlalchemy import create_engine, event, insert, select
+
+from models import MatchRequest, Message, User
+
+DEFAULT_PASSWORD = "password123"
+DEFAULT_BASE_TIME = "2026-01-01T00:00:00"
+
+SKILLS = [
+    ("Python", 10), ("JavaScript", 10), ("React", 9), ("Java", 8), ("Spring", 6),
+    ("Node.js", 7), ("TypeScript", 7), ("Go", 4), ("Kotlin", 4), ("Swift", 3),
+    ("FastAPI", 3), ("Django", 4), ("Docker", 6), ("Kubernetes", 4), ("AWS", 6),
+    ("SQL", 7), ("Machine Learning", 5), ("Data Engineering", 3), ("Vue", 4), ("Flutter", 2),
+]
+LAST_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권"]
+FIRST_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "시우", "지민", "주원", "하은", "지호", "수아"]
+BIO_TEMPLATES = [
+    "{years}년차 {field} 개발자입니다. {skill} 위주로 멘토링합니다.",
+    "{field} 분야에서 {years}년간 일했습니다. 실무 중심으로 {skill}을(를) 알려드려요.",
+    "스타트업과 대기업에서 {years}년 경력. 코드 리뷰와 {skill} 설계를 좋아합니다.",
+]
+MENTEE_BIOS = [
+    "{skill}을(를) 배우고 있는 주니어 개발자입니다.",
+    "비전공자로 {skill} 공부 중입니다. 진로 상담도 부탁드려요.",
+    "",
+]
+FIELDS = ["백엔드", "프론트엔드", "모바일", "데이터", "인프라", "풀스택"]
+MESSAGE_TEMPLATES = [
+    "안녕하세요! 질문이 있습니다.", "감사합니다 :)", "오늘 일정 괜찮으세요?",
+    "코드 리뷰 부탁드려도 될까요?", "자료 공유드립니다.", "네, 확인했습니다.",
+    "다음 주에 다시 이야기 나눠요.", "이 부분이 잘 이해가 안 됩니다.",
+]
+REQUEST_MESSAGES = [
+    "멘토링 부탁드립니다!", "{skill} 공부 방향을 잡고 싶습니다.", "포트폴리오 피드백을 받고 싶어요.",
+]
+
+
+class SeedResult(NamedTuple):
+    mentor_ids: List[int]
+    mentee_ids: List[int]
+    match_requests: int
+    messages: int
+
+
+def seed_email(role: str, index: int) -> str:
+    """시드 사용자 이메일 (로그인 테스트에서 재사용)"""
+    return f"{role}{index}@seed.example.com"
+
+
+def _make_images(rng: random.Random, count: int) -> List[bytes]:
+    """프로필용 JPEG 이미지 몇 장 생성 (사용자들이 돌려 씀)"""
+    from PIL import Image, ImageDraw
+
+    images = []
+    for _ in range(count):
+        img = Image.new("RGB", (500, 500), tuple(rng.randint(40, 220) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(12):
+            x, y = rng.randint(0, 450), rng.randint(0, 450)
+            size = rng.randint(20, 160)
+            draw.ellipse((x, y, x + size, y + size), fill=tuple(rng.randint(0, 255) for _ in range(3)))
+        output = io.BytesIO()
+        img.save(output, format="JPEG", quality=85)
+        images.append(output.getvalue())
+    return images
+
+
+def _zipf_sizes(rng: random.Random, total: int, buckets: int, exponent: float) -> List[int]:
+    """total 을 Zipf 분포에 따라 buckets 개로 나눔"""
+    weights = [1.0 / (rank ** exponent) for rank in range(1, buckets + 1)]
+    rng.shuffle(weights)
+    weight_sum = sum(weights)
+    sizes = [int(total * w / weight_sum) for w in weights]
+    for i in range(total - sum(sizes)):
+        sizes[i % buckets] += 1
+    return sizes
+
+
+def _chunks(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _speed_up_sqlite(engine):
+    # 시드 중에는 내구성보다 속도 우선 (연결 단위 설정)
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def seed_users(connection, rng, mentors, mentees, password_hash, base_time, images, batch_size):
+    skill_names = [s for s, _ in SKILLS]
+    skill_weights = [w for _, w in SKILLS]
+
+    def rows():
+        for role, count in (("mentor", mentors), ("mentee", mentees)):
+            for i in range(count):
+                picked = []
+                for skill in rng.choices(skill_names, skill_weights, k=rng.randint(2, 5)):
+                    if skill not in picked:
+                        picked.append(skill)
+                template = rng.choice(BIO_TEMPLATES if role == "mentor" else MENTEE_BIOS)
+                yield {
+                    "email": seed_email(role, i),
+                    "password_hash": password_hash,
+                    "name": rng.choice(LAST_NAMES) + rng.choice(FIRST_NAMES),
+                    "role": role,
+                    "bio": template.format(
+                        years=rng.randint(1, 20), field=rng.choice(FIELDS), skill=picked[0]
+                    ),
+                    "skills": ",".join(picked) if role == "mentor" else None,
+                    "profile_image": rng.choice(images) if images and rng.random() < 0.3 else None,
+                    "created_at": base_time - timedelta(days=rng.randint(30, 720)),
+                    "version": 1,
+                }
+
+    for batch in _chunks(rows(), batch_size):
+        connection.execute(insert(User), batch)
+
+    user_rows = connection.execute(select(User.id, User.role).order_by(User.id)).all()
+    mentor_ids = [r.id for r in user_rows if r.role == "mentor"]
+    mentee_ids = [r.id for r in user_rows if r.role == "mentee"]
+    return mentor_ids, mentee_ids
+
+
+def seed_match_requests(connection, rng, count, mentor_ids, mentee_ids, base_time, batch_size):
+    if not count or not mentor_ids or not mentee_ids:
+        return 0
+    pending_mentees = set()
+
+    def rows():
+        for _ in range(count):
+            mentee_id = rng.choice(mentee_ids)
+            mentor_id = rng.choice(mentor_ids)
+            # 멘티당 대기중 요청은 하나만 (create_match_request 와 같은 규칙)
+            status = rng.choices(["pending", "accepted", "rejected", "cancelled"], [4, 1, 4, 1])[0]
+            if status == "pending":
+                if mentee_id in pending_mentees:
+                    status = "rejected"
+                else:
+                    pending_mentees.add(mentee_id)
+            created = base_time - timedelta(minutes=rng.randint(0, 60 * 24 * 180))
+            yield {
+                "mentor_id": mentor_id,
+                "mentee_id": mentee_id,
+                "message": rng.choice(REQUEST_MESSAGES).format(skill=rng.choice(SKILLS)[0]),
+                "status": status,
+                "created_at": created,
+                "updated_at": created if status == "pending" else created + timedelta(hours=rng.randint(1, 72)),
+            }
+
+    for batch in _chunks(rows(), batch_size):
+        connection.execute(insert(MatchRequest), batch)
+    return count
+
+
+def seed_messages(connection, rng, count, mentor_ids, mentee_ids, base_time, batch_size,
+                  conversations=None, exponent=1.1, progress=None):
+    if not count or not mentor_ids or not mentee_ids:
+        return 0
+    # 서로 다른 (멘티, 멘토) 쌍 수보다 많이 요청하면 쌍을 더 뽑을 수 없으므로 그 수로 제한
+    conversations = max(1, min(conversations or count // 20, len(mentor_ids) * len(mentee_ids)))
+    pairs = set()
+    while len(pairs) < conversations:
+        pairs.add((rng.choice(mentee_ids), rng.choice(mentor_ids)))
+    pairs = sorted(pairs)
+    sizes = _zipf_sizes(rng, count, len(pairs), exponent)
+
+    def rows():
+        for (mentee_id, mentor_id), size in zip(pairs, sizes):
+            if not size:
+                continue
+            # 대화는 최근 1년 안에서 시작해 최대 size 분 간격으로 이어짐
+            created = base_time - timedelta(minutes=rng.randint(size, 60 * 24 * 365 + size))
+            for _ in range(size):
+                created += timedelta(seconds=rng.randint(5, 3600))
+                sender, receiver = (mentee_id, mentor_id) if rng.random() < 0.5 else (mentor_id, mentee_id)
+                yield {
+                    "sender_id": sender,
+                    "receiver_id": receiver,
+                    "content": rng.choice(MESSAGE_TEMPLATES),
+                    "is_read": 1 if rng.random() < 0.9 else 0,
+                    "created_at": created,
+                }
+
+    inserted = 0
+    for batch in _chunks(rows(), batch_size):
+        connection.execute(insert(Message), batch)
+        connection.commit()
+        inserted += len(batch)
+        if progress:
+            progress(inserted, count)
+    return inserted
+
+
+def seed_database(
+    engine, mentors: int, mentees: int, match_requests: int = 0, messages: int = 0,
+    seed: int = 42, password: str = DEFAULT_PASSWORD, base_time: datetime = None,
+    batch_size: int = 20000, images: int = 8, conversations: int = None, progress=None
+) -> SeedResult:
+    """데이터베이스에 시드 데이터 생성"""
+    from auth import get_password_hash
+    from database import backfill_conversations, init_db
+
+    init_db(engine)
+
+    rng = random.Random(seed)
+    base_time = base_time or datetime.fromisoformat(DEFAULT_BASE_TIME)
+    password_hash = get_password_hash(password)
+    image_blobs = _make_images(rng, images) if images else []
+
+    with engine.begin() as connection:
+        mentor_ids, mentee_ids = seed_users(
+            connection, rng, mentors, mentees, password_hash, base_time, image_blobs, batch_size
+        )
+        request_count = seed_match_requests(
+            connection, rng, match_requests, mentor_ids, mentee_ids, base_time, batch_size
+        )
+
+    # 메시지는 배치마다 커밋해 트랜잭션이 지나치게 커지지 않도록 함
+    with engine.connect() as connection:
+        message_count = seed_messages(
+            connection, rng, messages, mentor_ids, mentee_ids, base_time, batch_size,
+            conversations=conversations, progress=progress
+        )
+    # 메시지는 conversation_id 없이 넣고 대화는 마이그레이션과 같은 방식으로 한 번에 연결
+    backfill_conversations(engine, batch_size)
+
+    return SeedResult(mentor_ids, mentee_ids, request_count, message_count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 시드 데이터 생성")
+    parser.add_argument("--database", default=None, help="데이터베이스 URL (기본: DATABASE_URL)")
+    parser.add_argument("--mentors", type=int, default=1000)
+    parser.add_argument("--mentees", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=1000000)
+    parser.add_argument("--conversations", type=int, default=None, help="대화 수 (기본: 메시지 수 / 20)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--base-time", default=DEFAULT_BASE_TIME, help="데이터 기준 시각 (ISO 8601)")
+    parser.add_argument("--batch-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.database:
+        url = args.database
+    else:
+        from database import SQLALCHEMY_DATABASE_URL as url
+    engine = create_engine(url)
+    _speed_up_sqlite(engine)
+
+    started = time.perf_counter()
+
+    def progress(done, total):
+        elapsed = time.perf_counter() - started
+        sys.stdout.write(f"\r메시지 {done:,}/{total:,} ({done / max(elapsed, 1e-9):,.0f} rows/s)")
+        sys.stdout.flush()
+
+    result = seed_database(
+        engine, args.mentors, args.mentees, args.requests, args.messages,
+        seed=args.seed, password=args.password,
+        base_time=datetime.fromisoformat(args.base_time),
+        batch_size=args.batch_size, conversations=args.conversations, progress=progress,
+    )
+    print(
+        f"\n완료: 멘토 {len(result.mentor_ids):,}, 멘티 {len(result.mentee_ids):,}, "
+        f"요청 {result.match_requests:,}, 메시지 {result.messages:,} "
+        f"({time.perf_counter() - started:.1f}초, 비밀번호: {args.password})"
+    )
+
+
+if __name__ == "__main__":
+    main()
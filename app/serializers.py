@@ -0,0 +1,79 @@
+"""
+목록 응답 직렬화
+
+목록 엔드포인트는 조회한 행을 pydantic 모델로 만들지 않고 바로 dict 로 변환한 뒤
+FastJSONResponse 로 반환한다. Response 객체를 직접 반환하면 FastAPI 가
+response_model 검증을 다시 수행하지 않으므로 이중 검증 비용이 사라진다.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+import avatars
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 사용
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def user_to_dict(user) -> dict:
+    """사용자 행을 UserResponse 형태의 dict 로 변환 (imageUrl 은 서명된 URL, 행에 version 필요)"""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "role": user.role,
+        "profile": {
+            "name": user.name,
+            "bio": user.bio or "",
+            "imageUrl": avatars.signed_url(user.id, user.version),
+            "skills": user.skills.split(",") if user.skills else []
+        }
+    }
+
+
+def match_request_to_dict(match_request) -> dict:
+    """매칭 요청 행을 MatchRequestResponse 형태의 dict 로 변환"""
+    return {
+        "id": match_request.id,
+        "mentorId": match_request.mentor_id,
+        "menteeId": match_request.mentee_id,
+        "message": match_request.message,
+        "status": match_request.status
+    }
+
+
+def message_to_dict(message, sender_name: str, receiver_name: str) -> dict:
+    """메시지 행을 MessageResponse 형태의 dict 로 변환"""
+    return {
+        "id": message.id,
+        "sender_id": message.sender_id,
+        "receiver_id": message.receiver_id,
+        "content": message.content,
+        "is_read": bool(message.is_read),
+        "created_at": message.created_at.isoformat(),
+        "sender_name": sender_name,
+        "receiver_name": receiver_name
+    }
+
+
+def conversation_to_dict(conversation) -> dict:
+    """대화 행을 ConversationResponse 형태의 dict 로 변환"""
+    return {
+        "user_id": conversation.other_user_id,
+        "user_name": conversation.user_name,
+        "user_role": conversation.user_role,
+        "last_message": conversation.last_message,
+        "last_message_time": conversation.last_message_time.isoformat() if conversation.last_message_time else None,
+        "unread_count": conversation.unread_count
+    }
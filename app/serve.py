@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+운영용 서버 실행 스크립트
+
+uvicorn 을 여러 워커 프로세스로 실행한다. 데이터베이스 초기화(init_db, 마이그레이션)는
+워커를 띄우기 전에 마스터 프로세스에서 한 번만 수행하고, 워커는 SERVER_DB_READY
+환경변수를 보고 시작 시 초기화를 건너뛴다.
+
+    python serve.py                      # WEB_CONCURRENCY 또는 CPU 수만큼 워커
+    python serve.py --workers 4 --port 8080
+
+종료 신호(SIGTERM/SIGINT)를 받으면 새 연결을 받지 않고 진행 중인 요청을
+SERVER_GRACEFUL_TIMEOUT 초까지 기다린 뒤 종료한다. 로드밸런서는 GET /health/ready 로
+트래픽을 보낼지 판단한다.
+"""
+import argparse
+import logging
+import os
+
+logger = logging.getLogger("serve")
+
+# 서버 설정
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "0"))  # 0 이면 CPU 수
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+SERVER_KEEPALIVE_TIMEOUT = int(os.getenv("SERVER_KEEPALIVE_TIMEOUT", "5"))
+SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", "2048"))
+# 메모리 누수 대비 워커 재시작 주기 (0 이면 비활성화)
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "0"))
+SERVER_LOG_LEVEL = os.getenv("SERVER_LOG_LEVEL", "info")
+# 여러 워커가 프로세스 내 캐시를 쓸 때의 기본 TTL (CACHE_TTL_SECONDS 로 변경 가능)
+MULTI_WORKER_CACHE_TTL = 10
+
+
+def default_workers() -> int:
+    return WEB_CONCURRENCY or os.cpu_count() or 1
+
+
+def event_loop() -> str:
+    """uvloop 이 설치되어 있으면 사용"""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
+def http_protocol() -> str:
+    """httptools 가 설치되어 있으면 사용"""
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "h11"
+    return "httptools"
+
+
+def prepare(workers: int, preload: bool = True) -> None:
+    """워커 실행 전 마스터에서 한 번만 하는 준비 작업"""
+    from database import init_db
+
+    init_db()
+    # 워커는 이미 초기화된 DB 를 사용 (main.py 의 startup 이벤트가 확인)
+    os.environ["SERVER_DB_READY"] = "1"
+
+    if workers > 1:
+        # 공유 백엔드가 없으면 워커마다 따로 캐시하므로 다른 워커의 변경이 TTL 뒤에 반영됨
+        if not os.getenv("CACHE_BACKEND_URL"):
+            os.environ.setdefault("CACHE_TTL_SECONDS", str(MULTI_WORKER_CACHE_TTL))
+            # 멘토 디렉터리도 같은 주기로 다른 워커의 변경을 반영
+            os.environ.setdefault("MENTOR_DIRECTORY_REFRESH_SECONDS", str(MULTI_WORKER_CACHE_TTL))
+            logger.warning(
+                "CACHE_BACKEND_URL is not set: response cache is per worker (TTL %ss)",
+                os.environ["CACHE_TTL_SECONDS"],
+            )
+        if not os.getenv("RATE_LIMIT_BACKEND_URL"):
+            logger.warning("RATE_LIMIT_BACKEND_URL is not set: rate limits are counted per worker")
+
+    if preload:
+        # 앱 import 오류를 워커 실행 전에 드러냄. 워커가 하나면 이 모듈을 그대로 사용하고,
+        # 여럿이면 각 워커가 spawn 된 프로세스에서 다시 import 한다.
+        import main  # noqa: F401
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="멘토-멘티 매칭 API 서버 실행")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--no-preload", action="store_true", help="마스터에서 앱을 미리 import 하지 않음")
+    parser.add_argument("--log-level", default=SERVER_LOG_LEVEL)
+    return parser.parse_args()
+
+
+def main():
+    import uvicorn
+
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+    prepare(args.workers, preload=not args.no_preload)
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=SERVER_BACKLOG,
+        timeout_keep_alive=SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=SERVER_MAX_REQUESTS or None,
+        log_level=args.log_level,
+        access_log=False,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
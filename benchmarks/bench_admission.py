@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+과부하에서 수용 제어 유무에 따른 지연시간
+
+처리 용량이 정해진 가짜 앱(동시에 --capacity 개까지 병렬, 넘으면 느려짐)에 처리량보다 많은
+요청을 일정 간격으로 보낸다. 제한이 없으면 모든 요청의 지연시간이 함께 늘어나고, 제한이 있으면
+받아들인 요청은 짧은 지연시간을 유지하고 나머지는 바로 503 을 받는다.
+
+    python benchmarks/bench_admission.py [--rate 400] [--duration 3] [--service-ms 20] [--capacity 4]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from admission import AdmissionController, AdmissionMiddleware  # noqa: E402
+
+
+class _SaturatingApp:
+    """동시 요청이 capacity 를 넘으면 요청마다 처리 시간이 비례해 늘어나는 앱 (CPU/DB 경합 흉내)"""
+
+    def __init__(self, service_seconds: float, capacity: int):
+        self.service_seconds = service_seconds
+        self.capacity = capacity
+        self.running = 0
+
+    async def __call__(self, scope, receive, send):
+        self.running += 1
+        try:
+            await asyncio.sleep(self.service_seconds * max(1.0, self.running / self.capacity))
+        finally:
+            self.running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _request(app):
+    scope = {"type": "http", "method": "GET", "path": "/api/mentors", "headers": []}
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    return status[0], time.perf_counter() - started
+
+
+async def run(app, rate: float, duration: float) -> list:
+    tasks = []
+    interval = 1 / rate
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        tasks.append(asyncio.create_task(_request(app)))
+        await asyncio.sleep(interval)
+    return await asyncio.gather(*tasks)
+
+
+def summarize(name: str, results: list) -> None:
+    served = sorted(seconds for status, seconds in results if status == 200)
+    shed = sum(1 for status, _ in results if status == 503)
+    p95 = served[min(len(served) - 1, int(len(served) * 0.95))] if served else 0
+    print(
+        f"{name:<14}{len(served):>8}{shed:>8}"
+        f"{statistics.median(served) * 1000 if served else 0:>10.1f}ms{p95 * 1000:>10.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=400, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--service-ms", type=float, default=20, help="요청 하나의 처리 시간")
+    parser.add_argument("--capacity", type=int, default=4, help="처리 시간이 늘지 않는 동시 요청 수")
+    parser.add_argument("--queue", type=int, default=16, help="수용 제어 대기열 길이")
+    parser.add_argument("--timeout", type=float, default=0.2, help="수용 제어 대기 시간(초)")
+    args = parser.parse_args()
+
+    print(f"rate={args.rate:g}/s  capacity={args.capacity / args.service_ms * 1000:g}/s")
+    print(f"{'mode':<14}{'served':>8}{'503':>8}{'p50':>12}{'p95':>12}")
+    unlimited = _SaturatingApp(args.service_ms / 1000, args.capacity)
+    summarize("no limit", asyncio.run(run(unlimited, args.rate, args.duration)))
+
+    limited = AdmissionMiddleware(
+        _SaturatingApp(args.service_ms / 1000, args.capacity),
+        controller=AdmissionController({"reads": (args.capacity, args.queue, args.timeout)}),
+        enabled=True,
+    )
+    summarize("admission", asyncio.run(run(limited, args.rate, args.duration)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+워커 콜드 스타트 측정
+
+serve.py 로 워커 하나짜리 서버를 여러 번 새로 띄우고, 프로세스 시작부터
+- /health/ready 가 200 을 반환할 때까지 (준비 완료)
+- 인증이 필요한 첫 요청(GET /api/mentors)이 성공할 때까지 (첫 사용자 요청)
+걸린 시간을 측정한다. 첫 요청에는 JWT 라이브러리처럼 지연 import 되는 모듈의 비용이 포함된다.
+앱 모듈 import 시간(python -c "import main")도 따로 측정한다.
+
+    python benchmarks/bench_cold_start.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.append(APP_DIR)
+
+
+def measure_import(env) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import main"], cwd=APP_DIR, env=env, check=True)
+    return time.perf_counter() - started
+
+
+def measure_start(env, port: int, token: str):
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", "1", "--log-level", "warning"],
+        cwd=APP_DIR, env=env,
+    )
+    ready = first = None
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=10) as client:
+            while time.perf_counter() - started < 30:
+                try:
+                    if client.get("/health/ready").status_code == 200:
+                        ready = time.perf_counter() - started
+                        break
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+            if ready is None:
+                raise RuntimeError("server did not become ready")
+            response = client.get("/api/mentors", headers={"Authorization": f"Bearer {token}"})
+            response.raise_for_status()
+            first = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return ready, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8098)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(prefix="mentor-bench-"), "cold.db")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{database}", RATE_LIMIT_ENABLED="0")
+    os.environ.update(env)
+
+    from auth import create_access_token
+    from database import SessionLocal, init_db
+    from crud import create_user
+
+    init_db()
+    with SessionLocal() as db:
+        user = create_user(db, "cold@bench.com", "x", "cold start", "mentee")
+    token = create_access_token({"sub": str(user.id), "email": user.email, "name": user.name, "role": "mentee"})
+
+    imports, readies, firsts = [], [], []
+    for run in range(args.runs):
+        imports.append(measure_import(env))
+        ready, first = measure_start(env, args.port, token)
+        readies.append(ready)
+        firsts.append(first)
+        print(f"run {run + 1}: import {imports[-1] * 1000:.0f}ms, ready {ready * 1000:.0f}ms, "
+              f"first request {first * 1000:.0f}ms")
+
+    print(f"\n{'':<16}{'median':>10}{'max':>10}")
+    for label, values in (("import main", imports), ("ready", readies), ("first request", firsts)):
+        print(f"{label:<16}{statistics.median(values) * 1000:>8.0f}ms{max(values) * 1000:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+내보내기 메모리 사용량 측정
+
+메시지 수를 바꿔 가며 시드한 DB 를 전체 내보내기(stream_export)로 끝까지 읽고, tracemalloc 으로
+측정한 최대 메모리와 처리 속도를 출력한다. 스트리밍이 제대로 동작하면 최대 메모리는 기록
+크기와 관계없이 거의 같아야 한다.
+
+    python benchmarks/bench_export.py --sizes 10000,100000,500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.append(APP_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,300000", help="메시지 수 (쉼표 구분)")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="mentor-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{directory}/export.db"
+
+    from sqlalchemy import delete
+
+    import export
+    from database import engine
+    from models import Message
+    from seed import seed_database
+
+    seed_database(engine, 100, 400, images=0)
+    print(f"{'messages':>10}{'bytes':>14}{'seconds':>9}{'rows/s':>10}{'peak MiB':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        with engine.begin() as connection:
+            connection.execute(delete(Message))
+        seed_database(engine, 0, 0, messages=size, images=0)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        total = sum(len(chunk) for chunk in export.stream_export(None, args.format))
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{size:>10}{total:>14}{elapsed:>9.2f}{size / elapsed:>10.0f}{peak / 2 ** 20:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
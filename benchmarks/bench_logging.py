@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+요청당 로그 비용
+
+AccessLogMiddleware 로 감싼 빈 ASGI 앱에 요청을 보내 요청 하나에 드는 시간을 비교한다.
+
+- off: access 로그 없음 (기준)
+- sync: 핸들러가 요청 처리 중에 직접 파일에 씀 (기존 방식)
+- queue: QueueHandler 로 큐에 넣고 백그라운드 스레드가 씀 (logs.setup_logging)
+- queue+sample: queue 에 성공 응답 표본 추출 (--sample-rate)
+
+--stall-ms 를 주면 쓰기마다 그만큼 멈추는 느린 디스크를 흉내 낸다. sync 는 그 시간이 그대로
+요청 지연에 더해지고, queue 는 큐에 넣는 비용만 남는다.
+
+    python benchmarks/bench_logging.py [--requests 20000] [--stall-ms 2] [--sample-rate 0.1]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+import logs  # noqa: E402
+
+
+class StallingFileHandler(logging.FileHandler):
+    """쓰기마다 stall 초 멈추는 파일 핸들러"""
+
+    def __init__(self, filename, stall: float):
+        super().__init__(filename)
+        self.stall = stall
+
+    def emit(self, record):
+        super().emit(record)
+        self.flush()
+        if self.stall:
+            time.sleep(self.stall)
+
+
+async def empty_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def run_requests(app, count: int) -> list:
+    scope = {"type": "http", "method": "GET", "path": "/api/me", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await app(dict(scope), receive, send)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def measure(mode: str, args, path: str) -> dict:
+    handler = StallingFileHandler(path, args.stall_ms / 1000)
+    handler.setFormatter(logs.JsonFormatter())
+    logger = logging.getLogger("access")
+    sample_rate = args.sample_rate if mode == "queue+sample" else 1.0
+    app = logs.AccessLogMiddleware(empty_app, sample_rate=sample_rate, logger=logger)
+    if mode == "off":
+        app = empty_app
+    elif mode == "sync":
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+    else:
+        logs.setup_logging([handler])
+    try:
+        timings = asyncio.run(run_requests(app, args.requests))
+    finally:
+        drain_started = time.perf_counter()
+        logs.shutdown_logging()
+        drain = time.perf_counter() - drain_started
+        logger.handlers = []
+        logger.propagate = True
+        handler.close()
+    timings.sort()
+    return {
+        "mode": mode,
+        "mean_us": statistics.fmean(timings) * 1e6,
+        "p99_us": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e6,
+        "drain_s": drain,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--stall-ms", type=float, default=0.0, help="쓰기마다 멈추는 시간 (느린 디스크 흉내)")
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="queue+sample 의 성공 응답 기록 비율")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="mentor-bench-log-")
+    rows = [
+        measure(mode, args, os.path.join(directory, f"{mode}.log"))
+        for mode in ("off", "sync", "queue", "queue+sample")
+    ]
+    baseline = rows[0]["mean_us"]
+
+    print(f"requests={args.requests} stall={args.stall_ms}ms sample_rate={args.sample_rate}")
+    print(f"{'mode':<14}{'mean':>10}{'p99':>10}{'overhead':>11}{'drain':>9}")
+    for row in rows:
+        print(
+            f"{row['mode']:<14}{row['mean_us']:>8.1f}us{row['p99_us']:>8.1f}us"
+            f"{row['mean_us'] - baseline:>9.1f}us{row['drain_s']:>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+멘토 디렉터리 메모리 사용량과 조회 시간 측정
+
+시드와 같은 분포(이름, 스킬 조합)의 멘토 행을 만들어 MentorDirectory 에 적재하고, tracemalloc
+으로 측정한 메모리를 행마다 응답 dict(user_to_dict)를 보관하는 경우와 비교한다. 이어서
+스킬 필터/정렬/페이지 조회 시간을 출력한다. DB 는 사용하지 않는다.
+
+    python benchmarks/bench_mentor_directory.py --mentors 100000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.append(APP_DIR)
+
+Row = namedtuple("Row", "id email name bio skills created_at version")
+
+SKILLS = ["Python", "React", "Go", "Kotlin", "Java", "Spring", "Node.js", "TypeScript", "Rust", "AWS", "Docker", "SQL"]
+NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+
+
+def make_rows(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(1, count + 1):
+        yield Row(
+            i, f"mentor{i}@example.com", f"{rng.choice(NAMES)}멘토{i}", f"{i}번 멘토 소개입니다.",
+            ",".join(rng.sample(SKILLS, rng.randint(1, 4))), start + timedelta(minutes=i), 1,
+        )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current
+
+
+def timed(label: str, func, repeat: int = 5):
+    best = min(_once(func) for _ in range(repeat))
+    print(f"  {label:<34}{best * 1000:>9.2f} ms")
+
+
+def _once(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentors", type=int, default=100000)
+    args = parser.parse_args()
+
+    from cache import MemoryCacheBackend, ResponseCache
+    from directory import MentorDirectory
+    from serializers import user_to_dict
+
+    # 행을 측정 안에서 만들어 문자열까지 포함 (DB 에서 읽을 때와 같음)
+    def build_directory():
+        directory = MentorDirectory(ResponseCache(MemoryCacheBackend()))
+        directory.load_rows(make_rows(args.mentors))
+        return directory
+
+    def build_dicts():
+        return [user_to_dict(_UserRow(row)) for row in make_rows(args.mentors)]
+
+    directory, directory_bytes = measure(build_directory)
+    dicts, dict_bytes = measure(build_dicts)
+    del dicts, directory
+    # 적재 시간은 tracemalloc 없이 따로 측정
+    started = time.perf_counter()
+    directory = build_directory()
+    load_seconds = time.perf_counter() - started
+
+    print(f"mentors: {args.mentors}")
+    print(f"{'':<14}{'MiB':>10}{'bytes/mentor':>14}")
+    print(f"{'directory':<14}{directory_bytes / 2 ** 20:>10.1f}{directory_bytes / args.mentors:>14.0f}")
+    print(f"{'dict list':<14}{dict_bytes / 2 ** 20:>10.1f}{dict_bytes / args.mentors:>14.0f}")
+    print(f"load: {load_seconds:.2f}s")
+
+    print("query (best of 5)")
+    timed("skill=python, page 1", lambda: directory.query(None, "python", None, 1, 50))
+    timed("skill=rust, order_by=-name, page 1", lambda: directory.query(None, "rust", "-name", 1, 50))
+    timed("order_by=created, page 100", lambda: directory.query(None, None, "created", 100, 50))
+    timed("skill=py,re (full scan)", lambda: directory.query(None, "py,re", None, 1, 50))
+
+
+class _UserRow:
+    """user_to_dict 에 넘길 사용자 행 (role 포함)"""
+
+    def __init__(self, row):
+        self.id, self.email, self.name, self.bio, self.skills = row.id, row.email, row.name, row.bio, row.skills
+        self.role = "mentor"
+        self.version = row.version
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 설정별 로그인 처리량
+
+해시 방식/비용마다 프로세스 N 개가 동시에 비밀번호를 검증해 초당 로그인 수(전체, 코어당)와
+검증 지연시간을 잰다. 로그인 비용의 대부분이 검증이므로 이 값이 로그인 처리량의 상한이다.
+argon2 설정은 argon2-cffi 가 설치된 경우에만 측정한다.
+
+    python benchmarks/bench_password_hashing.py [--processes 4] [--duration 3]
+    python benchmarks/bench_password_hashing.py --settings bcrypt:10,bcrypt:12,argon2:3:65536:1
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from auth import build_pwd_context  # noqa: E402
+
+DEFAULT_SETTINGS = "bcrypt:10,bcrypt:11,bcrypt:12,bcrypt:13,argon2:2:19456:1,argon2:3:65536:1"
+PASSWORD = "benchmark-password-123"
+
+
+def make_context(setting: str):
+    """"bcrypt:<rounds>" 또는 "argon2:<time_cost>:<memory_kib>:<parallelism>" 해석"""
+    scheme, *params = setting.split(":")
+    if scheme == "bcrypt":
+        return build_pwd_context(["bcrypt"], bcrypt_rounds=int(params[0]))
+    if scheme == "argon2":
+        time_cost, memory_cost, parallelism = (int(p) for p in params)
+        return build_pwd_context(
+            ["argon2"], argon2_time_cost=time_cost, argon2_memory_cost=memory_cost, argon2_parallelism=parallelism
+        )
+    raise ValueError(f"unknown scheme: {scheme}")
+
+
+def verify_loop(args):
+    """duration 초 동안 검증을 반복 -> 검증별 소요 시간 목록"""
+    setting, hashed, duration = args
+    context = make_context(setting)
+    timings = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_setting(pool, setting: str, processes: int, duration: float) -> dict:
+    hashed = make_context(setting).hash(PASSWORD)
+    started = time.perf_counter()
+    results = pool.map(verify_loop, [(setting, hashed, duration)] * processes)
+    elapsed = time.perf_counter() - started
+    timings = sorted(t for result in results for t in result)
+    return {
+        "setting": setting,
+        "logins_per_second": len(timings) / elapsed,
+        "per_core": len(timings) / elapsed / processes,
+        "p50_ms": statistics.median(timings) * 1000,
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--settings", default=DEFAULT_SETTINGS, help="비교할 설정 (쉼표 구분)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="동시에 검증하는 프로세스 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="설정별 측정 시간(초)")
+    args = parser.parse_args()
+
+    from passlib.exc import MissingBackendError
+
+    rows = []
+    with multiprocessing.Pool(args.processes) as pool:
+        for setting in args.settings.split(","):
+            try:
+                rows.append(run_setting(pool, setting, args.processes, args.duration))
+            except MissingBackendError:
+                print(f"{setting}: 건너뜀 (argon2-cffi 가 설치되지 않음)")
+
+    print(f"\nprocesses={args.processes}")
+    print(f"{'setting':<22}{'logins/s':>10}{'per core':>10}{'p50':>10}{'p95':>10}")
+    for row in rows:
+        print(
+            f"{row['setting']:<22}{row['logins_per_second']:>10.1f}{row['per_core']:>10.1f}"
+            f"{row['p50_ms']:>8.1f}ms{row['p95_ms']:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 벤치마크
+
+1,000개 항목 목록을 기존 방식(pydantic 객체 생성 -> response_model 재검증 -> 표준 json)과
+새 방식(행 -> dict -> orjson)으로 직렬화하는 데 걸리는 시간을 비교한다.
+
+    python benchmarks/bench_serialization.py [--items 1000] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from schemas import ConversationResponse, MatchRequestResponse, MessageResponse, UserResponse
+from serializers import (
+    FastJSONResponse, conversation_to_dict, match_request_to_dict,
+    message_to_dict, user_to_dict
+)
+
+
+def make_rows(count: int):
+    """직렬화할 가짜 행 생성"""
+    now = datetime.utcnow()
+    users = [SimpleNamespace(
+        id=i, email=f"mentor{i}@test.com", role="mentor", name=f"멘토 {i}",
+        bio="10년차 백엔드 개발자입니다." * 3, skills="Python,FastAPI,React,Docker", version=1
+    ) for i in range(count)]
+    requests = [SimpleNamespace(
+        id=i, mentor_id=i, mentee_id=i + 1, message="멘토링 부탁드립니다!", status="pending"
+    ) for i in range(count)]
+    messages = [SimpleNamespace(
+        id=i, sender_id=1, receiver_id=2, content="안녕하세요, 질문이 있습니다." * 2,
+        is_read=i % 2, created_at=now
+    ) for i in range(count)]
+    conversations = [SimpleNamespace(
+        other_user_id=i, user_name=f"사용자 {i}", user_role="mentee",
+        last_message="마지막 메시지", last_message_time=now, unread_count=i % 5
+    ) for i in range(count)]
+    return users, requests, messages, conversations
+
+
+def legacy_users(rows):
+    return [UserResponse(
+        id=r.id, email=r.email, role=r.role,
+        profile={
+            "name": r.name, "bio": r.bio or "",
+            "imageUrl": f"/api/images/{r.role}/{r.id}",
+            "skills": r.skills.split(",") if r.skills else []
+        }
+    ) for r in rows]
+
+
+def legacy_requests(rows):
+    return [MatchRequestResponse(
+        id=r.id, mentorId=r.mentor_id, menteeId=r.mentee_id, message=r.message, status=r.status
+    ) for r in rows]
+
+
+def legacy_messages(rows):
+    return [MessageResponse(
+        id=r.id, sender_id=r.sender_id, receiver_id=r.receiver_id, content=r.content,
+        is_read=bool(r.is_read), created_at=r.created_at.isoformat(),
+        sender_name="보낸이", receiver_name="받는이"
+    ) for r in rows]
+
+
+def legacy_conversations(rows):
+    return [ConversationResponse(
+        user_id=r.other_user_id, user_name=r.user_name, user_role=r.user_role,
+        last_message=r.last_message, last_message_time=r.last_message_time.isoformat(),
+        unread_count=r.unread_count
+    ) for r in rows]
+
+
+def legacy_render(model, objects) -> bytes:
+    """FastAPI 기본 경로: response_model 재검증 + jsonable_encoder + 표준 json"""
+    adapter = TypeAdapter(List[model])
+    validated = adapter.validate_python(
+        [obj.model_dump() for obj in objects]
+    )
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    users, requests, messages, conversations = make_rows(args.items)
+    cases = [
+        ("/api/mentors",
+         lambda: legacy_render(UserResponse, legacy_users(users)),
+         lambda: FastJSONResponse([user_to_dict(r) for r in users]).body),
+        ("/api/match-requests/*",
+         lambda: legacy_render(MatchRequestResponse, legacy_requests(requests)),
+         lambda: FastJSONResponse([match_request_to_dict(r) for r in requests]).body),
+        ("/api/messages/{user_id}",
+         lambda: legacy_render(MessageResponse, legacy_messages(messages)),
+         lambda: FastJSONResponse([message_to_dict(r, "보낸이", "받는이") for r in messages]).body),
+        ("/api/conversations",
+         lambda: legacy_render(ConversationResponse, legacy_conversations(conversations)),
+         lambda: FastJSONResponse([conversation_to_dict(r) for r in conversations]).body),
+    ]
+
+    print(f"목록 직렬화 벤치마크 ({args.items}개 항목, {args.repeat}회 평균)")
+    print(f"{'endpoint':<28}{'legacy ms':>12}{'fast ms':>12}{'speedup':>10}")
+    for name, legacy, fast in cases:
+        legacy_ms = measure(legacy, args.repeat)
+        fast_ms = measure(fast, args.repeat)
+        print(f"{name:<28}{legacy_ms:>12.2f}{fast_ms:>12.2f}{legacy_ms / fast_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
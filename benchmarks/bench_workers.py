@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+워커 수에 따른 처리량 비교
+
+serve.py 로 워커 수를 바꿔 가며 서버를 띄우고 같은 시드 데이터와 부하(load_suite.py 의
+시나리오)를 적용해 처리량과 p95 지연시간을 비교한다. 부하 생성기도 CPU 를 쓰므로
+코어가 워커 수보다 충분히 많은 머신에서 실행해야 의미 있는 결과가 나온다.
+
+    python benchmarks/bench_workers.py --workers-list 1,2,4 --concurrency 64 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import load_suite  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers-list", default="1,2,4", help="비교할 워커 수 (쉼표 구분)")
+    own, rest = parser.parse_known_args()
+    args = load_suite.parse_args(rest + ["--transport", "uvicorn"])
+
+    database = args.database or os.path.join(tempfile.mkdtemp(prefix="mentor-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+
+    print(f"시드 데이터 생성: mentors={args.mentors} mentees={args.mentees} messages={args.messages}")
+    mentor_ids, mentee_ids = load_suite.seed_database(args)
+    mentor_tokens = load_suite.make_tokens(mentor_ids, "mentor")
+    mentee_tokens = load_suite.make_tokens(mentee_ids, "mentee")
+
+    rows = []
+    for workers in [int(w) for w in own.workers_list.split(",")]:
+        args.workers = workers
+        started = time.perf_counter()
+        result = asyncio.run(load_suite.run_uvicorn(args, mentor_tokens, mentee_tokens))
+        p95 = max((r["p95_ms"] for r in result["routes"].values()), default=0.0)
+        errors = sum(r["errors"] for r in result["routes"].values())
+        rows.append((workers, result["throughput_rps"], p95, errors))
+        print(f"workers={workers}: {result['throughput_rps']} req/s ({time.perf_counter() - started:.1f}초)")
+
+    baseline = rows[0][1] or 1.0
+    print(f"\n{'workers':>8}{'req/s':>10}{'scaling':>9}{'worst p95':>11}{'errors':>8}")
+    for workers, rps, p95, errors in rows:
+        print(f"{workers:>8}{rps:>10.1f}{rps / baseline:>8.2f}x{p95:>10.1f}ms{errors:>8}")
+
+
+if __name__ == "__main__":
+    main()
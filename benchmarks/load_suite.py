@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+API 부하/성능 벤치마크
+
+FastAPI 앱을 프로세스 안(ASGI transport)에서 또는 로컬 uvicorn 으로 띄우고, 임시 데이터베이스에
+시드 데이터를 채운 뒤 실제 사용 패턴(로그인, 멘토 목록 조회, 메시지 송수신, 요청 수락 등과 낮은
+비율의 가입, 프로필 수정, 요청 생성/거절/취소, 이미지 조회)을 지정한 동시성으로 재생한다.
+경로별 p50/p95/p99 지연시간, 처리량, 요청당 SQL 문 수를 출력하고 JSON 으로 저장해 실행 간
+비교할 수 있다.
+
+    python benchmarks/load_suite.py --mentors 200 --mentees 800 --messages 20000 \\
+        --concurrency 20 --duration 30 --output bench.json
+    python benchmarks/load_suite.py --compare bench.json   # 이전 결과와 비교
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.append(APP_DIR)
+
+from seed import seed_email  # noqa: E402 (DATABASE_URL 와 무관한 모듈만 미리 import)
+
+PASSWORD = "benchpass123"
+
+# 시나리오 가중치 (합이 1 일 필요는 없음)
+SCENARIO_WEIGHTS = {
+    "login": 3,
+    "browse_mentors": 30,
+    "view_profile": 10,
+    "list_conversations": 10,
+    "read_messages": 20,
+    "send_message": 15,
+    "poll_requests": 8,
+    "accept_request": 4,
+    # 드물지만 쓰기/이미지 경로도 측정에 포함
+    "signup": 1,
+    "update_profile": 2,
+    "create_request": 2,
+    "reject_request": 1,
+    "view_images": 3,
+    "unread_count": 3,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="멘토-멘티 API 부하 벤치마크")
+    parser.add_argument("--mentors", type=int, default=100)
+    parser.add_argument("--mentees", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=1000, help="시드할 매칭 요청 수")
+    parser.add_argument("--messages", type=int, default=10000, help="시드할 메시지 수")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=15.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수 (--transport uvicorn)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", help="사용할 SQLite 파일 (기본: 임시 파일)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="이전 결과 JSON 과 비교")
+    return parser.parse_args(argv)
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def seed_database(args):
+    """벤치마크용 데이터 시드 (seed.py 의 Core 일괄 삽입 사용)"""
+    from database import engine
+    from seed import seed_database as seed
+
+    result = seed(
+        engine, args.mentors, args.mentees, args.requests, args.messages,
+        seed=args.seed, password=PASSWORD, images=2,
+    )
+    return result.mentor_ids, result.mentee_ids
+
+
+def make_tokens(user_ids, role):
+    from auth import create_access_token
+
+    return {
+        user_id: create_access_token({
+            "sub": str(user_id), "email": f"bench-{role}@bench.com", "name": role, "role": role
+        })
+        for user_id in user_ids
+    }
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.recording = False
+
+    def record(self, label, seconds, status_code):
+        if not self.recording:
+            return
+        self.latencies[label].append(seconds)
+        if status_code >= 400:
+            self.errors[label] += 1
+
+
+async def timed(client, recorder, label, method, url, **kwargs):
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    recorder.record(label, time.perf_counter() - start, response.status_code)
+    return response
+
+
+class VirtualUser:
+    """시나리오를 무작위로 반복 실행하는 가상 사용자"""
+
+    def __init__(self, client, recorder, rng, mentor_tokens, mentee_tokens):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.mentor_tokens = mentor_tokens
+        self.mentee_tokens = mentee_tokens
+        self.mentor_ids = list(mentor_tokens)
+        self.mentee_ids = list(mentee_tokens)
+        self.scenarios = list(SCENARIO_WEIGHTS)
+        self.weights = [SCENARIO_WEIGHTS[s] for s in self.scenarios]
+
+    def _auth(self, token):
+        return {"Authorization": f"Bearer {token}"}
+
+    def _mentee(self):
+        mentee_id = self.mentee_ids[self.rng.randrange(len(self.mentee_ids))]
+        return mentee_id, self._auth(self.mentee_tokens[mentee_id])
+
+    def _mentor(self):
+        mentor_id = self.mentor_ids[self.rng.randrange(len(self.mentor_ids))]
+        return mentor_id, self._auth(self.mentor_tokens[mentor_id])
+
+    async def run(self, stop_at):
+        while time.perf_counter() < stop_at:
+            scenario = self.rng.choices(self.scenarios, self.weights)[0]
+            await getattr(self, scenario)()
+
+    async def login(self):
+        index = self.rng.randrange(len(self.mentee_ids))
+        await timed(self.client, self.recorder, "POST /api/login", "POST", "/api/login", json={
+            "email": seed_email("mentee", index), "password": PASSWORD
+        })
+
+    async def browse_mentors(self):
+        _, headers = self._mentee()
+        params = {}
+        roll = self.rng.random()
+        if roll < 0.3:
+            params["skill"] = self.rng.choice(["Python", "React", "Go", "Docker"])
+        if roll > 0.6:
+            params["order_by"] = self.rng.choice(["name", "skill"])
+        await timed(self.client, self.recorder, "GET /api/mentors", "GET", "/api/mentors",
+                    params=params, headers=headers)
+
+    async def view_profile(self):
+        _, headers = self._mentee() if self.rng.random() < 0.5 else self._mentor()
+        await timed(self.client, self.recorder, "GET /api/me", "GET", "/api/me", headers=headers)
+
+    async def list_conversations(self):
+        _, headers = self._mentee()
+        await timed(self.client, self.recorder, "GET /api/conversations", "GET", "/api/conversations",
+                    headers=headers)
+
+    async def read_messages(self):
+        mentee_id, headers = self._mentee()
+        mentor_id = self.mentor_ids[mentee_id % len(self.mentor_ids)]
+        await timed(self.client, self.recorder, "GET /api/messages/{user_id}", "GET",
+                    f"/api/messages/{mentor_id}", headers=headers)
+
+    async def send_message(self):
+        mentee_id, headers = self._mentee()
+        mentor_id = self.mentor_ids[mentee_id % len(self.mentor_ids)]
+        await timed(self.client, self.recorder, "POST /api/messages", "POST", "/api/messages",
+                    json={"receiver_id": mentor_id, "content": "벤치마크 메시지"}, headers=headers)
+
+    async def poll_requests(self):
+        if self.rng.random() < 0.5:
+            _, headers = self._mentor()
+            await timed(self.client, self.recorder, "GET /api/match-requests/incoming", "GET",
+                        "/api/match-requests/incoming", headers=headers)
+        else:
+            _, headers = self._mentee()
+            await timed(self.client, self.recorder, "GET /api/match-requests/outgoing", "GET",
+                        "/api/match-requests/outgoing", headers=headers)
+
+    async def accept_request(self):
+        _, headers = self._mentor()
+        response = await timed(self.client, self.recorder, "GET /api/match-requests/incoming", "GET",
+                               "/api/match-requests/incoming", headers=headers)
+        if response.status_code != 200:
+            return
+        pending = [r for r in response.json() if r["status"] == "pending"]
+        if pending:
+            await timed(self.client, self.recorder, "PUT /api/match-requests/{request_id}/accept", "PUT",
+                        f"/api/match-requests/{pending[0]['id']}/accept", headers=headers)
+
+    async def signup(self):
+        role = "mentor" if self.rng.random() < 0.2 else "mentee"
+        await timed(self.client, self.recorder, "POST /api/signup", "POST", "/api/signup", json={
+            "email": f"bench-signup-{uuid.uuid4().hex[:12]}@bench.com", "password": PASSWORD,
+            "name": "벤치마크 가입자", "role": role,
+        })
+
+    async def update_profile(self):
+        _, headers = self._mentor() if self.rng.random() < 0.5 else self._mentee()
+        await timed(self.client, self.recorder, "PUT /api/profile", "PUT", "/api/profile", json={
+            "name": f"벤치마크 {self.rng.randrange(1000)}", "bio": "벤치마크 소개",
+            "skills": self.rng.sample(["Python", "React", "Go", "Docker", "Kotlin"], 2),
+        }, headers=headers)
+
+    async def create_request(self):
+        """요청을 보내고 절반은 바로 취소 (대기 중인 요청이 있으면 400)"""
+        mentee_id, headers = self._mentee()
+        mentor_id = self.mentor_ids[self.rng.randrange(len(self.mentor_ids))]
+        response = await timed(self.client, self.recorder, "POST /api/match-requests", "POST",
+                               "/api/match-requests", json={"mentorId": mentor_id, "message": "벤치마크 요청"},
+                               headers=headers)
+        if response.status_code == 200 and self.rng.random() < 0.5:
+            await timed(self.client, self.recorder, "DELETE /api/match-requests/{request_id}", "DELETE",
+                        f"/api/match-requests/{response.json()['id']}", headers=headers)
+
+    async def reject_request(self):
+        _, headers = self._mentor()
+        response = await timed(self.client, self.recorder, "GET /api/match-requests/incoming", "GET",
+                               "/api/match-requests/incoming", headers=headers)
+        if response.status_code != 200:
+            return
+        pending = [r for r in response.json() if r["status"] == "pending"]
+        if pending:
+            await timed(self.client, self.recorder, "PUT /api/match-requests/{request_id}/reject", "PUT",
+                        f"/api/match-requests/{pending[0]['id']}/reject", headers=headers)
+
+    async def view_images(self):
+        """멘토 목록 화면의 썸네일 일괄 조회, 서명된 URL, 인증 이미지 경로"""
+        import avatars
+
+        _, headers = self._mentee()
+        roll = self.rng.random()
+        if roll < 0.5:
+            ids = ",".join(str(i) for i in self.rng.sample(self.mentor_ids, min(20, len(self.mentor_ids))))
+            await timed(self.client, self.recorder, "GET /api/avatars", "GET", "/api/avatars",
+                        params={"ids": ids}, headers=headers)
+            return
+        mentor_id = self.mentor_ids[self.rng.randrange(len(self.mentor_ids))]
+        if roll < 0.8:
+            # 시드한 사용자는 version 1
+            await timed(self.client, self.recorder, "GET /api/avatars/{user_id}", "GET",
+                        avatars.signed_url(mentor_id, 1))
+        else:
+            await timed(self.client, self.recorder, "GET /api/images/{role}/{user_id}", "GET",
+                        f"/api/images/mentor/{mentor_id}", headers=headers)
+
+    async def unread_count(self):
+        _, headers = self._mentor() if self.rng.random() < 0.5 else self._mentee()
+        await timed(self.client, self.recorder, "GET /api/messages/unread-count", "GET",
+                    "/api/messages/unread-count", headers=headers)
+
+
+def parse_statement_metrics(text: str) -> dict:
+    """/metrics 에서 경로별 SQL 문 합계/요청 수 추출"""
+    result = defaultdict(lambda: {"sum": 0.0, "count": 0.0})
+    for line in text.splitlines():
+        for suffix in ("sum", "count"):
+            prefix = f"db_statements_per_request_{suffix}{{"
+            if line.startswith(prefix):
+                labels, value = line[len(prefix):].rsplit("} ", 1)
+                parts = dict(item.split("=", 1) for item in labels.split('",') if "=" in item)
+                method = parts["method"].strip('"')
+                route = parts["route"].strip('"')
+                result[f"{method} {route}"][suffix] = float(value)
+    return result
+
+
+async def run_load(args, client, mentor_tokens, mentee_tokens):
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    users = [
+        VirtualUser(client, recorder, random.Random(rng.random()), mentor_tokens, mentee_tokens)
+        for i in range(args.concurrency)
+    ]
+
+    if args.warmup > 0:
+        await asyncio.gather(*(u.run(time.perf_counter() + args.warmup) for u in users))
+
+    # 워커가 여럿이면 /metrics 가 워커마다 달라 요청당 SQL 문 수를 구할 수 없음
+    collect_sql = getattr(args, "workers", 1) == 1
+    empty = defaultdict(lambda: {"sum": 0.0, "count": 0.0})
+    before = parse_statement_metrics((await client.get("/metrics")).text) if collect_sql else empty
+    recorder.recording = True
+    started = time.perf_counter()
+    await asyncio.gather(*(u.run(started + args.duration) for u in users))
+    elapsed = time.perf_counter() - started
+    recorder.recording = False
+    after = parse_statement_metrics((await client.get("/metrics")).text) if collect_sql else empty
+
+    routes = {}
+    for label, values in sorted(recorder.latencies.items()):
+        values.sort()
+        delta_count = after[label]["count"] - before[label]["count"]
+        delta_sum = after[label]["sum"] - before[label]["sum"]
+        routes[label] = {
+            "requests": len(values),
+            "errors": recorder.errors[label],
+            "throughput_rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "sql_statements_per_request": round(delta_sum / delta_count, 2) if delta_count else None,
+        }
+    total = sum(r["requests"] for r in routes.values())
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "total_requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "routes": routes,
+    }
+
+
+async def run_asgi(args, mentor_tokens, mentee_tokens):
+    import httpx
+
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        return await run_load(args, client, mentor_tokens, mentee_tokens)
+
+
+async def wait_ready(client, timeout: float = 30.0):
+    """서버의 준비 상태 확인 엔드포인트가 200 을 반환할 때까지 대기"""
+    import httpx
+
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("server did not become ready")
+
+
+async def run_uvicorn(args, mentor_tokens, mentee_tokens):
+    import httpx
+
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(args.port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        cwd=APP_DIR, env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+            await wait_ready(client)
+            return await run_load(args, client, mentor_tokens, mentee_tokens)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def print_report(result):
+    print(f"\n총 {result['total_requests']}건, {result['elapsed_seconds']}초, {result['throughput_rps']} req/s")
+    print(f"{'route':<46}{'reqs':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'sql/req':>9}")
+    for label, r in result["routes"].items():
+        sql = "-" if r["sql_statements_per_request"] is None else f"{r['sql_statements_per_request']:.1f}"
+        print(f"{label:<46}{r['requests']:>7}{r['errors']:>6}{r['throughput_rps']:>9.1f}"
+              f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{sql:>9}")
+
+
+def print_comparison(result, baseline):
+    print(f"\n이전 결과와 비교 ({baseline.get('timestamp', '?')})")
+    print(f"{'route':<46}{'p95 before':>12}{'p95 now':>10}{'change':>9}")
+    for label, r in result["routes"].items():
+        old = baseline["results"]["routes"].get(label)
+        if not old or not old["p95_ms"]:
+            continue
+        change = (r["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+        print(f"{label:<46}{old['p95_ms']:>12.1f}{r['p95_ms']:>10.1f}{change:>8.1f}%")
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    args = parse_args()
+    database = args.database or os.path.join(tempfile.mkdtemp(prefix="mentor-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    # 벤치마크 부하가 요청 제한에 걸리지 않도록 비활성화
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+
+    print(f"시드 데이터 생성: mentors={args.mentors} mentees={args.mentees} "
+          f"requests={args.requests} messages={args.messages} ({database})")
+    seed_start = time.perf_counter()
+    mentor_ids, mentee_ids = seed_database(args)
+    print(f"시드 완료: {time.perf_counter() - seed_start:.1f}초")
+
+    mentor_tokens = make_tokens(mentor_ids, "mentor")
+    mentee_tokens = make_tokens(mentee_ids, "mentee")
+
+    runner = run_asgi if args.transport == "asgi" else run_uvicorn
+    result = asyncio.run(runner(args, mentor_tokens, mentee_tokens))
+    print_report(result)
+
+    report = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": git_revision(),
+        "parameters": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "results": result,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(result, json.load(f))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
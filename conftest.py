@@ -0,0 +1,131 @@
+"""
+pytest 공용 설정
+
+app 디렉토리를 import 경로에 추가하고, 테스트마다 임시 SQLite 데이터베이스를 사용한다.
+"""
+import os
+import sys
+import tempfile
+import uuid
+from contextlib import contextmanager
+
+_tmpdir = tempfile.mkdtemp(prefix="mentor-mentee-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmpdir}/test.db")
+# 주기 정리 작업은 테스트에서 직접 실행 (백그라운드 실행이 SQL 문 수 검사에 섞이지 않도록)
+os.environ.setdefault("MAINTENANCE_ENABLED", "0")
+# 로그 파이프라인은 caplog 가 루트 로거에서 바로 받을 수 있도록 테스트에서 직접 구성
+os.environ.setdefault("LOG_QUEUE", "0")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+
+import pytest
+
+# 테스트 사용자용 비밀번호 해시 (bcrypt 비용을 매번 치르지 않도록 한 번만 계산)
+TEST_PASSWORD = "testpass123"
+_password_hash = None
+
+
+@pytest.fixture(scope="session")
+def app():
+    from database import init_db
+    from main import app as fastapi_app
+
+    init_db()
+    return fastapi_app
+
+
+@pytest.fixture
+def client(app):
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(app):
+    from database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_user(app):
+    """사용자를 직접 생성하고 인증 헤더를 함께 반환"""
+    from auth import create_access_token, get_password_hash
+    from crud import create_user, update_user_profile
+    from database import SessionLocal
+
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = get_password_hash(TEST_PASSWORD)
+
+    def _make_user(role: str = "mentee", name: str = None, skills: str = None, bio: str = None):
+        session = SessionLocal()
+        try:
+            email = f"{role}-{uuid.uuid4().hex[:12]}@test.com"
+            user = create_user(session, email, _password_hash, name or f"{role} user", role)
+            if skills is not None or bio is not None:
+                user = update_user_profile(session, user.id, user.name, bio, None, skills)
+            token = create_access_token({
+                "sub": str(user.id),
+                "email": user.email,
+                "name": user.name,
+                "role": user.role
+            })
+            return {
+                "id": user.id,
+                "email": email,
+                "role": role,
+                "token": token,
+                "headers": {"Authorization": f"Bearer {token}"},
+            }
+        finally:
+            session.close()
+
+    return _make_user
+
+
+class CapturedStatements(list):
+    """실행된 SQL 문 목록 (같은 순서의 파라미터는 parameters)"""
+
+    def __init__(self):
+        super().__init__()
+        self.parameters = []
+
+    @property
+    def verbs(self) -> list:
+        """문의 첫 단어 (SELECT, INSERT, ...)"""
+        return [statement.split(None, 1)[0].upper() for statement in self]
+
+    def clear(self) -> None:
+        super().clear()
+        self.parameters.clear()
+
+
+@pytest.fixture
+def capture_statements(app):
+    """with capture_statements() as statements: 블록 안에서 엔진(기본: 앱 DB)이 실행한 SQL 문을 모음"""
+    from sqlalchemy import event
+
+    from database import engine as app_engine
+
+    @contextmanager
+    def _capture(engine=None):
+        engine = engine or app_engine
+        statements = CapturedStatements()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+            statements.parameters.append(parameters)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return _capture
@@ -6,7 +6,7 @@ import { Avatar, AvatarFallback, AvatarImage } from './ui/avatar';
 import { Badge } from './ui/badge';
 
 const Navbar: React.FC = () => {
-  const { user, logout } = useAuth();
+  const { user, summary, logout } = useAuth();
   const navigate = useNavigate();
   const location = useLocation();
 
@@ -108,6 +108,9 @@ const Navbar: React.FC = () => {
                     <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M20 13V6a2 2 0 00-2-2H6a2 2 0 00-2 2v7m16 0v5a2 2 0 01-2 2H6a2 2 0 01-2-2v-5m16 0h-2.586a1 1 0 00-.707.293l-2.414 2.414a1 1 0 01-.707.293h-3.172a1 1 0 01-.707-.293l-2.414-2.414A1 1 0 006.586 13H4" />
                   </svg>
                   <span>{user?.role === 'mentor' ? '받은 요청' : '보낸 요청'}</span>
+                  {!!summary?.pendingRequests && (
+                    <Badge className="bg-purple-600 text-white px-1.5 py-0 text-xs">{summary.pendingRequests}</Badge>
+                  )}
                 </div>
               </Link>
               
@@ -124,6 +127,9 @@ const Navbar: React.FC = () => {
                     <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M8 12h.01M12 12h.01M16 12h.01M21 12c0 4.418-4.03 8-9 8a9.863 9.863 0 01-4.255-.949L3 20l1.395-3.72C3.512 15.042 3 13.574 3 12c0-4.418 4.03-8 9-8s9 3.582 9 8z" />
                   </svg>
                   <span>메시지</span>
+                  {!!summary?.unreadCount && (
+                    <Badge className="bg-red-500 text-white px-1.5 py-0 text-xs">{summary.unreadCount}</Badge>
+                  )}
                 </div>
               </Link>
               
@@ -2,12 +2,19 @@ import React, { createContext, useContext, useState, useEffect, ReactNode } from
 import { User } from '../types';
 import { authAPI } from '../services/api';
 
+export interface SessionSummary {
+  unreadCount: number;
+  pendingRequests: number;
+}
+
 interface AuthContextType {
   user: User | null;
+  summary: SessionSummary | null;
   loading: boolean;
   login: (email: string, password: string) => Promise<void>;
   logout: () => void;
   updateUser: (user: User) => void;
+  refreshSummary: () => Promise<void>;
 }
 
 const AuthContext = createContext<AuthContextType | undefined>(undefined);
@@ -26,17 +33,36 @@ interface AuthProviderProps {
 
 export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   const [user, setUser] = useState<User | null>(null);
+  const [summary, setSummary] = useState<SessionSummary | null>(null);
   const [loading, setLoading] = useState(true);
 
+  // 프로필과 배지 개수를 /api/bootstrap 한 번으로 조회
+  const loadSession = async () => {
+    const data = await authAPI.bootstrap();
+    setUser(data.user ?? null);
+    setSummary({
+      unreadCount: data.unread_count ?? 0,
+      pendingRequests: data.request_counts?.pending ?? 0,
+    });
+  };
+
+  const refreshSummary = async () => {
+    const data = await authAPI.bootstrap(['unread_count', 'request_counts']);
+    setSummary({
+      unreadCount: data.unread_count ?? 0,
+      pendingRequests: data.request_counts?.pending ?? 0,
+    });
+  };
+
   useEffect(() => {
     const initAuth = async () => {
       const token = localStorage.getItem('token');
       if (token) {
         try {
-          const userData = await authAPI.getMe();
-          setUser(userData);
+          await loadSession();
         } catch (error) {
           localStorage.removeItem('token');
+          localStorage.removeItem('refreshToken');
         }
       }
       setLoading(false);
@@ -47,18 +73,25 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
 
   const login = async (email: string, password: string) => {
     try {
-      const token = await authAPI.login({ email, password });
+      const { token, refreshToken } = await authAPI.login({ email, password });
       localStorage.setItem('token', token);
-      const userData = await authAPI.getMe();
-      setUser(userData);
+      localStorage.setItem('refreshToken', refreshToken);
+      await loadSession();
     } catch (error) {
       throw error;
     }
   };
 
   const logout = () => {
+    const refreshToken = localStorage.getItem('refreshToken');
+    if (refreshToken) {
+      // 서버에서 폐기 실패해도 로컬 로그아웃은 진행
+      authAPI.logout(refreshToken).catch(() => undefined);
+    }
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
     setUser(null);
+    setSummary(null);
   };
 
   const updateUser = (updatedUser: User) => {
@@ -67,10 +100,12 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
 
   const value = {
     user,
+    summary,
     loading,
     login,
     logout,
     updateUser,
+    refreshSummary,
   };
 
   return <AuthContext.Provider value={value}>{children}</AuthContext.Provider>;
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { User } from '../types';
-import { mentorAPI, matchRequestAPI } from '../services/api';
+import { avatarAPI, mentorAPI, matchRequestAPI } from '../services/api';
 import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card';
 import { Input } from '../components/ui/input';
 import { Button } from '../components/ui/button';
@@ -10,58 +10,72 @@ import { Badge } from '../components/ui/badge';
 import { Avatar, AvatarFallback, AvatarImage } from '../components/ui/avatar';
 import { Separator } from '../components/ui/separator';
 
+// 검색어 입력이 멈춘 뒤 서버에 요청하기까지 대기 시간(ms)
+const SEARCH_DEBOUNCE_MS = 300;
+const PAGE_SIZE = 50;
+
 const Mentors: React.FC = () => {
   const [mentors, setMentors] = useState<User[]>([]);
-  const [filteredMentors, setFilteredMentors] = useState<User[]>([]);
+  // 썸네일 일괄 요청 결과 (null 이면 아직 받는 중, 'failed' 면 imageUrl 로 개별 로드)
+  const [thumbnails, setThumbnails] = useState<Record<string, string> | 'failed' | null>(null);
+  const [total, setTotal] = useState(0);
+  const [page, setPage] = useState(1);
   const [searchSkill, setSearchSkill] = useState('');
+  const [debouncedSkill, setDebouncedSkill] = useState('');
   const [sortBy, setSortBy] = useState('');
   const [loading, setLoading] = useState(true);
   const [requestMessages, setRequestMessages] = useState<{[key: number]: string}>({});
   const [requestLoading, setRequestLoading] = useState<{[key: number]: boolean}>({});
 
+  // 입력할 때마다 요청하지 않도록 검색어 디바운스 (검색어가 바뀌면 첫 페이지부터)
   useEffect(() => {
-    loadMentors();
-  }, []);
-
-  useEffect(() => {
-    filterAndSortMentors();
-  }, [mentors, searchSkill, sortBy]);
+    const timer = setTimeout(() => {
+      setDebouncedSkill(searchSkill.trim());
+      setPage(1);
+    }, SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchSkill]);
 
-  const loadMentors = async () => {
-    try {
-      const data = await mentorAPI.getMentors();
-      setMentors(data);
-    } catch (error) {
-      console.error('멘토 목록 로딩 실패:', error);
-    } finally {
-      setLoading(false);
-    }
+  const handleSortChange = (value: string) => {
+    setSortBy(value);
+    setPage(1);
   };
 
-  const filterAndSortMentors = () => {
-    let filtered = [...mentors];
-
-    // 스킬 필터링
-    if (searchSkill.trim()) {
-      filtered = filtered.filter(mentor =>
-        mentor.profile.skills?.some(skill =>
-          skill.toLowerCase().includes(searchSkill.toLowerCase())
-        )
-      );
-    }
-
-    // 정렬
-    if (sortBy === 'name') {
-      filtered.sort((a, b) => a.profile.name.localeCompare(b.profile.name));
-    } else if (sortBy === 'skill') {
-      filtered.sort((a, b) => {
-        const aSkills = a.profile.skills?.join(', ') || '';
-        const bSkills = b.profile.skills?.join(', ') || '';
-        return aSkills.localeCompare(bSkills);
+  // 필터링, 정렬, 페이지 나누기는 서버에서 처리
+  useEffect(() => {
+    const controller = new AbortController();
+    setThumbnails(null);
+    mentorAPI.getMentors(
+      { skill: debouncedSkill, orderBy: sortBy, page, pageSize: PAGE_SIZE },
+      controller.signal
+    )
+      .then((result) => {
+        setMentors(result.mentors);
+        setTotal(result.total);
+        setLoading(false);
+        // 페이지의 프로필 이미지는 요청 하나로 (실패하면 imageUrl 로 개별 로드)
+        return avatarAPI.getThumbnails(result.mentors.map((mentor) => mentor.id), 96, controller.signal)
+          .then(setThumbnails)
+          .catch(() => {
+            if (!controller.signal.aborted) setThumbnails('failed');
+          });
+      })
+      .catch((error) => {
+        // 이전 검색 요청이 취소된 경우는 무시
+        if (!controller.signal.aborted) {
+          console.error('멘토 목록 로딩 실패:', error);
+          setLoading(false);
+        }
       });
-    }
+    return () => controller.abort();
+  }, [debouncedSkill, sortBy, page]);
+
+  const totalPages = Math.max(1, Math.ceil(total / PAGE_SIZE));
 
-    setFilteredMentors(filtered);
+  // 일괄 요청이 끝나기 전에는 이미지를 요청하지 않고 이니셜만 표시
+  const avatarSrc = (mentor: User): string | undefined => {
+    if (thumbnails === 'failed') return mentor.profile.imageUrl;
+    return thumbnails?.[mentor.id];
   };
 
   const handleSendRequest = async (mentorId: number) => {
@@ -140,7 +154,7 @@ const Mentors: React.FC = () => {
                       name="sort"
                       value="name"
                       checked={sortBy === 'name'}
-                      onChange={(e) => setSortBy(e.target.value)}
+                      onChange={(e) => handleSortChange(e.target.value)}
                       className="text-blue-600 focus:ring-blue-500"
                     />
                     <span className="text-sm">이름순</span>
@@ -152,7 +166,7 @@ const Mentors: React.FC = () => {
                       name="sort"
                       value="skill"
                       checked={sortBy === 'skill'}
-                      onChange={(e) => setSortBy(e.target.value)}
+                      onChange={(e) => handleSortChange(e.target.value)}
                       className="text-blue-600 focus:ring-blue-500"
                     />
                     <span className="text-sm">스킬순</span>
@@ -163,8 +177,10 @@ const Mentors: React.FC = () => {
           </CardContent>
         </Card>
 
+        <p className="text-sm text-muted-foreground mb-4">멘토 {total}명</p>
+
         {/* Mentors Grid */}
-        {filteredMentors.length === 0 ? (
+        {mentors.length === 0 ? (
           <Card className="text-center py-12 shadow-lg border-0 bg-white/80 backdrop-blur-sm">
             <CardContent>
               <div className="text-6xl mb-4">🔍</div>
@@ -174,11 +190,11 @@ const Mentors: React.FC = () => {
           </Card>
         ) : (
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-            {filteredMentors.map((mentor) => (
+            {mentors.map((mentor) => (
               <Card key={mentor.id} className="shadow-lg border-0 bg-white/80 backdrop-blur-sm hover:shadow-xl transition-all duration-300 hover:scale-[1.02]">
                 <CardHeader className="text-center pb-4">
                   <Avatar className="w-20 h-20 mx-auto mb-4 shadow-lg border-4 border-white">
-                    <AvatarImage src={mentor.profile.imageUrl} alt={mentor.profile.name} />
+                    {avatarSrc(mentor) && <AvatarImage src={avatarSrc(mentor)} alt={mentor.profile.name} />}
                     <AvatarFallback className="bg-gradient-to-r from-blue-500 to-purple-600 text-white text-lg font-semibold">
                       {mentor.profile.name.charAt(0)}
                     </AvatarFallback>
@@ -259,6 +275,27 @@ const Mentors: React.FC = () => {
             ))}
           </div>
         )}
+
+        {/* Pagination */}
+        {totalPages > 1 && (
+          <div className="flex items-center justify-center gap-4 mt-8">
+            <Button
+              variant="outline"
+              onClick={() => setPage(p => p - 1)}
+              disabled={page <= 1}
+            >
+              이전
+            </Button>
+            <span className="text-sm text-muted-foreground">{page} / {totalPages}</span>
+            <Button
+              variant="outline"
+              onClick={() => setPage(p => p + 1)}
+              disabled={page >= totalPages}
+            >
+              다음
+            </Button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -1,33 +1,50 @@
 import React, { useState, useEffect } from 'react';
 import { MatchRequest } from '../types';
-import { matchRequestAPI } from '../services/api';
+import { matchRequestAPI, RequestCounts, RequestStatusFilter } from '../services/api';
 import { useAuth } from '../contexts/AuthContext';
 import { Card, CardContent, CardHeader } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
 import { Separator } from '../components/ui/separator';
 
+const STATUS_TABS: { value: RequestStatusFilter; label: string }[] = [
+  { value: 'pending', label: '대기중' },
+  { value: 'accepted', label: '수락됨' },
+  { value: 'rejected', label: '거절됨' },
+  { value: 'cancelled', label: '취소됨' },
+  { value: 'expired', label: '만료됨' },
+  { value: 'all', label: '전체' },
+];
+
 const Requests: React.FC = () => {
   const { user } = useAuth();
   const [requests, setRequests] = useState<MatchRequest[]>([]);
+  const [statusFilter, setStatusFilter] = useState<RequestStatusFilter>('pending');
+  const [counts, setCounts] = useState<RequestCounts | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [actionLoading, setActionLoading] = useState<{[key: number]: boolean}>({});
 
   useEffect(() => {
     loadRequests();
-  }, [user]);
+  }, [user, statusFilter]);
+
+  const fetchPage = (cursor?: string) => {
+    const query = { status: statusFilter, cursor };
+    return user?.role === 'mentor'
+      ? matchRequestAPI.getIncomingRequests(query)
+      : matchRequestAPI.getOutgoingRequests(query);
+  };
 
   const loadRequests = async () => {
     if (!user) return;
 
     try {
-      let data: MatchRequest[];
-      if (user.role === 'mentor') {
-        data = await matchRequestAPI.getIncomingRequests();
-      } else {
-        data = await matchRequestAPI.getOutgoingRequests();
-      }
-      setRequests(data);
+      const [page, statusCounts] = await Promise.all([fetchPage(), matchRequestAPI.getRequestCounts()]);
+      setRequests(page.requests);
+      setNextCursor(page.nextCursor);
+      setCounts(statusCounts);
     } catch (error) {
       console.error('요청 목록 로딩 실패:', error);
     } finally {
@@ -35,6 +52,27 @@ const Requests: React.FC = () => {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await fetchPage(nextCursor);
+      setRequests(prev => [...prev, ...page.requests]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('요청 목록 로딩 실패:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const tabCount = (value: RequestStatusFilter) => {
+    if (!counts) return null;
+    if (value === 'all') return Object.values(counts).reduce((sum, count) => sum + count, 0);
+    return counts[value];
+  };
+
   const handleAccept = async (requestId: number) => {
     setActionLoading(prev => ({ ...prev, [requestId]: true }));
     try {
@@ -82,6 +120,7 @@ const Requests: React.FC = () => {
       accepted: { variant: 'default' as const, color: 'bg-green-500', text: '수락됨' },
       rejected: { variant: 'destructive' as const, color: 'bg-red-500', text: '거절됨' },
       cancelled: { variant: 'secondary' as const, color: 'bg-gray-500', text: '취소됨' },
+      expired: { variant: 'secondary' as const, color: 'bg-gray-400', text: '만료됨' },
     };
 
     const config = statusConfig[status as keyof typeof statusConfig] || statusConfig.cancelled;
@@ -119,6 +158,20 @@ const Requests: React.FC = () => {
           </p>
         </div>
 
+        {/* Status tabs */}
+        <div className="flex flex-wrap justify-center gap-2 mb-8">
+          {STATUS_TABS.map(tab => (
+            <Button
+              key={tab.value}
+              variant={statusFilter === tab.value ? 'default' : 'outline'}
+              onClick={() => setStatusFilter(tab.value)}
+            >
+              {tab.label}
+              {counts && <span className="ml-2 text-xs opacity-80">{tabCount(tab.value)}</span>}
+            </Button>
+          ))}
+        </div>
+
         {requests.length === 0 ? (
           <Card className="text-center py-16 shadow-lg border-0 bg-white/80 backdrop-blur-sm">
             <CardContent>
@@ -262,6 +315,14 @@ const Requests: React.FC = () => {
                 </CardContent>
               </Card>
             ))}
+
+            {nextCursor && (
+              <div className="text-center">
+                <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+                  {loadingMore ? '불러오는 중...' : '더 보기'}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>
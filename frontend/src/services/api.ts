@@ -20,11 +20,94 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// 액세스 토큰이 만료되면(401) 리프레시 토큰으로 한 번 갱신 후 재시도
+// 동시에 여러 요청이 실패해도 갱신은 한 번만 수행 (이미 교체된 토큰을 다시 쓰면 서버가 모두 폐기)
+let refreshing: Promise<string> | null = null;
+
+const refreshAccessToken = async (): Promise<string> => {
+  const failedWith = localStorage.getItem('refreshToken');
+
+  const refresh = async (): Promise<string> => {
+    const refreshToken = localStorage.getItem('refreshToken');
+    if (!refreshToken) throw new Error('No refresh token');
+    // 기다리는 동안 다른 탭이 이미 갱신했으면 그 토큰을 사용
+    const token = localStorage.getItem('token');
+    if (refreshToken !== failedWith && token) return token;
+
+    const response = await axios.post(`${API_BASE_URL}/token/refresh`, { refreshToken });
+    localStorage.setItem('token', response.data.token);
+    localStorage.setItem('refreshToken', response.data.refreshToken);
+    return response.data.token;
+  };
+
+  // 탭 사이에서도 한 번에 하나만 갱신 (localStorage 의 리프레시 토큰을 여러 탭이 공유)
+  return navigator.locks ? navigator.locks.request('token-refresh', refresh) : refresh();
+};
+
+api.interceptors.response.use(undefined, async (error) => {
+  const config = error.config;
+  const skip = !config || config._retried || config.url === '/login' || !localStorage.getItem('refreshToken');
+  if (error.response?.status !== 401 || skip) {
+    return Promise.reject(error);
+  }
+
+  config._retried = true;
+  try {
+    refreshing = refreshing ?? refreshAccessToken().finally(() => { refreshing = null; });
+    const token = await refreshing;
+    config.headers.Authorization = `Bearer ${token}`;
+    return api(config);
+  } catch {
+    localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
+    return Promise.reject(error);
+  }
+});
+
+// 서버가 과부하로 요청을 처리하지 않고 거절하면(503) Retry-After 만큼 기다렸다가 한 번 재시도
+const MAX_RETRY_AFTER_SECONDS = 5;
+
+api.interceptors.response.use(undefined, async (error) => {
+  const config = error.config;
+  if (error.response?.status !== 503 || !config || config._busyRetried) {
+    return Promise.reject(error);
+  }
+  config._busyRetried = true;
+  const seconds = Number(error.response.headers['retry-after']) || 1;
+  await new Promise((resolve) => setTimeout(resolve, Math.min(seconds, MAX_RETRY_AFTER_SECONDS) * 1000));
+  return api(config);
+});
+
+export type BootstrapField = 'user' | 'unread_count' | 'request_counts' | 'conversations';
+
+export interface Bootstrap {
+  user?: User;
+  unread_count?: number;
+  request_counts?: Record<'pending' | 'accepted' | 'rejected' | 'cancelled' | 'expired', number>;
+  conversations?: Conversation[];
+}
+
+// 쓰기 요청은 Idempotency-Key 를 붙여 보내고, 응답을 받지 못하면(네트워크 오류/시간 초과)
+// 같은 키로 한 번 더 보냄. 서버는 같은 키에 처음 응답을 다시 돌려주므로 중복 생성되지 않음
+const postIdempotent = async (url: string, data: unknown) => {
+  const headers = { 'Idempotency-Key': crypto.randomUUID() };
+  try {
+    return await api.post(url, data, { headers });
+  } catch (error: any) {
+    if (error.response) throw error;
+    return api.post(url, data, { headers });
+  }
+};
+
 // 인증 API
 export const authAPI = {
-  login: async (data: LoginRequest): Promise<string> => {
+  login: async (data: LoginRequest): Promise<{ token: string; refreshToken: string }> => {
     const response = await api.post('/login', data);
-    return response.data.token;
+    return response.data;
+  },
+
+  logout: async (refreshToken: string): Promise<void> => {
+    await api.post('/logout', { refreshToken });
   },
 
   signup: async (data: SignupRequest): Promise<void> => {
@@ -35,6 +118,12 @@ export const authAPI = {
     const response = await api.get('/me');
     return response.data;
   },
+
+  // 프로필과 배지용 개수를 한 번에 조회 (fields 로 필요한 항목만)
+  bootstrap: async (fields: BootstrapField[] = ['user', 'unread_count', 'request_counts']): Promise<Bootstrap> => {
+    const response = await api.get(`/bootstrap?fields=${fields.join(',')}`);
+    return response.data;
+  },
 };
 
 // 프로필 API
@@ -46,34 +135,86 @@ export const profileAPI = {
 };
 
 // 멘토 API
+export interface MentorQuery {
+  skill?: string;
+  orderBy?: string;
+  page?: number;
+  pageSize?: number;
+}
+
+export interface MentorPage {
+  mentors: User[];
+  total: number;
+}
+
 export const mentorAPI = {
-  getMentors: async (skill?: string, orderBy?: string): Promise<User[]> => {
+  getMentors: async (query: MentorQuery = {}, signal?: AbortSignal): Promise<MentorPage> => {
     const params = new URLSearchParams();
-    if (skill) params.append('skill', skill);
-    if (orderBy) params.append('order_by', orderBy);
+    if (query.skill) params.append('skill', query.skill);
+    if (query.orderBy) params.append('order_by', query.orderBy);
+    if (query.page) params.append('page', String(query.page));
+    if (query.pageSize) params.append('page_size', String(query.pageSize));
     
-    const response = await api.get(`/mentors?${params.toString()}`);
+    const response = await api.get(`/mentors?${params.toString()}`, { signal });
+    const total = Number(response.headers['x-total-count'] ?? response.data.length);
+    return { mentors: response.data, total };
+  },
+};
+
+// 프로필 썸네일 API (여러 사용자의 썸네일을 요청 하나로, {사용자 ID: data URI})
+export const avatarAPI = {
+  getThumbnails: async (ids: number[], size = 96, signal?: AbortSignal): Promise<Record<string, string>> => {
+    if (ids.length === 0) return {};
+    const response = await api.get(`/avatars?ids=${ids.join(',')}&size=${size}`, { signal });
     return response.data;
   },
 };
 
+export type RequestStatusFilter = 'pending' | 'accepted' | 'rejected' | 'cancelled' | 'expired' | 'all';
+
+export interface RequestQuery {
+  status?: RequestStatusFilter;
+  cursor?: string;
+  limit?: number;
+}
+
+export interface RequestPage {
+  requests: MatchRequest[];
+  nextCursor: string | null;
+}
+
+export type RequestCounts = Record<'pending' | 'accepted' | 'rejected' | 'cancelled' | 'expired', number>;
+
+const getRequestPage = async (path: string, query: RequestQuery): Promise<RequestPage> => {
+  const params = new URLSearchParams();
+  params.append('status', query.status ?? 'pending');
+  if (query.cursor) params.append('cursor', query.cursor);
+  if (query.limit) params.append('limit', String(query.limit));
+
+  const response = await api.get(`${path}?${params.toString()}`);
+  return { requests: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+};
+
 // 매칭 요청 API
 export const matchRequestAPI = {
   createRequest: async (mentorId: number, message: string): Promise<MatchRequest> => {
-    const response = await api.post('/match-requests', {
+    const response = await postIdempotent('/match-requests', {
       mentorId,
       message,
     });
     return response.data;
   },
 
-  getIncomingRequests: async (): Promise<MatchRequest[]> => {
-    const response = await api.get('/match-requests/incoming');
-    return response.data;
+  getIncomingRequests: async (query: RequestQuery = {}): Promise<RequestPage> => {
+    return getRequestPage('/match-requests/incoming', query);
+  },
+
+  getOutgoingRequests: async (query: RequestQuery = {}): Promise<RequestPage> => {
+    return getRequestPage('/match-requests/outgoing', query);
   },
 
-  getOutgoingRequests: async (): Promise<MatchRequest[]> => {
-    const response = await api.get('/match-requests/outgoing');
+  getRequestCounts: async (): Promise<RequestCounts> => {
+    const response = await api.get('/match-requests/counts');
     return response.data;
   },
 
@@ -96,7 +237,7 @@ export const matchRequestAPI = {
 // 메시지 API
 export const messageAPI = {
   sendMessage: async (messageData: MessageCreate): Promise<Message> => {
-    const response = await api.post('/messages', messageData);
+    const response = await postIdempotent('/messages', messageData);
     return response.data;
   },
 
@@ -15,7 +15,7 @@ export interface MatchRequest {
   mentorId: number;
   menteeId: number;
   message: string;
-  status: 'pending' | 'accepted' | 'rejected' | 'cancelled';
+  status: 'pending' | 'accepted' | 'rejected' | 'cancelled' | 'expired';
 }
 
 export interface LoginRequest {
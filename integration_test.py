@@ -190,7 +190,7 @@ class MentorMenteeAppTester:
         # 4. 멘티가 보낸 요청 상태 확인
         print("📋 멘티가 보낸 요청 상태 확인...")
         headers = {"Authorization": f"Bearer {self.mentee_token}"}
-        response = requests.get(f"{self.base_url}/match-requests/outgoing", headers=headers)
+        response = requests.get(f"{self.base_url}/match-requests/outgoing?status=all", headers=headers)
         
         if response.status_code == 200:
             outgoing_requests = response.json()
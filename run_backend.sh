@@ -25,11 +25,18 @@ fi
 echo "Installing Python dependencies..."
 pip install -r requirements.txt
 
-# 서버 실행
+# 서버 실행 (워커 수는 WEB_CONCURRENCY, 기본은 CPU 수)
 echo "Starting FastAPI server on port 8080..."
-python main.py &
+python serve.py --port 8080 &
 
-# 서버가 시작될 때까지 잠시 대기
-sleep 5
+# 준비 상태 확인 엔드포인트가 응답할 때까지 대기 (최대 30초)
+for i in $(seq 1 60); do
+    if curl -sf http://localhost:8080/health/ready > /dev/null; then
+        echo "Backend server started successfully"
+        exit 0
+    fi
+    sleep 0.5
+done
 
-echo "Backend server started successfully"
+echo "Error: backend server did not become ready"
+exit 1
@@ -0,0 +1,129 @@
+"""
+요청 수용 제어(동시 처리 제한, 대기열, 503) 테스트
+"""
+import asyncio
+
+from admission import AdmissionController, AdmissionGate, AdmissionMiddleware, route_class
+
+
+class _SlowApp:
+    """동시에 처리 중인 요청 수를 기록하는 느린 ASGI 앱"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, scope, receive, send):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _get(middleware, path: str, method: str = "GET"):
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+def test_route_classes():
+    assert route_class("POST", "/api/login") == "auth"
+    assert route_class("GET", "/api/avatars/3") == "images"
+    assert route_class("GET", "/api/images/mentor/3") == "images"
+    assert route_class("PUT", "/api/profile") == "writes"
+    assert route_class("GET", "/api/mentors") == "reads"
+    assert route_class("GET", "/health/ready") is None
+    assert route_class("GET", "/metrics") is None
+    assert route_class("OPTIONS", "/api/mentors") is None
+
+
+def test_gate_queues_in_order_and_sheds():
+    """자리는 대기열 순서대로 넘겨주고, 대기열이 가득 차거나 시간이 지나면 거절"""
+    gate = AdmissionGate("reads", concurrency=1, queue_size=2, timeout=0.2)
+
+    async def run():
+        assert await gate.acquire()
+        order = []
+
+        async def wait(name):
+            if await gate.acquire():
+                order.append(name)
+
+        waiters = [asyncio.create_task(wait("first")), asyncio.create_task(wait("second"))]
+        await asyncio.sleep(0)
+        assert gate.queued == 2
+        assert not await gate.acquire()  # 대기열이 가득 참
+
+        gate.release()
+        await asyncio.sleep(0.01)
+        assert order == ["first"] and gate.active == 1
+        await asyncio.gather(*waiters)  # second 는 시간 초과
+        assert order == ["first"] and gate.queued == 0
+        gate.release()
+        assert gate.active == 0
+
+    asyncio.run(run())
+    assert gate.results == {"admitted": 1, "queued": 1, "queue_full": 1, "timeout": 1}
+
+
+def test_cancelled_waiter_leaves_queue():
+    """기다리던 요청이 끊기면 대기열에서 빠지고 자리가 새지 않음"""
+    gate = AdmissionGate("writes", concurrency=1, queue_size=4, timeout=5)
+
+    async def run():
+        await gate.acquire()
+        task = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert gate.queued == 0
+        gate.release()
+        assert gate.active == 0
+
+    asyncio.run(run())
+
+
+def test_middleware_limits_concurrency_and_returns_503():
+    """한도를 넘는 동시 요청은 기다렸다 처리되고, 대기열을 넘는 요청은 503 + Retry-After"""
+    inner = _SlowApp()
+    controller = AdmissionController({"reads": (2, 2, 1.0), "auth": (1, 0, 1.0)})
+    middleware = AdmissionMiddleware(inner, controller=controller, retry_after=3, enabled=True)
+
+    async def run():
+        return await asyncio.gather(*(_get(middleware, "/api/mentors") for _ in range(6)))
+
+    responses = asyncio.run(run())
+    statuses = sorted(status for status, _ in responses)
+    assert statuses == [200, 200, 200, 200, 503, 503]
+    assert inner.peak == 2
+    rejected = next(headers for status, headers in responses if status == 503)
+    assert rejected[b"retry-after"] == b"3"
+
+    # 종류마다 따로 제한 (로그인이 몰려도 조회는 처리)
+    async def mixed():
+        return await asyncio.gather(
+            _get(middleware, "/api/login", "POST"), _get(middleware, "/api/login", "POST"),
+            _get(middleware, "/api/mentors"),
+        )
+
+    assert sorted(status for status, _ in asyncio.run(mixed())) == [200, 200, 503]
+    assert asyncio.run(_get(middleware, "/health/live"))[0] == 200  # 제한 없음
+
+
+def test_admission_metrics_exposed(client):
+    client.get("/health/live")
+    text = client.get("/metrics").text
+    assert 'admission_requests_total{class="reads",result="admitted"}' in text
+    assert "# TYPE admission_queue_depth gauge" in text
+    assert 'admission_in_flight{class="auth"} 0' in text
@@ -0,0 +1,164 @@
+"""
+메시지 보관(아카이브) 테스트
+"""
+from datetime import datetime, timedelta
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+import archive
+from database import backfill_conversations, engine, init_db, migrate_db
+from models import Conversation, Message, MessageArchive
+
+NOW = datetime(2026, 6, 1)
+
+
+def _add_messages(mentor, mentee, specs):
+    """(며칠 전, 읽음 여부) 목록으로 두 사용자 간 메시지를 시간 순으로 생성 (대화 연결은 backfill)"""
+    rows = [
+        {
+            "sender_id": mentor["id"] if i % 2 else mentee["id"],
+            "receiver_id": mentee["id"] if i % 2 else mentor["id"],
+            "content": f"message {i}",
+            "is_read": is_read,
+            "created_at": NOW - timedelta(days=days_ago),
+        }
+        for i, (days_ago, is_read) in enumerate(specs)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(Message), rows)
+    backfill_conversations(engine)
+
+
+def _history(client, user, other_id, limit=4):
+    """커서로 끝까지 페이지를 넘기며 메시지 내용 수집 (최신순)"""
+    contents, before = [], None
+    while True:
+        params = {"limit": limit, **({"before": before} if before else {})}
+        response = client.get(f"/api/messages/{other_id}", params=params, headers=user["headers"])
+        page = response.json()
+        contents += [m["content"] for m in reversed(page)]
+        before = response.headers.get("X-Next-Cursor")
+        if not before:
+            return contents
+
+
+def test_archive_moves_prefix_and_history_falls_through(client, make_user):
+    """오래된 앞부분만 보관되고, 페이지 조회는 보관 파일까지 이어짐"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    # 오래된 읽은 메시지 6개, 멘토가 아직 읽지 않은 메시지 1개, 그 뒤 오래된 읽은 메시지 2개, 최근 메시지 2개
+    _add_messages(mentor, mentee, [(400 - i, 1) for i in range(6)] + [(200, 0), (150, 1), (140, 1), (5, 1), (1, 1)])
+    before = _history(client, mentee, mentor["id"])
+
+    moved = archive.archive_messages(engine, older_than_days=90, batch_size=2, now=NOW)
+
+    assert sum(moved.values()) == 6  # 읽지 않은 메시지부터는 남김
+    assert _history(client, mentee, mentor["id"]) == before
+    assert before == [f"message {i}" for i in reversed(range(11))]
+
+
+def test_archive_keeps_last_message_and_unread_counts(client, make_user):
+    """대화의 마지막 메시지와 읽지 않은 메시지는 남아 대화 목록이 바뀌지 않음"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _add_messages(mentor, mentee, [(300, 1), (299, 1), (298, 1)])
+    conversations = client.get("/api/conversations", headers=mentor["headers"]).json()
+
+    archive.archive_messages(engine, older_than_days=90, now=NOW)
+
+    assert client.get("/api/conversations", headers=mentor["headers"]).json() == conversations
+    assert _history(client, mentor, mentee["id"]) == ["message 2", "message 1", "message 0"]
+
+
+def test_archive_records_watermark_and_conversation_id(client, db, make_user):
+    """보관할 때 대화의 archived_through_id 를 기록하고, 보관 파일 행에 conversation_id 복사"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _add_messages(mentor, mentee, [(300, 1), (299, 1), (298, 1)])
+    conversation = db.execute(
+        select(Conversation).where(Conversation.min_user_id == min(mentor["id"], mentee["id"]),
+                                   Conversation.max_user_id == max(mentor["id"], mentee["id"]))
+    ).scalar_one()
+    ids = db.execute(
+        select(Message.id).where(Message.conversation_id == conversation.id).order_by(Message.id)
+    ).scalars().all()
+
+    archive.archive_messages(engine, older_than_days=90, now=NOW)
+
+    db.refresh(conversation)
+    assert conversation.archived_through_id == ids[1]
+    rows = archive.read_archived_messages(db, conversation.id, limit=10)
+    assert [row.id for row in rows] == [ids[1], ids[0]]
+
+
+def test_failed_archive_record_keeps_messages(client, make_user, monkeypatch):
+    """보관 목록 기록이 실패하면 원본 삭제도 되돌려 메시지가 사라지지 않음"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _add_messages(mentor, mentee, [(300, 1), (299, 1), (298, 1)])
+    before = _history(client, mentee, mentor["id"])
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(archive, "_record_month", fail)
+    with pytest.raises(RuntimeError):
+        archive.archive_messages(engine, older_than_days=90, now=NOW)
+    assert _history(client, mentee, mentor["id"]) == before
+
+    monkeypatch.undo()
+    assert sum(archive.archive_messages(engine, older_than_days=90, now=NOW).values()) == 2  # 다시 실행하면 이어서 보관
+    assert _history(client, mentee, mentor["id"]) == before
+
+def test_never_archived_pair_skips_archive_files(client, make_user, monkeypatch):
+    """보관된 적 없는 대화는 페이지가 짧아도 보관 파일을 읽지 않음"""
+    mentor, mentee, other = make_user("mentor"), make_user("mentee"), make_user("mentee")
+    _add_messages(mentor, mentee, [(300, 1), (299, 1), (298, 1)])
+    archive.archive_messages(engine, older_than_days=90, now=NOW)  # 다른 대화는 보관됨
+    _add_messages(mentor, other, [(2, 1), (1, 1)])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("archive read for a conversation that was never archived")
+
+    monkeypatch.setattr(archive, "read_archived_messages", fail)
+    assert _history(client, other, mentor["id"], limit=10) == ["message 1", "message 0"]
+
+
+def test_migrate_upgrades_archive_files_without_conversation_id(tmp_path):
+    """conversation_id 가 없는 이전 보관 파일: 마이그레이션이 대화 키를 채우고 워터마크 기록"""
+    old = create_engine(f"sqlite:///{tmp_path}/old.db")
+    init_db(old)
+    with old.begin() as connection:
+        connection.execute(insert(Message), [
+            {"sender_id": 1, "receiver_id": 2, "content": "a", "is_read": 1, "created_at": NOW},
+            {"sender_id": 2, "receiver_id": 1, "content": "b", "is_read": 1, "created_at": NOW},
+            {"sender_id": 1, "receiver_id": 2, "content": "c", "is_read": 1, "created_at": NOW},
+        ])
+    backfill_conversations(old)
+
+    # 이전 형식으로 보관된 상태 만들기 (대화 쌍 인덱스, conversation_id 없음, 워터마크 없음)
+    os.makedirs(archive.archive_dir(old), exist_ok=True)
+    path = os.path.join(archive.archive_dir(old), archive.archive_filename("2026-06"))
+    with old.begin() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT id, sender_id, receiver_id, content, is_read, created_at FROM messages WHERE id < 3"
+        ).all()
+        connection.exec_driver_sql("DELETE FROM messages WHERE id < 3")
+        connection.exec_driver_sql("ALTER TABLE conversations DROP COLUMN archived_through_id")
+        connection.execute(insert(MessageArchive).values(
+            month="2026-06", filename=archive.archive_filename("2026-06"), rows=2, min_id=1, max_id=2
+        ))
+    with create_engine(f"sqlite:///{path}").begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE messages (id INTEGER PRIMARY KEY, sender_id INTEGER NOT NULL,"
+            " receiver_id INTEGER NOT NULL, content TEXT NOT NULL, is_read INTEGER, created_at DATETIME)"
+        )
+        connection.exec_driver_sql("CREATE INDEX ix_archived_messages_pair ON messages (sender_id, receiver_id, id)")
+        connection.exec_driver_sql("INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)", [tuple(row) for row in rows])
+
+    migrate_db(old)
+
+    with Session(bind=old) as db:
+        conversation = db.execute(select(Conversation)).scalar_one()
+        assert conversation.archived_through_id == 2
+        assert [row.content for row in archive.read_archived_messages(db, conversation.id, limit=10)] == ["b", "a"]
@@ -0,0 +1,134 @@
+"""
+기본 프로필 이미지(이니셜 플레이스홀더) 테스트
+"""
+import base64
+import io
+import time
+
+from PIL import Image
+
+import avatars
+
+
+def test_placeholder_served_locally_with_cache_headers(client, make_user):
+    """이미지가 없으면 외부 리다이렉트 대신 PNG 를 직접 반환하고 ETag 로 304"""
+    mentor = make_user("mentor", name="Jane Doe")
+    url = f"/api/images/mentor/{mentor['id']}"
+
+    response = client.get(url, headers=mentor["headers"], follow_redirects=False)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["cache-control"].startswith("private, max-age=")
+    assert Image.open(io.BytesIO(response.content)).size == (500, 500)
+
+    cached = client.get(url, headers={**mentor["headers"], "If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # 요청 크기는 고정 크기 중 그 이상인 가장 작은 크기로
+    small = client.get(f"{url}?size=60", headers=mentor["headers"])
+    assert Image.open(io.BytesIO(small.content)).size == (96, 96)
+    assert small.headers["etag"] != response.headers["etag"]
+
+
+def test_placeholders_are_shared_and_bounded():
+    """같은 (이니셜, 역할, 크기)는 한 번만 그리고, 캐시는 최대 항목 수를 넘지 않음"""
+    from avatars import PlaceholderCache, initials, placeholder_key
+
+    assert initials("jane doe", "mentee") == "JD"
+    assert initials("", "mentor") == "M"
+    assert initials("멘토", "mentor") in ("멘", "M")  # 글꼴에 한글이 없으면 역할 글자
+
+    cache = PlaceholderCache(max_entries=2)
+    first = cache.get(*placeholder_key("Jane Doe", "mentor", 48))
+    assert cache.get(*placeholder_key("John Dee", "mentor", 40)) is first
+    assert cache.lookups == {"miss": 1, "hit": 1}
+
+    cache.get(*placeholder_key("Jane Doe", "mentee", 48))
+    cache.get(*placeholder_key("Jane Doe", "mentor", 500))
+    assert len(cache) == 2
+
+
+def _upload(client, user, color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), color).save(buffer, format="PNG")
+    response = client.put(
+        "/api/profile",
+        json={"name": "업로드", "bio": "", "image": base64.b64encode(buffer.getvalue()).decode()},
+        headers=user["headers"],
+    )
+    assert response.status_code == 200
+    return response.json()["profile"]["imageUrl"]
+
+
+def test_signed_url_served_without_auth(client, make_user, capture_statements):
+    """응답의 imageUrl 은 인증 없이 열리고, 서명 확인과 304 는 DB 를 쓰지 않음"""
+    mentor = make_user("mentor", name="Jane Doe")
+    url = client.get("/api/me", headers=mentor["headers"]).json()["profile"]["imageUrl"]
+    assert url.startswith(f"/api/avatars/{mentor['id']}?v=1&exp=")
+
+    with capture_statements() as statements:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert statements.verbs == ["SELECT"]  # 이미지 컬럼만 한 번
+
+        statements.clear()
+        cached = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+        assert statements == []
+
+    max_age = int(response.headers["cache-control"].split("max-age=")[1])
+    assert avatars.AVATAR_URL_TTL_SECONDS <= max_age <= 2 * avatars.AVATAR_URL_TTL_SECONDS
+
+    # 업로드하면 버전이 바뀌어 새 URL, 요청 크기로 축소한 JPEG
+    uploaded = _upload(client, mentor, "red")
+    assert uploaded != url
+    small = client.get(f"{uploaded}&size=40")
+    assert small.headers["content-type"] == "image/jpeg"
+    assert Image.open(io.BytesIO(small.content)).size == (48, 48)
+
+
+def test_signed_url_rejects_tampering_and_expiry(client, make_user):
+    """다른 사용자 ID, 바뀐 버전, 지난 만료 시각은 403"""
+    mentor, other = make_user("mentor"), make_user("mentor")
+    url = avatars.signed_url(mentor["id"], 1)
+    query = url.split("?", 1)[1]
+
+    assert client.get(url).status_code == 200
+    assert client.get(f"/api/avatars/{other['id']}?{query}").status_code == 403
+    assert client.get(url.replace("v=1", "v=2")).status_code == 403
+
+    expired = avatars.signed_url(mentor["id"], 1, now=time.time() - 3 * avatars.AVATAR_URL_TTL_SECONDS)
+    assert client.get(expired).status_code == 403
+    # 같은 구간 안에서는 같은 URL
+    assert avatars.signed_url(mentor["id"], 1) == url
+
+
+def test_batch_thumbnails_use_constant_queries(client, make_user, capture_statements):
+    """썸네일 일괄 조회: 인증 + 메타데이터 + 캐시에 없는 이미지 BLOB, 사용자 수와 무관"""
+    mentee = make_user("mentee")
+    mentors = [make_user("mentor", name=f"Mentor {i}") for i in range(5)]
+    for mentor, color in zip(mentors[:2], ("red", "blue")):
+        _upload(client, mentor, color)
+    ids = ",".join(str(m["id"]) for m in mentors) + ",999999"
+
+    with capture_statements() as statements:
+        response = client.get(f"/api/avatars?ids={ids}&size=48", headers=mentee["headers"])
+        first = statements.verbs
+        statements.clear()
+        client.get(f"/api/avatars?ids={ids}&size=48", headers=mentee["headers"])
+        second = statements.verbs
+
+    assert response.status_code == 200
+    thumbnails = response.json()
+    assert set(thumbnails) == {str(m["id"]) for m in mentors}  # 없는 사용자는 빠짐
+    jpeg = thumbnails[str(mentors[0]["id"])]
+    assert jpeg.startswith("data:image/jpeg;base64,")
+    assert Image.open(io.BytesIO(base64.b64decode(jpeg.split(",", 1)[1]))).size == (48, 48)
+    assert thumbnails[str(mentors[4]["id"])].startswith("data:image/png;base64,")
+    assert first == ["SELECT", "SELECT", "SELECT"]
+    assert second == ["SELECT", "SELECT"]  # 썸네일은 캐시에서
+
+    assert client.get("/api/avatars?ids=a,b", headers=mentee["headers"]).status_code == 400
+    assert client.get("/api/avatars?ids=1").status_code in (401, 403)
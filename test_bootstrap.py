@@ -0,0 +1,42 @@
+"""
+세션 부트스트랩 엔드포인트 테스트
+"""
+
+
+def test_bootstrap_returns_summary_in_three_statements(client, make_user, capture_statements):
+    """프로필, 읽지 않은 수, 요청 수, 최근 대화를 인증 포함 SQL 3개로 조회"""
+    mentor = make_user("mentor", name="멘토")
+    mentee = make_user("mentee", name="멘티")
+    client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "부탁드립니다"},
+        headers=mentee["headers"],
+    )
+    for content in ("안녕하세요", "질문 있습니다"):
+        client.post("/api/messages", json={"receiver_id": mentor["id"], "content": content}, headers=mentee["headers"])
+
+    with capture_statements() as statements:
+        response = client.get("/api/bootstrap", headers=mentor["headers"])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user"]["id"] == mentor["id"]
+    assert body["user"]["profile"]["name"] == "멘토"
+    assert body["unread_count"] == 2
+    assert body["request_counts"] == {"pending": 1, "accepted": 0, "rejected": 0, "cancelled": 0, "expired": 0}
+    assert [c["user_id"] for c in body["conversations"]] == [mentee["id"]]
+    assert body["conversations"][0]["last_message"] == "질문 있습니다"
+    assert len(statements) == 3
+
+
+def test_bootstrap_field_selection(client, make_user):
+    """fields 로 고른 항목만 반환, 알 수 없는 항목은 400"""
+    mentee = make_user("mentee")
+
+    body = client.get("/api/bootstrap?fields=unread_count", headers=mentee["headers"]).json()
+    assert body == {"unread_count": 0}
+
+    body = client.get("/api/bootstrap?fields=user,request_counts", headers=mentee["headers"]).json()
+    assert set(body) == {"user", "request_counts"}
+
+    assert client.get("/api/bootstrap?fields=user,secrets", headers=mentee["headers"]).status_code == 400
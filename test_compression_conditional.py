@@ -0,0 +1,152 @@
+"""
+응답 압축 및 조건부 GET 테스트
+"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from compression import CompressionMiddleware, brotli, parse_accept_encoding
+from conditional import etag_matches
+from database import migrate_db
+
+
+def test_parse_accept_encoding_and_choice():
+    """q 값을 반영해 서버 선호 순서대로 인코딩 선택"""
+    assert parse_accept_encoding("gzip;q=0.5, br") == {"gzip": 0.5, "br": 1.0}
+
+    middleware = CompressionMiddleware(None, encodings=["br", "gzip"])
+    assert middleware.choose_encoding("gzip, deflate") == "gzip"
+    assert middleware.choose_encoding("identity") is None
+    if brotli is not None:
+        assert middleware.choose_encoding("gzip, br") == "br"
+        assert middleware.choose_encoding("br;q=0, gzip") == "gzip"
+
+
+def test_large_list_is_gzipped_and_small_is_not(client, make_user):
+    """최소 크기 이상의 응답만 압축"""
+    mentee = make_user("mentee")
+    for i in range(20):
+        make_user("mentor", name=f"압축 테스트 멘토 {i}", skills="Python,FastAPI,React", bio="소개 " * 20)
+
+    response = client.get(
+        "/api/mentors", headers={**mentee["headers"], "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["etag"].startswith("W/")
+    assert len(response.json()) >= 20
+
+    small = client.get("/api/me", headers={**mentee["headers"], "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli 미설치")
+def test_brotli_preferred_when_available(client, make_user):
+    """brotli 를 허용하는 클라이언트에는 br 로 압축"""
+    mentee = make_user("mentee")
+    for i in range(20):
+        make_user("mentor", skills="Go,Rust,Kotlin", bio="브로틀리 " * 20)
+    response = client.get(
+        "/api/mentors", headers={**mentee["headers"], "Accept-Encoding": "br, gzip"}
+    )
+    assert response.headers["content-encoding"] == "br"
+
+
+def test_compressed_etag_still_revalidates(client, make_user):
+    """압축으로 약한 ETag 가 되어도 If-None-Match 로 304"""
+    mentee = make_user("mentee")
+    for i in range(20):
+        make_user("mentor", bio="재검증 " * 30)
+    first = client.get("/api/mentors", headers={**mentee["headers"], "Accept-Encoding": "gzip"})
+    etag = first.headers["etag"]
+    assert etag_matches(etag, '"abc"') is False
+    second = client.get(
+        "/api/mentors",
+        headers={**mentee["headers"], "Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert second.status_code == 304
+
+
+def test_me_returns_304_until_profile_changes(client, make_user):
+    """사용자 version 이 바뀌기 전까지 /api/me 는 304"""
+    user = make_user("mentor")
+    first = client.get("/api/me", headers=user["headers"])
+    etag = first.headers["etag"]
+
+    cached = client.get("/api/me", headers={**user["headers"], "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.put("/api/profile", json={"name": "바뀐 이름"}, headers=user["headers"])
+    changed = client.get("/api/me", headers={**user["headers"], "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["profile"]["name"] == "바뀐 이름"
+
+
+def test_concurrent_profile_updates_both_succeed(make_user):
+    """같은 사용자를 읽어 둔 두 세션이 차례로 수정해도 실패 없이 version 이 두 번 오름"""
+    from crud import update_user_profile
+    from database import SessionLocal
+    from models import User
+
+    user = make_user("mentor")
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        loaded = first.get(User, user["id"]), second.get(User, user["id"])
+        assert [u.version for u in loaded] == [1, 1]
+        assert update_user_profile(first, user["id"], "첫 번째").version == 2
+        updated = update_user_profile(second, user["id"], "두 번째")  # 읽어 둔 version 은 1
+        assert (updated.name, updated.version) == ("두 번째", 3)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_request_lists_return_304_until_status_changes(client, make_user):
+    """요청 목록은 updated_at 이 바뀌기 전까지 304"""
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    created = client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "안녕하세요"},
+        headers=mentee["headers"],
+    ).json()
+
+    incoming = client.get("/api/match-requests/incoming", headers=mentor["headers"])
+    outgoing = client.get("/api/match-requests/outgoing", headers=mentee["headers"])
+    incoming_etag, outgoing_etag = incoming.headers["etag"], outgoing.headers["etag"]
+
+    assert client.get(
+        "/api/match-requests/incoming",
+        headers={**mentor["headers"], "If-None-Match": incoming_etag},
+    ).status_code == 304
+
+    client.put(f"/api/match-requests/{created['id']}/reject", headers=mentor["headers"])
+
+    assert client.get(
+        "/api/match-requests/incoming",
+        headers={**mentor["headers"], "If-None-Match": incoming_etag},
+    ).status_code == 200
+    assert client.get(
+        "/api/match-requests/outgoing",
+        headers={**mentee["headers"], "If-None-Match": outgoing_etag},
+    ).status_code == 200
+
+
+def test_migrate_adds_version_column(tmp_path):
+    """version 컬럼이 없는 기존 데이터베이스에 컬럼 추가"""
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255), password_hash VARCHAR(255),"
+            " name VARCHAR(255), role VARCHAR(50), bio TEXT, skills TEXT, profile_image BLOB, created_at DATETIME)"
+        ))
+        connection.execute(text("INSERT INTO users (email, name, role) VALUES ('a@a.com', 'a', 'mentor')"))
+
+    migrate_db(engine)
+    migrate_db(engine)  # 두 번 실행해도 안전
+
+    columns = {c["name"] for c in inspect(engine).get_columns("users")}
+    assert "version" in columns
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM users")).scalar() == 1
@@ -0,0 +1,139 @@
+"""
+대화(conversations) 테이블 테스트
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, inspect, select, text
+
+from database import backfill_conversations, engine, init_db
+from models import Conversation, Message
+
+NOW = datetime(2026, 6, 1)
+
+
+def _send(client, sender, receiver, content):
+    response = client.post(
+        "/api/messages", json={"receiver_id": receiver["id"], "content": content}, headers=sender["headers"]
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_messages_share_one_conversation_per_pair(client, db, make_user):
+    """어느 쪽이 보내도 같은 대화, 대화의 마지막 메시지 시각 갱신"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    first = _send(client, mentee, mentor, "안녕하세요")
+    second = _send(client, mentor, mentee, "반갑습니다")
+
+    rows = db.execute(
+        select(Message.conversation_id).where(Message.id.in_([first["id"], second["id"]]))
+    ).scalars().all()
+    assert len(set(rows)) == 1
+    conversation = db.get(Conversation, rows[0])
+    assert (conversation.min_user_id, conversation.max_user_id) == tuple(sorted([mentor["id"], mentee["id"]]))
+    assert conversation.last_message_at.isoformat() == second["created_at"]
+
+
+def test_unread_count_counts_whole_conversation(client, make_user):
+    """읽지 않은 메시지 수는 마지막 메시지만이 아니라 대화 전체 기준"""
+    mentor, mentee, other = make_user("mentor"), make_user("mentee"), make_user("mentee")
+    for content in ("질문 1", "질문 2", "질문 3"):
+        _send(client, mentee, mentor, content)
+    _send(client, mentor, mentee, "답장")  # 마지막 메시지는 멘토가 보냄
+    _send(client, other, mentor, "처음 뵙겠습니다")
+
+    conversations = client.get("/api/conversations", headers=mentor["headers"]).json()
+    assert [(c["user_id"], c["last_message"], c["unread_count"]) for c in conversations] == [
+        (other["id"], "처음 뵙겠습니다", 1),
+        (mentee["id"], "답장", 3),
+    ]
+
+    client.get(f"/api/messages/{mentee['id']}", headers=mentor["headers"])  # 읽음 처리
+    conversations = client.get("/api/conversations", headers=mentor["headers"]).json()
+    assert {c["user_id"]: c["unread_count"] for c in conversations} == {other["id"]: 1, mentee["id"]: 0}
+
+
+def test_history_reads_conversation_index(client, make_user, capture_statements):
+    """대화 기록은 (conversation_id, id) 인덱스 범위 하나로 읽음"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _send(client, mentee, mentor, "안녕하세요")
+
+    with capture_statements() as statements:
+        client.get(f"/api/messages/{mentor['id']}", headers=mentee["headers"])
+
+    statement, parameters = next(
+        (statement, parameters) for statement, parameters in zip(statements, statements.parameters)
+        if statement.lstrip().startswith("SELECT") and "FROM messages" in statement
+    )
+    with engine.connect() as connection:
+        plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+    assert "ix_messages_conversation_id" in plan
+    assert "uq_conversations_pair" in plan or "sqlite_autoindex_conversations" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_backfill_links_messages_written_without_conversation(client, make_user):
+    """conversation_id 없이 들어간 메시지를 대화에 연결 (기존 대화가 있으면 그 대화에)"""
+    mentor, mentee, other = make_user("mentor"), make_user("mentee"), make_user("mentee")
+    existing = _send(client, mentee, mentor, "API 로 보낸 메시지")
+    later = datetime.utcnow() + timedelta(days=1)  # 기존 대화의 마지막 메시지보다 나중
+    rows = [
+        {"sender_id": mentor["id"], "receiver_id": mentee["id"], "content": "a", "created_at": later},
+        {"sender_id": other["id"], "receiver_id": mentor["id"], "content": "b", "created_at": NOW},
+        {"sender_id": mentor["id"], "receiver_id": other["id"], "content": "c", "created_at": NOW + timedelta(hours=1)},
+    ]
+    with engine.begin() as connection:
+        ids = connection.execute(insert(Message).returning(Message.id), rows).scalars().all()
+
+    assert backfill_conversations(engine, batch_size=2) == 3
+    assert backfill_conversations(engine) == 0  # 다시 실행해도 변화 없음
+
+    with engine.connect() as connection:
+        linked = dict(connection.execute(
+            select(Message.id, Message.conversation_id).where(Message.id.in_(ids + [existing["id"]]))
+        ).all())
+        conversations = {
+            c.id: c for c in connection.execute(select(Conversation).where(Conversation.id.in_(linked.values())))
+        }
+    assert linked[ids[0]] == linked[existing["id"]]
+    assert linked[ids[1]] == linked[ids[2]] != linked[ids[0]]
+    assert conversations[linked[ids[0]]].last_message_at == later
+    assert conversations[linked[ids[1]]].last_message_at == NOW + timedelta(hours=1)
+
+    history = client.get(f"/api/messages/{other['id']}", headers=mentor["headers"]).json()
+    assert [m["content"] for m in history] == ["b", "c"]
+
+
+def test_init_db_migrates_messages_table(tmp_path):
+    """conversation_id 컬럼이 없는 기존 데이터베이스: 컬럼 추가 후 대화 생성"""
+    old = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with old.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE messages (id INTEGER PRIMARY KEY, sender_id INTEGER NOT NULL, receiver_id INTEGER NOT NULL,"
+            " content TEXT NOT NULL, is_read INTEGER, created_at DATETIME)"
+        ))
+        connection.execute(text(
+            "INSERT INTO messages (sender_id, receiver_id, content, is_read, created_at) VALUES"
+            " (1, 2, 'a', 1, '2026-01-01 00:00:00.000000'), (2, 1, 'b', 0, '2026-01-02 00:00:00.000000'),"
+            " (3, 1, 'c', 0, '2026-01-03 00:00:00.000000')"
+        ))
+
+    init_db(old)
+
+    assert "conversation_id" in {c["name"] for c in inspect(old).get_columns("messages")}
+    with old.connect() as connection:
+        pairs = connection.execute(
+            select(Conversation.min_user_id, Conversation.max_user_id).order_by(Conversation.id)
+        ).all()
+        unlinked = connection.execute(select(Message.id).where(Message.conversation_id.is_(None))).all()
+    assert sorted(pairs) == [(1, 2), (1, 3)]
+    assert unlinked == []
+
+
+def test_unread_count_endpoint(client, make_user):
+    """/api/messages/unread-count 가 /api/messages/{user_id} 로 해석되지 않음"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _send(client, mentee, mentor, "안녕하세요")
+    response = client.get("/api/messages/unread-count", headers=mentor["headers"])
+    assert response.status_code == 200
+    assert response.json() == {"unread_count": 1}
@@ -0,0 +1,104 @@
+"""
+데이터 내보내기 테스트
+"""
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+import archive
+import export
+from database import backfill_conversations, engine
+from models import Message
+
+
+def _send(client, sender, receiver, content):
+    response = client.post(
+        "/api/messages", json={"receiver_id": receiver["id"], "content": content}, headers=sender["headers"]
+    )
+    assert response.status_code in (200, 201), response.text
+
+
+def test_user_export_streams_own_records(client, make_user, monkeypatch):
+    """본인 프로필, 매칭 요청, 주고받은 메시지만 NDJSON 으로 내보냄"""
+    monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 64)
+    mentor, mentee, other = make_user("mentor"), make_user("mentee"), make_user("mentee")
+    client.post("/api/match-requests", json={"mentorId": mentor["id"], "message": "hi"}, headers=mentee["headers"])
+    for i in range(3):
+        _send(client, mentee, mentor, f"question {i}")
+    _send(client, other, mentor, "not exported")
+
+    response = client.get("/api/export", headers=mentee["headers"])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "attachment" in response.headers["content-disposition"]
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["type"] for r in records] == ["user", "match_request", "message", "message", "message"]
+    assert records[0]["email"] == mentee["email"] and "password_hash" not in records[0]
+    assert [r["content"] for r in records[2:]] == ["question 0", "question 1", "question 2"]
+
+    chunks = list(export.stream_export(mentee["id"], "ndjson"))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == response.content
+
+
+def test_user_export_csv(client, make_user):
+    """CSV 는 모든 레코드 종류의 열을 합친 헤더를 사용"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    _send(client, mentor, mentee, "hello, \"world\"")
+
+    response = client.get("/api/export", params={"format": "csv"}, headers=mentor["headers"])
+
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert list(rows[0].keys()) == export.EXPORT_COLUMNS
+    assert [(r["type"], r["content"]) for r in rows] == [("user", ""), ("message", "hello, \"world\"")]
+
+
+def test_admin_export_requires_key(client, make_user, monkeypatch):
+    """전체 내보내기는 ADMIN_API_KEY 와 같은 X-Admin-Key 가 있어야 함"""
+    user = make_user("mentee")
+    monkeypatch.setattr(export, "ADMIN_API_KEY", None)
+    assert client.get("/internal/export", headers={"X-Admin-Key": "anything"}).status_code == 403
+
+    monkeypatch.setattr(export, "ADMIN_API_KEY", "secret")
+    assert client.get("/internal/export", headers={"X-Admin-Key": "wrong"}).status_code == 403
+    response = client.get("/internal/export", headers={"X-Admin-Key": "secret"})
+    assert response.status_code == 200
+    user_ids = {r["id"] for r in map(json.loads, response.text.splitlines()) if r["type"] == "user"}
+    assert user["id"] in user_ids and len(user_ids) > 1
+
+
+def test_user_export_includes_own_archived_messages(client, make_user, capture_statements):
+    """보관된 메시지는 사용자의 대화 ID 로 보관 파일 인덱스를 써서 읽음"""
+    mentor, mentee, other = make_user("mentor"), make_user("mentee"), make_user("mentee")
+    old = datetime(2026, 1, 1)
+    rows = [
+        {"sender_id": sender["id"], "receiver_id": mentor["id"], "content": content, "is_read": is_read,
+         "created_at": old + timedelta(hours=hour)}
+        for hour, (sender, content, is_read) in enumerate(
+            [(mentee, "archived", 1), (other, "someone else", 1), (mentee, "kept", 0), (other, "someone else", 0)]
+        )
+    ]  # 읽지 않은 메시지부터는 보관하지 않음 (뒤 테스트의 보관 작업에도 남음)
+    with engine.begin() as connection:
+        connection.execute(insert(Message), rows)
+    backfill_conversations(engine)
+    archive.archive_messages(engine, older_than_days=0, now=old + timedelta(days=1))
+    _send(client, mentee, mentor, "live")
+
+    path = os.path.join(archive.archive_dir(engine), archive.archive_filename("2026-01"))
+    with capture_statements(archive.archive_engine(path)) as statements:
+        response = client.get("/api/export", headers=mentee["headers"])
+
+    contents = [r["content"] for r in map(json.loads, response.text.splitlines()) if r["type"] == "message"]
+    assert contents == ["archived", "kept", "live"]
+    [statement] = statements
+    with archive.archive_engine(path).connect() as connection:
+        plan = " ".join(
+            row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", statements.parameters[0])
+        )
+    assert "ix_archived_messages_conversation" in plan
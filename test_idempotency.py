@@ -0,0 +1,144 @@
+"""
+Idempotency-Key 재시도 처리 테스트
+"""
+import asyncio
+import json
+import threading
+import uuid
+
+from auth import create_access_token
+from idempotency import IdempotencyMiddleware, IdempotencyStore
+
+
+def test_retried_message_is_not_duplicated(client, make_user):
+    """같은 키로 다시 보내면 저장된 응답을 돌려주고 메시지는 하나만 생성"""
+    sender, receiver = make_user("mentor"), make_user("mentee")
+    headers = {**sender["headers"], "Idempotency-Key": uuid.uuid4().hex}
+    payload = {"receiver_id": receiver["id"], "content": "한 번만"}
+
+    first = client.post("/api/messages", json=payload, headers=headers)
+    retry = client.post("/api/messages", json=payload, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+
+    history = client.get(f"/api/messages/{sender['id']}", headers=receiver["headers"]).json()
+    assert [m["content"] for m in history] == ["한 번만"]
+
+    changed = client.post("/api/messages", json={**payload, "content": "다른 내용"}, headers=headers)
+    assert changed.status_code == 422
+
+
+def test_retried_match_request_replays_original(client, make_user):
+    """재시도가 "Already have a pending request" 대신 처음 응답을 받음"""
+    mentor, mentee = make_user("mentor"), make_user("mentee")
+    payload = {"mentorId": mentor["id"], "message": "부탁드립니다"}
+    headers = {**mentee["headers"], "Idempotency-Key": "request-1"}
+
+    first = client.post("/api/match-requests", json=payload, headers=headers)
+    retry = client.post("/api/match-requests", json=payload, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json()["id"] == first.json()["id"]
+
+    # 키 없이 보내면 기존처럼 중복 요청 오류
+    assert client.post("/api/match-requests", json=payload, headers=mentee["headers"]).status_code == 400
+
+
+class _SlowApp:
+    """호출 횟수를 세고 잠시 뒤 응답하는 ASGI 앱"""
+
+    def __init__(self, statuses=(200,)):
+        self.calls = 0
+        self.statuses = list(statuses)
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        status = self.statuses[min(self.calls, len(self.statuses)) - 1]
+        await asyncio.sleep(0.05)
+        body = json.dumps({"call": self.calls}).encode()
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _post(middleware, key: str, token: str, body: bytes = b"{}"):
+    scope = {
+        "type": "http", "method": "POST", "path": "/api/messages",
+        "headers": [(b"authorization", f"Bearer {token}".encode()), (b"idempotency-key", key.encode())],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+
+def _token(user_id: int) -> str:
+    return create_access_token({"sub": str(user_id), "email": "x@test.com", "name": "x", "role": "mentee"})
+
+
+def test_concurrent_duplicates_have_single_winner(app):
+    """동시에 온 같은 키 요청은 하나만 처리하고 나머지는 그 응답을 받음"""
+    inner = _SlowApp()
+    middleware = IdempotencyMiddleware(inner)
+    key, token = uuid.uuid4().hex, _token(900001)
+
+    async def run():
+        return await asyncio.gather(*(_post(middleware, key, token) for _ in range(5)))
+
+    responses = asyncio.run(run())
+    assert inner.calls == 1
+    assert {body for _, _, body in responses} == {b'{"call": 1}'}
+    assert sum(headers.get(b"idempotent-replayed") == b"true" for _, headers, _ in responses) == 4
+
+    # 다른 워커처럼 앞단 캐시가 없는 저장소도 DB 에서 같은 응답을 찾음
+    other = IdempotencyMiddleware(inner)
+    assert asyncio.run(_post(other, key, token))[2] == b'{"call": 1}'
+    assert inner.calls == 1
+
+
+def test_server_errors_and_expired_keys_are_reprocessed(app):
+    """5xx 응답은 저장하지 않고, 만료된 키는 새 요청으로 처리"""
+    inner = _SlowApp(statuses=(503, 200, 200))
+    middleware = IdempotencyMiddleware(inner, store=IdempotencyStore(ttl_seconds=0))
+    key, token = uuid.uuid4().hex, _token(900002)
+
+    assert asyncio.run(_post(middleware, key, token))[0] == 503
+    assert asyncio.run(_post(middleware, key, token))[0] == 200
+    assert asyncio.run(_post(middleware, key, token))[2] == b'{"call": 3}'
+    assert inner.calls == 3
+
+    assert middleware.store.purge_expired() >= 1
+
+
+def test_store_writes_run_off_the_event_loop(app):
+    """선점/완료/해제는 이벤트 루프 스레드가 아닌 스레드 풀에서 실행"""
+    threads = []
+
+    class RecordingStore(IdempotencyStore):
+        def claim(self, *args):
+            threads.append(("claim", threading.current_thread()))
+            return super().claim(*args)
+
+        def complete(self, *args):
+            threads.append(("complete", threading.current_thread()))
+            return super().complete(*args)
+
+        def release(self, *args):
+            threads.append(("release", threading.current_thread()))
+            return super().release(*args)
+
+    inner = _SlowApp(statuses=(503, 200))
+    middleware = IdempotencyMiddleware(inner, store=RecordingStore())
+    key, token = uuid.uuid4().hex, _token(900003)
+    assert asyncio.run(_post(middleware, key, token))[0] == 503
+    assert asyncio.run(_post(middleware, key, token))[0] == 200
+
+    assert [name for name, _ in threads] == ["claim", "release", "claim", "complete"]
+    assert all(thread is not threading.main_thread() for _, thread in threads)
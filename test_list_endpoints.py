@@ -0,0 +1,98 @@
+"""
+목록 엔드포인트 응답 형식 테스트
+
+목록 엔드포인트는 response_model 검증을 건너뛰므로 응답이 스키마와 일치하는지 직접 확인한다.
+"""
+import uuid
+from typing import List
+
+from pydantic import TypeAdapter
+
+from schemas import ConversationResponse, MatchRequestResponse, MessageResponse, UserResponse
+
+
+def test_mentor_list_matches_schema(client, make_user):
+    """멘토 목록이 UserResponse 스키마와 일치"""
+    mentor = make_user("mentor", skills="Python,React", bio="소개")
+    mentee = make_user("mentee")
+
+    response = client.get("/api/mentors", headers=mentee["headers"])
+    assert response.status_code == 200
+    mentors = TypeAdapter(List[UserResponse]).validate_python(response.json())
+    found = next(m for m in mentors if m.id == mentor["id"])
+    assert found.profile.skills == ["Python", "React"]
+    assert found.profile.imageUrl.startswith(f"/api/avatars/{mentor['id']}?v=")
+
+
+def test_match_request_lists_match_schema(client, make_user):
+    """받은/보낸 요청 목록이 MatchRequestResponse 스키마와 일치"""
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "안녕하세요"},
+        headers=mentee["headers"],
+    )
+
+    incoming = client.get("/api/match-requests/incoming", headers=mentor["headers"]).json()
+    outgoing = client.get("/api/match-requests/outgoing", headers=mentee["headers"]).json()
+    assert TypeAdapter(List[MatchRequestResponse]).validate_python(incoming)
+    assert incoming == outgoing
+    assert incoming[0] == {
+        "id": incoming[0]["id"],
+        "mentorId": mentor["id"],
+        "menteeId": mentee["id"],
+        "message": "안녕하세요",
+        "status": "pending",
+    }
+
+
+def test_messages_and_conversations_match_schema(client, make_user):
+    """메시지/대화 목록이 스키마와 일치하고 이름이 채워짐"""
+    alice = make_user("mentor", name="앨리스")
+    bob = make_user("mentee", name="밥")
+    for content in ("첫 메시지", "두 번째"):
+        client.post(
+            "/api/messages",
+            json={"receiver_id": bob["id"], "content": content},
+            headers=alice["headers"],
+        )
+
+    messages = client.get(f"/api/messages/{alice['id']}", headers=bob["headers"]).json()
+    parsed = TypeAdapter(List[MessageResponse]).validate_python(messages)
+    assert [m.content for m in parsed] == ["첫 메시지", "두 번째"]
+    assert all(m.sender_name == "앨리스" and m.receiver_name == "밥" for m in parsed)
+
+    conversations = client.get("/api/conversations", headers=alice["headers"]).json()
+    parsed = TypeAdapter(List[ConversationResponse]).validate_python(conversations)
+    assert parsed[0].user_id == bob["id"]
+    assert parsed[0].user_name == "밥"
+    assert parsed[0].user_role == "mentee"
+    assert parsed[0].last_message == "두 번째"
+
+
+def test_mentor_directory_filter_sort_and_pages(client, make_user):
+    """스킬은 대소문자 구분 없이 거르고, 같은 이름은 ID 순, 페이지마다 전체 수 제공"""
+    tag = uuid.uuid4().hex[:8]
+    ids = [
+        make_user("mentor", name=name, skills=f"Go,{tag}Kotlin")["id"]
+        for name in ("bora", "Ahn", "bora", "Choi", "ahn")
+    ]
+    make_user("mentor", name="Zed", skills="Go")
+    mentee = make_user("mentee")
+
+    def fetch(**params):
+        response = client.get("/api/mentors", params=params, headers=mentee["headers"])
+        assert response.status_code == 200
+        return [m["id"] for m in response.json()], int(response.headers["x-total-count"])
+
+    by_name, total = fetch(skill=f"{tag.upper()}kotlin", order_by="name")
+    assert total == 5
+    assert by_name == [ids[1], ids[4], ids[0], ids[2], ids[3]]
+
+    descending, _ = fetch(skill=tag, order_by="-name")
+    assert descending == list(reversed(by_name))
+
+    pages = [fetch(skill=tag, order_by="name", page=page, page_size=2) for page in (1, 2, 3)]
+    assert [ids for ids, _ in pages] == [by_name[:2], by_name[2:4], by_name[4:]]
+    assert {total for _, total in pages} == {5}
@@ -0,0 +1,108 @@
+"""
+비차단 JSON 로그 파이프라인과 access 로그 테스트
+"""
+import json
+import logging
+import time
+
+import pytest
+
+
+class _ListHandler(logging.Handler):
+    """포맷한 로그 줄을 모으는 핸들러 (delay 초만큼 느린 디스크 흉내)"""
+
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.lines = []
+        self.delay = delay
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def captured():
+    import logs
+
+    handler = _ListHandler()
+    handler.setFormatter(logs.JsonFormatter())
+    logs.setup_logging([handler])
+    try:
+        yield handler
+    finally:
+        logs.shutdown_logging()
+
+
+def _records(handler, logger_name):
+    import logs
+
+    logs.shutdown_logging()  # 큐에 남은 레코드를 모두 씀
+    return [r for r in map(json.loads, handler.lines) if r["logger"] == logger_name]
+
+
+def test_access_log_has_request_context(client, make_user, captured):
+    """access 로그에 request_id, route, 상태, 지연시간, SQL 문 수 기록"""
+    user = make_user("mentee")
+    response = client.get("/api/me", headers={**user["headers"], "X-Request-ID": "req-123"})
+    missing = client.get("/api/nope", headers=user["headers"])
+
+    records = _records(captured, "access")
+    me = next(r for r in records if r["path"] == "/api/me")
+    assert response.headers["x-request-id"] == me["request_id"] == "req-123"
+    assert me["route"] == "/api/me" and me["method"] == "GET" and me["status"] == 200
+    assert me["duration_ms"] >= 0 and me["db_statements"] >= 1
+
+    nope = next(r for r in records if r["path"] == "/api/nope")
+    assert nope["status"] == 404 and nope["route"] == "unmatched"
+    assert nope["request_id"] == missing.headers["x-request-id"] != "req-123"
+
+
+def test_success_sampling_keeps_errors_and_slow_requests():
+    """성공 응답만 표본 추출하고, 오류와 느린 요청은 항상 기록"""
+    from logs import AccessLogMiddleware
+
+    middleware = AccessLogMiddleware(app=None, sample_rate=0, slow_ms=500)
+    assert not middleware.should_log(200, 10)
+    assert middleware.should_log(404, 10)
+    assert middleware.should_log(500, 10)
+    assert middleware.should_log(200, 800)
+    assert AccessLogMiddleware(app=None, sample_rate=1).should_log(200, 10)
+
+
+def test_logging_does_not_wait_for_slow_handler():
+    """느린 핸들러가 있어도 로그를 남기는 쪽은 기다리지 않고, 예외는 JSON 필드로 기록"""
+    import logs
+
+    handler = _ListHandler(delay=0.2)
+    handler.setFormatter(logs.JsonFormatter())
+    logs.setup_logging([handler])
+    try:
+        logger = logging.getLogger("test.slow")
+        started = time.perf_counter()
+        for _ in range(3):
+            logger.info("event", extra={"user_id": 7})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        assert time.perf_counter() - started < 0.1
+    finally:
+        logs.shutdown_logging()
+
+    records = [json.loads(line) for line in handler.lines]
+    assert [r["message"] for r in records] == ["event", "event", "event", "failed"]
+    assert records[0]["user_id"] == 7
+    assert "ValueError: boom" in records[-1]["exc"]
+
+
+def test_json_formatter_without_orjson(monkeypatch):
+    """orjson 이 없으면 표준 json 으로 같은 필드를 기록"""
+    import logs
+
+    monkeypatch.setattr(logs, "orjson", None)
+    record = logging.makeLogRecord({"name": "test", "levelname": "INFO", "msg": "안녕 %s", "args": ("세계",)})
+    record.user_id = object()  # JSON 으로 바꿀 수 없는 값은 str 로
+    line = json.loads(logs.JsonFormatter().format(record))
+    assert (line["logger"], line["message"]) == ("test", "안녕 세계")
+    assert line["user_id"].startswith("<object")
@@ -0,0 +1,171 @@
+"""
+주기 정리 작업과 워커 간 임대 테스트
+"""
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+
+def _backdate(db, request_ids, days):
+    from models import MatchRequest
+
+    past = datetime.utcnow() - timedelta(days=days)
+    db.execute(
+        update(MatchRequest).where(MatchRequest.id.in_(request_ids)).values(created_at=past, updated_at=past)
+    )
+    db.commit()
+
+
+def test_expire_and_purge_requests_in_batches(db, make_user):
+    """오래된 대기 요청은 만료, 오래된 거절/취소/만료 요청은 삭제, 수락된 요청은 유지"""
+    from crud import create_match_request, delete_match_request, update_request_status
+    from maintenance import BatchRunner, expire_pending_requests, purge_terminal_requests
+    from models import MatchRequest
+
+    mentor = make_user("mentor")
+    mentees = [make_user("mentee") for _ in range(5)]
+    requests = [create_match_request(db, mentor["id"], m["id"], "부탁드립니다").id for m in mentees]
+    delete_match_request(db, requests[3], mentees[3]["id"])
+    _backdate(db, requests[:4], days=30)
+
+    runner = BatchRunner(batch_size=2, pause=0)
+    assert expire_pending_requests(db, runner, ttl_days=14) == 3
+    db.expire_all()
+    statuses = [db.get(MatchRequest, request_id).status for request_id in requests]
+    assert statuses == ["expired", "expired", "expired", "cancelled", "pending"]
+
+    # 만료되면 멘티가 새 요청을 보낼 수 있음
+    create_match_request(db, mentor["id"], mentees[0]["id"], "다시 부탁드립니다")
+
+    update_request_status(db, requests[4], "accepted", mentor["id"])
+    _backdate(db, requests, days=120)
+    assert purge_terminal_requests(db, runner, retention_days=90) == 4
+    db.expire_all()
+    assert [request_id for request_id in requests if db.get(MatchRequest, request_id)] == [requests[4]]
+
+
+def test_purge_tokens_and_optimize(db, make_user):
+    """만료된 토큰 정리와 통계 갱신 작업"""
+    from crud import create_refresh_token
+    from maintenance import BatchRunner, MaintenanceScheduler, default_jobs
+    from models import RefreshToken
+
+    user = make_user("mentee")
+    create_refresh_token(db, user["id"])
+    create_refresh_token(db, user["id"])
+    db.execute(update(RefreshToken).where(RefreshToken.user_id == user["id"]).values(
+        expires_at=datetime.utcnow() - timedelta(seconds=1)
+    ))
+    db.commit()
+
+    scheduler = MaintenanceScheduler(runner=BatchRunner(batch_size=1, pause=0))
+    jobs = {job.name: job for job in default_jobs()}
+    status, rows = scheduler.run_job(jobs["purge_tokens"])
+    assert status == "ok" and rows >= 2
+    assert db.query(RefreshToken).filter(RefreshToken.user_id == user["id"]).count() == 0
+    assert scheduler.run_job(jobs["optimize"])[0] == "ok"
+    assert scheduler.run_job(jobs["optimize"])[0] == "ok"
+
+    lines = scheduler.metrics_lines()
+    assert 'maintenance_job_runs_total{job="optimize",result="ok"} 2' in lines
+    assert f'maintenance_job_rows_total{{job="purge_tokens"}} {rows}' in lines
+
+
+def test_only_one_worker_runs_each_job(app):
+    """같은 작업은 임대를 잡은 워커 하나만 실행하고, 다음 실행 시각 전에는 다시 실행하지 않음"""
+    from database import SessionLocal
+    from maintenance import Job, MaintenanceScheduler
+    from models import MaintenanceJob
+
+    calls = []
+    name = f"job-{uuid.uuid4().hex[:8]}"
+    jobs = [Job(name, 3600, lambda db, runner: calls.append(1) or 1)]
+    first = MaintenanceScheduler(jobs=jobs, owner="worker-1")
+    second = MaintenanceScheduler(jobs=jobs, owner="worker-2")
+
+    assert first.run_pending() == [name]
+    assert second.run_pending() == []
+    assert len(calls) == 1
+
+    # 실행 중 죽은 워커의 임대는 만료 후 다른 워커가 이어받음
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        db.execute(update(MaintenanceJob).where(MaintenanceJob.name == name).values(
+            owner="worker-1", lease_expires_at=now + timedelta(seconds=60), next_run_at=now
+        ))
+        db.commit()
+    assert second.run_pending(now=now) == []
+    assert second.run_pending(now=now + timedelta(seconds=61)) == [name]
+    assert len(calls) == 2
+
+    with SessionLocal() as db:
+        row = db.get(MaintenanceJob, name)
+        assert row.owner is None and row.last_status == "ok" and row.last_rows == 1
+        assert row.next_run_at > datetime.utcnow() + timedelta(minutes=59)
+
+
+def test_failed_job_is_retried_sooner(app):
+    """실패한 작업은 재시도 간격 뒤 다시 실행"""
+    from database import SessionLocal
+    from maintenance import MAINTENANCE_RETRY_SECONDS, Job, MaintenanceScheduler
+    from models import MaintenanceJob
+
+    def fail(db, runner):
+        raise RuntimeError("boom")
+
+    name = f"job-{uuid.uuid4().hex[:8]}"
+    scheduler = MaintenanceScheduler(jobs=[Job(name, 24 * 3600, fail)])
+    assert scheduler.run_pending() == [name]
+    assert scheduler.runs[(name, "error")] == 1
+
+    with SessionLocal() as db:
+        row = db.get(MaintenanceJob, name)
+        assert row.last_status == "error"
+        assert row.next_run_at < datetime.utcnow() + timedelta(seconds=MAINTENANCE_RETRY_SECONDS + 1)
+
+
+def test_long_job_renews_lease_between_batches(app):
+    """배치 사이에 임대를 연장하고, 그 사이 다른 워커가 가져가면 중단하고 임대를 건드리지 않음"""
+    from database import SessionLocal
+    from maintenance import BatchRunner, Job, MaintenanceScheduler
+    from models import MaintenanceJob
+
+    def lease_of(name):
+        with SessionLocal() as db:
+            row = db.get(MaintenanceJob, name)
+            return row.owner, row.lease_expires_at
+
+    seen = []
+
+    def long_job(db, runner):
+        _, claimed_until = lease_of(name)
+        time.sleep(0.4)  # 임대(1초)의 1/3 이 지남
+        runner.beat()
+        seen.append(lease_of(name)[1] - claimed_until)
+        return 1
+
+    name = f"job-{uuid.uuid4().hex[:8]}"
+    scheduler = MaintenanceScheduler(
+        jobs=[Job(name, 3600, long_job)], runner=BatchRunner(pause=0), lease_seconds=1, owner="worker-1"
+    )
+    assert scheduler.run_pending() == [name]
+    assert seen[0] >= timedelta(seconds=0.4)
+
+    def stolen_job(db, runner):
+        with SessionLocal() as other:
+            other.execute(update(MaintenanceJob).where(MaintenanceJob.name == name).values(owner="worker-2"))
+            other.commit()
+        time.sleep(0.4)
+        runner.beat()
+        seen.append("not reached")
+
+    name = f"job-{uuid.uuid4().hex[:8]}"
+    scheduler = MaintenanceScheduler(
+        jobs=[Job(name, 3600, stolen_job)], runner=BatchRunner(pause=0), lease_seconds=1, owner="worker-1"
+    )
+    assert scheduler.run_pending() == [name]
+    assert scheduler.runs[(name, "lease_lost")] == 1
+    assert len(seen) == 1
+    assert lease_of(name)[0] == "worker-2"
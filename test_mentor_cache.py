@@ -0,0 +1,170 @@
+"""
+멘토 목록 캐시 및 ETag 테스트
+"""
+import os
+import subprocess
+import sys
+import time
+
+from cache import MemoryCacheBackend, ResponseCache, mentor_cache
+from conditional import etag_matches
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1  # a 를 최근 사용으로 갱신
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+    assert len(backend) == 2
+
+
+def test_memory_backend_expires_entries_after_ttl():
+    """ttl 이 지난 항목은 없는 것으로 처리 (0 이면 만료 없음)"""
+    backend = MemoryCacheBackend(ttl=0.05)
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    time.sleep(0.06)
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+    forever = MemoryCacheBackend(ttl=0)
+    forever.set("a", 1)
+    time.sleep(0.01)
+    assert forever.get("a") == 1
+
+
+def test_invalidate_changes_key_and_etag():
+    """무효화하면 같은 파라미터라도 키와 ETag 가 바뀜"""
+    cache = ResponseCache(MemoryCacheBackend())
+    key = cache.key("python", "name", 1)
+    cache.set(key, ["cached"])
+    assert cache.get(key) == ["cached"]
+
+    cache.invalidate()
+    new_key = cache.key("python", "name", 1)
+    assert new_key != key
+    assert cache.get(new_key) is None
+    assert cache.etag(new_key) != cache.etag(key)
+
+
+def test_etag_matches_header_forms():
+    """If-None-Match 의 목록, 약한 비교, * 형식 처리"""
+    etag = '"1-abc"'
+    assert etag_matches('"1-abc"', etag)
+    assert etag_matches('W/"1-abc"', etag)
+    assert etag_matches('"0-xyz", "1-abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"0-xyz"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_mentor_list_is_cached_and_returns_304(client, make_user):
+    """변경이 없으면 ETag 로 304, 캐시 적중시 DB 를 다시 조회하지 않음"""
+    make_user("mentor", skills="Python,FastAPI")
+    mentee = make_user("mentee")
+
+    first = client.get("/api/mentors", headers=mentee["headers"])
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    hits = mentor_cache.hits
+    second = client.get("/api/mentors", headers=mentee["headers"])
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert mentor_cache.hits == hits + 1
+
+    not_modified = client.get(
+        "/api/mentors", headers={**mentee["headers"], "If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert etag_matches(not_modified.headers["etag"], etag)
+
+
+def test_profile_update_invalidates_mentor_list(client, make_user):
+    """멘토 프로필 수정시 목록 캐시와 ETag 가 무효화됨"""
+    mentor = make_user("mentor", skills="Java")
+    mentee = make_user("mentee")
+
+    before = client.get("/api/mentors", headers=mentee["headers"])
+    etag = before.headers["etag"]
+
+    response = client.put(
+        "/api/profile",
+        json={"name": "새이름", "bio": "소개", "skills": ["Go"]},
+        headers=mentor["headers"],
+    )
+    assert response.status_code == 200
+
+    after = client.get(
+        "/api/mentors", headers={**mentee["headers"], "If-None-Match": etag}
+    )
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    updated = next(m for m in after.json() if m["id"] == mentor["id"])
+    assert updated["profile"]["name"] == "새이름"
+    assert updated["profile"]["skills"] == ["Go"]
+
+
+def test_accepting_request_invalidates_mentor_list(client, make_user):
+    """매칭 요청 수락시 목록 캐시가 무효화됨"""
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+
+    etag = client.get("/api/mentors", headers=mentee["headers"]).headers["etag"]
+    created = client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "부탁드립니다"},
+        headers=mentee["headers"],
+    ).json()
+    accepted = client.put(
+        f"/api/match-requests/{created['id']}/accept", headers=mentor["headers"]
+    )
+    assert accepted.status_code == 200
+
+    after = client.get(
+        "/api/mentors", headers={**mentee["headers"], "If-None-Match": etag}
+    )
+    assert after.status_code == 200
+
+
+def test_mentor_list_pagination(client, make_user):
+    """page 파라미터로 페이지 단위 조회"""
+    from crud import MENTOR_PAGE_SIZE
+
+    mentee = make_user("mentee")
+    make_user("mentor")
+    full = client.get("/api/mentors", headers=mentee["headers"]).json()
+    page_one = client.get("/api/mentors?page=1", headers=mentee["headers"]).json()
+    assert page_one == full[:MENTOR_PAGE_SIZE]
+
+
+def test_change_from_other_worker_seen_after_ttl(client, make_user, monkeypatch):
+    """공유 백엔드 없이 여러 워커일 때: 다른 프로세스가 수정한 멘토가 TTL 뒤 목록과 ETag 에 반영"""
+    from directory import mentor_directory
+
+    ttl = 0.2  # serve.prepare 는 두 값을 같은 TTL 로 설정
+    monkeypatch.setattr(mentor_cache.backend, "ttl", ttl)
+    monkeypatch.setattr(mentor_directory, "refresh_seconds", ttl)
+    mentor = make_user("mentor", skills="Clojure")
+    mentee = make_user("mentee")
+    first = client.get("/api/mentors", headers=mentee["headers"])
+
+    # 다른 워커 프로세스의 수정 (그 프로세스의 캐시 세대만 오름)
+    code = (
+        "from database import SessionLocal; from crud import update_user_profile; "
+        f"update_user_profile(SessionLocal(), {mentor['id']}, '다른 워커')"
+    )
+    app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+    result = subprocess.run([sys.executable, "-c", code], cwd=app_dir, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    time.sleep(ttl)
+    changed = client.get("/api/mentors", headers={**mentee["headers"], "If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    assert {m["id"]: m["profile"]["name"] for m in changed.json()}[mentor["id"]] == "다른 워커"
@@ -0,0 +1,129 @@
+"""
+메모리 내 멘토 디렉터리 테스트
+"""
+import uuid
+
+from sqlalchemy import func, update
+
+from cache import MemoryCacheBackend, ResponseCache
+from directory import MentorDirectory
+from models import User
+
+# 디렉터리 결과와 비교할 SQL 정렬 키 ("-" 를 앞에 붙이면 내림차순, 같은 값은 항상 ID 순)
+SORT_KEYS = {
+    "id": User.id,
+    "name": func.lower(User.name),
+    "skill": func.lower(func.coalesce(User.skills, "")),
+    "created": User.created_at,
+}
+
+
+def _directory():
+    return MentorDirectory(ResponseCache(MemoryCacheBackend()))
+
+
+def _sql_mentors(db, skill=None, order_by=None):
+    """같은 조건의 멘토 ID 를 SQL 로 조회 (스킬은 대소문자 구분 없는 부분 일치, 알 수 없는 키는 ID 순)"""
+    query = db.query(User.id).filter(User.role == "mentor")
+    if skill:
+        query = query.filter(func.lower(User.skills).contains(skill.lower(), autoescape=True))
+    sort_key = SORT_KEYS.get((order_by or "id").lstrip("-"), User.id)
+    if order_by and order_by.startswith("-"):
+        query = query.order_by(sort_key.desc(), User.id.desc())
+    else:
+        query = query.order_by(sort_key, User.id)
+    return [row.id for row in query]
+
+
+def test_directory_matches_sql_queries(db, make_user):
+    """필터/정렬/페이지 결과가 SQL 조회와 같음"""
+    tag = uuid.uuid4().hex[:8]
+    for name, skills in (("bora", f"Go,{tag}Kotlin"), ("Ahn", f"{tag}kotlin"), ("bora", None), ("Choi", "Rust")):
+        make_user("mentor", name=name, skills=skills)
+    directory = _directory()
+
+    for skill in (None, tag, f"{tag}KOTLIN", f"go,{tag}", "없는스킬"):
+        for order_by in (None, "id", "-id", "name", "-name", "skill", "-skill", "created", "-created", "bogus"):
+            expected = _sql_mentors(db, skill, order_by)
+            mentors, total = directory.query(db, skill, order_by)
+            assert [m.id for m in mentors] == expected, (skill, order_by)
+            assert total == len(expected)
+
+    page, total = directory.query(db, None, "-name", page=2, page_size=3)
+    expected = _sql_mentors(db, None, "-name")
+    assert [m.id for m in page] == expected[3:6]
+    assert total == len(expected)
+
+
+def test_directory_serves_from_memory_after_load(db, make_user):
+    """적재 후에는 DB 세션 없이 조회"""
+    mentor = make_user("mentor", skills="Python,React")
+    make_user("mentor", skills="Python")
+    directory = _directory()
+    directory.load(db)
+
+    mentors, _ = directory.query(None, "react")
+    assert mentor["id"] in {m.id for m in mentors}
+    found = next(m for m in mentors if m.id == mentor["id"])
+    assert found.skills == "Python,React"
+    # 같은 스킬 문자열은 한 번만 저장
+    other = next(m for m in directory.query(None, "python")[0] if m.id != mentor["id"])
+    assert other.skill_names[0] is found.skill_names[0]
+
+
+def test_hooks_update_records(db, make_user):
+    """crud 훅(apply)이 레코드와 역색인을 갱신"""
+    from crud import update_user_profile
+
+    mentor = make_user("mentor", skills="Java")
+    directory = _directory()
+    directory.load(db)
+
+    user = update_user_profile(db, mentor["id"], "새이름", None, None, "Elixir")
+    directory.apply(user)
+
+    mentors, _ = directory.query(None, "elixir")
+    assert [m.name for m in mentors if m.id == mentor["id"]] == ["새이름"]
+    assert mentor["id"] not in {m.id for m in directory.query(None, "java")[0]}
+    assert directory.refreshes == 0
+
+
+def test_refresh_picks_up_changes_from_other_workers(db, make_user):
+    """다른 프로세스가 캐시 세대를 올리면 바뀐 멘토만 다시 읽음"""
+    mentor = make_user("mentor", skills="Scala")
+    directory = _directory()
+    directory.load(db)
+
+    # 다른 워커의 수정: DB 만 바뀌고 이 디렉터리의 훅은 호출되지 않음
+    db.execute(update(User).where(User.id == mentor["id"]).values(skills="Haskell", version=User.version + 1))
+    db.commit()
+    assert mentor["id"] in {m.id for m in directory.query(db, "scala")[0]}
+
+    directory.cache.backend.bump_generation()
+    assert mentor["id"] in {m.id for m in directory.query(db, "haskell")[0]}
+    assert directory.refreshes == 1
+
+    # 변경이 없으면 다시 새로고침하지 않음
+    directory.query(db, "haskell")
+    assert directory.refreshes == 1
+
+
+def test_list_endpoint_refreshes_before_cache_lookup(client, db, make_user, monkeypatch):
+    """캐시된 응답이 있어도 새로고침 주기가 지나면 다른 워커의 변경을 반영 (ETag 도 바뀜)"""
+    from directory import mentor_directory
+
+    mentee = make_user("mentee")
+    mentor = make_user("mentor", skills=f"Erlang{uuid.uuid4().hex[:8]}")
+    first = client.get("/api/mentors", headers=mentee["headers"])
+    etag = first.headers["etag"]
+    cached = {"If-None-Match": etag, **mentee["headers"]}
+    assert client.get("/api/mentors", headers=cached).status_code == 304
+
+    db.execute(update(User).where(User.id == mentor["id"]).values(name="다른 워커", version=User.version + 1))
+    db.commit()
+    assert client.get("/api/mentors", headers=cached).status_code == 304  # 아직 새로고침 전
+
+    monkeypatch.setattr(mentor_directory, "refresh_seconds", 0.001)
+    changed = client.get("/api/mentors", headers=cached)
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert {m["id"]: m["profile"]["name"] for m in changed.json()}[mentor["id"]] == "다른 워커"
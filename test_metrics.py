@@ -0,0 +1,80 @@
+"""
+요청 계측 및 SQL 프로파일링 테스트
+"""
+import logging
+
+import metrics
+from conftest import TEST_PASSWORD
+from metrics import MetricsRegistry, RequestStats, registry
+
+
+def _sample_value(text: str, prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} not found")
+
+
+def test_metrics_endpoint_reports_route_templates(client, make_user):
+    """경로 템플릿 단위로 지연시간/요청 수/SQL 문 수 노출"""
+    alice = make_user("mentor")
+    bob = make_user("mentee")
+    client.get(f"/api/messages/{bob['id']}", headers=alice["headers"])
+    client.get("/api/me", headers=alice["headers"])
+
+    text = client.get("/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/messages/{user_id}"}' in text
+    assert 'http_requests_total{method="GET",route="/api/me",status="200"}' in text
+    assert 'db_statements_per_request_count{method="GET",route="/api/me"}' in text
+    assert 'rate_limit_decisions_total{scope="messages",result="allowed"}' in text
+    assert 'cache_lookups_total{cache="mentors",result="hit"}' in text
+
+
+def test_statements_counted_per_request(client, make_user):
+    """/api/me 는 사용자 조회 한 번만 실행"""
+    user = make_user("mentee")
+    prefix = 'db_statements_per_request_sum{method="GET",route="/api/me"}'
+    count_prefix = 'db_statements_per_request_count{method="GET",route="/api/me"}'
+    before = client.get("/metrics").text
+    client.get("/api/me", headers=user["headers"])
+    after = client.get("/metrics").text
+
+    def value(text, key):
+        try:
+            return _sample_value(text, key)
+        except AssertionError:
+            return 0.0
+
+    assert value(after, count_prefix) - value(before, count_prefix) == 1
+    assert value(after, prefix) - value(before, prefix) == 1
+
+
+def test_repeated_statement_flagged_as_n_plus_one(caplog):
+    """한 요청에서 같은 SQL 이 임계치 이상 반복되면 N+1 로 기록"""
+    local = MetricsRegistry()
+    stats = RequestStats("/api/conversations")
+    stats.statements = metrics.N1_THRESHOLD
+    stats.statement_counts["SELECT users.id FROM users WHERE users.id = ?"] = metrics.N1_THRESHOLD
+
+    with caplog.at_level(logging.WARNING, logger="metrics"):
+        local.record_request("GET", "/api/conversations", 200, 0.01, stats)
+
+    assert local.n_plus_one[("GET", "/api/conversations")] == 1
+    assert "Possible N+1" in caplog.text
+    assert 'db_n_plus_one_requests_total{method="GET",route="/api/conversations"} 1' in local.render()
+
+
+def test_slow_query_logged_with_plan(client, make_user, monkeypatch, caplog):
+    """SLOW_QUERY_MS 를 넘는 쿼리는 EXPLAIN QUERY PLAN 과 함께 기록"""
+    user = make_user("mentee")
+    monkeypatch.setattr(metrics, "SLOW_QUERY_MS", 1e-6)
+    before = registry.slow_queries
+    with caplog.at_level(logging.WARNING, logger="metrics"):
+        client.get("/api/me", headers=user["headers"])
+        client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD})
+
+    assert registry.slow_queries > before
+    assert "Slow query" in caplog.text
+    assert "SEARCH users" in caplog.text
+    assert user["email"] not in caplog.text  # 바인딩 값은 개수와 타입만 기록
+    assert "params=3 (str, int, int)" in caplog.text
@@ -0,0 +1,76 @@
+"""
+비밀번호 해시 설정과 로그인 시 재해시 테스트
+"""
+import pytest
+
+from conftest import TEST_PASSWORD
+
+
+@pytest.fixture
+def hash_settings(monkeypatch):
+    """서버의 해시 설정을 바꿈 (빠른 테스트를 위해 낮은 비용 사용)"""
+    import auth
+
+    def apply(schemes=("bcrypt",), bcrypt_rounds=5):
+        context = auth.build_pwd_context(list(schemes), bcrypt_rounds=bcrypt_rounds)
+        monkeypatch.setattr(auth, "get_pwd_context", lambda: context)
+        return context
+
+    return apply
+
+
+def _user_with_hash(db, make_user, password_hash):
+    from crud import update_password_hash
+
+    user = make_user("mentee")
+    update_password_hash(db, user["id"], password_hash)
+    return user
+
+
+def _stored_hash(db, user_id):
+    from models import User
+
+    db.expire_all()
+    return db.get(User, user_id).password_hash
+
+
+@pytest.mark.parametrize("old_rounds", [4, 6])
+def test_login_rehashes_to_configured_cost(client, db, make_user, hash_settings, old_rounds):
+    """설정과 다른 비용의 해시는 로그인 성공 시 설정 비용으로 교체 (올리기/내리기 모두)"""
+    from auth import build_pwd_context
+
+    hash_settings(bcrypt_rounds=5)
+    user = _user_with_hash(db, make_user, build_pwd_context(["bcrypt"], bcrypt_rounds=old_rounds).hash(TEST_PASSWORD))
+
+    wrong = client.post("/api/login", json={"email": user["email"], "password": "wrong-password"})
+    assert wrong.status_code == 401
+    assert _stored_hash(db, user["id"]).startswith(f"$2b$0{old_rounds}$")
+
+    assert client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD}).status_code == 200
+    rehashed = _stored_hash(db, user["id"])
+    assert rehashed.startswith("$2b$05$")
+
+    # 이미 설정과 같으면 다시 쓰지 않음
+    assert client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD}).status_code == 200
+    assert _stored_hash(db, user["id"]) == rehashed
+
+
+def test_login_migrates_to_first_scheme(client, db, make_user, hash_settings):
+    """PASSWORD_SCHEMES 의 첫 방식으로 바꾸면 기존 bcrypt 해시는 검증 후 새 방식으로 저장"""
+    from auth import build_pwd_context
+
+    hash_settings(schemes=("pbkdf2_sha256", "bcrypt"))
+    user = _user_with_hash(db, make_user, build_pwd_context(["bcrypt"], bcrypt_rounds=4).hash(TEST_PASSWORD))
+
+    assert client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD}).status_code == 200
+    assert _stored_hash(db, user["id"]).startswith("$pbkdf2-sha256$")
+    assert client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD}).status_code == 200
+
+
+def test_calibrate_bcrypt_respects_target():
+    """목표 시간이 아주 짧으면 최소 비용, 길면 더 높은 비용"""
+    from calibrate_hash import BCRYPT_MIN_ROUNDS, calibrate_bcrypt
+
+    assert calibrate_bcrypt(0.0001, samples=1)[0] == BCRYPT_MIN_ROUNDS
+    rounds, seconds = calibrate_bcrypt(0.05, samples=1)
+    assert rounds > BCRYPT_MIN_ROUNDS and seconds <= 0.05
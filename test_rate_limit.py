@@ -0,0 +1,95 @@
+"""
+요청 제한(토큰 버킷) 테스트
+"""
+from ratelimit import MemoryRateLimitBackend, RateLimiter, parse_limit, rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_limit():
+    """"용량/초" 형식 해석"""
+    assert parse_limit("30/60") == (30, 0.5)
+    assert parse_limit("5") == (5, 5.0)
+
+
+def test_token_bucket_refills_over_time():
+    """용량만큼 연속 허용 후 거부, 시간이 지나면 충전"""
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(clock=clock)
+
+    results = [backend.consume("k", 3, 1.0)[0] for _ in range(4)]
+    assert results == [True, True, True, False]
+
+    allowed, retry_after, _ = backend.consume("k", 3, 1.0)
+    assert not allowed
+    assert 0 < retry_after <= 1.0
+
+    clock.now += 1.0
+    assert backend.consume("k", 3, 1.0)[0] is True
+    assert backend.consume("k", 3, 1.0)[0] is False
+
+
+def test_backend_bounds_number_of_keys():
+    """버킷 수가 최대치를 넘으면 오래된 버킷 정리"""
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(max_keys=10, clock=clock)
+    for i in range(50):
+        clock.now += 1
+        backend.consume(f"key-{i}", 5, 1.0)
+    assert len(backend._buckets) <= 10
+
+
+def test_limiter_counts_allowed_and_limited():
+    """범위별 허용/거부 카운터"""
+    limiter = RateLimiter(MemoryRateLimitBackend(clock=FakeClock()), {"messages": (1, 0.1)})
+    limiter.hit("messages", "user:1")
+    limiter.hit("messages", "user:1")
+    limiter.hit("messages", "user:2")
+    stats = limiter.snapshot()["messages"]
+    assert stats["allowed"] == 2
+    assert stats["limited"] == 1
+
+
+def test_message_flood_returns_429_before_write(client, make_user, monkeypatch):
+    """한도를 넘은 메시지 전송은 429 + Retry-After, 다른 사용자는 영향 없음"""
+    monkeypatch.setitem(rate_limiter.limits, "messages", (2, 0.01))
+    sender = make_user("mentee")
+    other = make_user("mentee")
+    receiver = make_user("mentor")
+    payload = {"receiver_id": receiver["id"], "content": "도배"}
+
+    statuses = [
+        client.post("/api/messages", json=payload, headers=sender["headers"]).status_code
+        for _ in range(3)
+    ]
+    assert statuses == [200, 200, 429]
+
+    limited = client.post("/api/messages", json=payload, headers=sender["headers"])
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+
+    # 제한된 요청은 저장되지 않음
+    history = client.get(f"/api/messages/{sender['id']}", headers=receiver["headers"]).json()
+    assert len(history) == 2
+
+    assert client.post("/api/messages", json=payload, headers=other["headers"]).status_code == 200
+
+
+def test_login_is_limited_by_ip(client, monkeypatch):
+    """로그인은 IP 기준으로 제한"""
+    monkeypatch.setitem(rate_limiter.limits, "login", (1, 0.01))
+    monkeypatch.setattr(rate_limiter, "backend", MemoryRateLimitBackend())
+    payload = {"email": "nobody@test.com", "password": "wrong"}
+
+    assert client.post("/api/login", json=payload).status_code == 401
+    response = client.post("/api/login", json=payload)
+    assert response.status_code == 429
+    assert "retry-after" in response.headers
+    assert 'rate_limit_decisions_total{scope="login",result="limited"}' in client.get("/metrics").text
+    assert client.get("/internal/rate-limits").status_code == 404
@@ -0,0 +1,113 @@
+"""
+리프레시 토큰 발급, 교체, 재사용 감지, 폐기 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from conftest import TEST_PASSWORD
+
+
+def _refresh(client, token):
+    return client.post("/api/token/refresh", json={"refreshToken": token})
+
+
+def test_login_returns_refresh_token_and_refresh_skips_password_check(client, make_user, monkeypatch):
+    """로그인 응답에 리프레시 토큰, 갱신은 비밀번호 검증 없이 새 토큰 쌍 발급"""
+    user = make_user("mentee")
+    login = client.post("/api/login", json={"email": user["email"], "password": TEST_PASSWORD})
+    assert login.status_code == 200
+    refresh_token = login.json()["refreshToken"]
+
+    def fail(*args):
+        raise AssertionError("password verification should not run on refresh")
+
+    monkeypatch.setattr("main.verify_and_update_password", fail)
+    refreshed = _refresh(client, refresh_token)
+    assert refreshed.status_code == 200
+    body = refreshed.json()
+    assert body["refreshToken"] != refresh_token
+
+    me = client.get("/api/me", headers={"Authorization": f"Bearer {body['token']}"})
+    assert me.status_code == 200
+    assert me.json()["id"] == user["id"]
+
+
+def _age_used_token(db, token, seconds):
+    from auth import hash_refresh_token
+    from models import RefreshToken
+
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+        .values(used_at=datetime.utcnow() - timedelta(seconds=seconds))
+    )
+    db.commit()
+
+
+def test_reused_token_revokes_family(client, db, make_user):
+    """유예 시간이 지난 뒤 교체된 토큰을 다시 쓰면 401, 같은 로그인에서 이어진 최신 토큰도 폐기"""
+    from auth import REFRESH_TOKEN_REUSE_GRACE_SECONDS
+    from crud import create_refresh_token
+    from models import RefreshToken
+
+    user = make_user("mentor")
+    first = create_refresh_token(db, user["id"])
+    second = _refresh(client, first).json()["refreshToken"]
+    _age_used_token(db, first, REFRESH_TOKEN_REUSE_GRACE_SECONDS + 1)
+
+    assert _refresh(client, first).status_code == 401
+    assert _refresh(client, second).status_code == 401
+
+    # 다른 로그인(family)은 영향 없음
+    other = create_refresh_token(db, user["id"])
+    assert _refresh(client, other).status_code == 200
+
+    # DB 에는 원문이 아닌 해시만 저장
+    assert db.query(RefreshToken).filter(RefreshToken.token_hash == first).first() is None
+
+
+def test_simultaneous_refreshes_share_successor(client, db, make_user):
+    """두 탭이 같은 토큰으로 거의 동시에 갱신: 둘 다 성공하고 같은 다음 토큰을 받음"""
+    from crud import create_refresh_token, rotate_refresh_token
+    from database import SessionLocal
+
+    user = make_user("mentee")
+    token = create_refresh_token(db, user["id"])
+
+    def rotate(_):
+        with SessionLocal() as session:
+            rotated = rotate_refresh_token(session, token)
+            return rotated and rotated[1]
+
+    with ThreadPoolExecutor(2) as pool:
+        first, second = pool.map(rotate, range(2))
+    assert first and first == second
+
+    # 다음 토큰이 이미 쓰였으면 유예 시간 안이라도 재사용으로 보고 폐기
+    third = _refresh(client, first).json()["refreshToken"]
+    assert _refresh(client, token).status_code == 401
+    assert _refresh(client, third).status_code == 401
+
+
+def test_logout_and_expiry(client, db, make_user):
+    """로그아웃한 토큰과 만료된 토큰은 거부"""
+    from crud import create_refresh_token
+    from auth import hash_refresh_token
+    from models import RefreshToken
+
+    user = make_user("mentee")
+    token = create_refresh_token(db, user["id"])
+    assert client.post("/api/logout", json={"refreshToken": token}).status_code == 204
+    assert _refresh(client, token).status_code == 401
+
+    expired = create_refresh_token(db, user["id"])
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(expired))
+        .values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    db.commit()
+    assert _refresh(client, expired).status_code == 401
+    assert _refresh(client, "not-a-token").status_code == 401
@@ -0,0 +1,100 @@
+"""
+매칭 요청 목록(받은/보낸 요청) 상태 필터, 커서 페이지, 상태별 개수 테스트
+"""
+from sqlalchemy import inspect
+
+
+def _send_requests(client, make_user, mentor, count):
+    """멘티 count 명이 같은 멘토에게 요청을 보내고 요청 ID 를 반환"""
+    ids = []
+    for _ in range(count):
+        mentee = make_user("mentee")
+        created = client.post(
+            "/api/match-requests",
+            json={"mentorId": mentor["id"], "message": "안녕하세요"},
+            headers=mentee["headers"],
+        ).json()
+        ids.append(created["id"])
+    return ids
+
+
+def test_incoming_defaults_to_pending(client, make_user):
+    """기본은 대기중 요청만, status=all 은 전체, 쉼표로 여러 상태"""
+    mentor = make_user("mentor")
+    ids = _send_requests(client, make_user, mentor, 3)
+    client.put(f"/api/match-requests/{ids[0]}/reject", headers=mentor["headers"])
+
+    pending = client.get("/api/match-requests/incoming", headers=mentor["headers"]).json()
+    assert [r["id"] for r in pending] == [ids[2], ids[1]]
+
+    everything = client.get("/api/match-requests/incoming?status=all", headers=mentor["headers"]).json()
+    assert [r["id"] for r in everything] == ids[::-1]
+
+    several = client.get(
+        "/api/match-requests/incoming?status=rejected,pending", headers=mentor["headers"]
+    ).json()
+    assert len(several) == 3
+
+    assert client.get(
+        "/api/match-requests/incoming?status=unknown", headers=mentor["headers"]
+    ).status_code == 400
+
+
+def test_incoming_cursor_pages(client, make_user):
+    """커서로 이어 받은 페이지가 겹치거나 빠지지 않음 (생성 시각이 같아도 ID 로 구분)"""
+    mentor = make_user("mentor")
+    ids = _send_requests(client, make_user, mentor, 5)
+
+    seen, cursor = [], None
+    while True:
+        url = "/api/match-requests/incoming?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=mentor["headers"])
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(r["id"] for r in page)
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert seen == ids[::-1]
+    assert client.get(
+        "/api/match-requests/incoming?cursor=invalid", headers=mentor["headers"]
+    ).status_code == 400
+
+
+def test_outgoing_status_filter_and_counts(client, make_user):
+    """보낸 요청 목록과 상태별 개수"""
+    mentor = make_user("mentor")
+    mentee = make_user("mentee")
+    first = client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "첫 요청"},
+        headers=mentee["headers"],
+    ).json()
+    client.delete(f"/api/match-requests/{first['id']}", headers=mentee["headers"])
+    second = client.post(
+        "/api/match-requests",
+        json={"mentorId": mentor["id"], "message": "두 번째"},
+        headers=mentee["headers"],
+    ).json()
+
+    pending = client.get("/api/match-requests/outgoing", headers=mentee["headers"]).json()
+    assert [r["id"] for r in pending] == [second["id"]]
+    cancelled = client.get(
+        "/api/match-requests/outgoing?status=cancelled", headers=mentee["headers"]
+    ).json()
+    assert [r["id"] for r in cancelled] == [first["id"]]
+
+    counts = {"pending": 1, "accepted": 0, "rejected": 0, "cancelled": 1, "expired": 0}
+    assert client.get("/api/match-requests/counts", headers=mentee["headers"]).json() == counts
+    assert client.get("/api/match-requests/counts", headers=mentor["headers"]).json() == counts
+
+
+def test_request_queue_indexes(app):
+    """(멘토/멘티, 상태, 생성 시각) 인덱스 존재"""
+    from database import engine
+
+    indexes = {index["name"]: index["column_names"] for index in inspect(engine).get_indexes("match_requests")}
+    assert indexes["ix_match_requests_mentor_status_created"] == ["mentor_id", "status", "created_at"]
+    assert indexes["ix_match_requests_mentee_status_created"] == ["mentee_id", "status", "created_at"]
@@ -0,0 +1,62 @@
+"""
+시드 데이터 생성 테스트
+"""
+from collections import Counter
+
+from sqlalchemy import create_engine, func, select
+
+from models import MatchRequest, Message, User
+from seed import seed_database
+
+
+def _snapshot(engine):
+    with engine.connect() as connection:
+        users = connection.execute(
+            select(User.email, User.name, User.role, User.bio, User.skills, User.created_at).order_by(User.id)
+        ).all()
+        messages = connection.execute(
+            select(Message.sender_id, Message.receiver_id, Message.content, Message.created_at).order_by(Message.id)
+        ).all()
+        requests = connection.execute(
+            select(MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.status).order_by(MatchRequest.id)
+        ).all()
+    return users, messages, requests
+
+
+def test_seed_is_deterministic(tmp_path):
+    """같은 시드로 같은 데이터 생성"""
+    engines = [create_engine(f"sqlite:///{tmp_path}/seed{i}.db") for i in range(2)]
+    for engine in engines:
+        result = seed_database(engine, 5, 20, match_requests=30, messages=500, seed=7, images=1, batch_size=64)
+        assert (len(result.mentor_ids), len(result.mentee_ids)) == (5, 20)
+        assert result.messages == 500
+
+    assert _snapshot(engines[0]) == _snapshot(engines[1])
+
+
+def test_seed_respects_app_invariants(tmp_path):
+    """멘티당 대기중 요청은 하나, 대화 크기는 한쪽으로 치우침"""
+    engine = create_engine(f"sqlite:///{tmp_path}/seed.db")
+    seed_database(engine, 10, 50, match_requests=300, messages=2000, seed=1, images=0)
+
+    with engine.connect() as connection:
+        pending = connection.execute(
+            select(MatchRequest.mentee_id, func.count())
+            .where(MatchRequest.status == "pending")
+            .group_by(MatchRequest.mentee_id)
+        ).all()
+        pairs = connection.execute(select(Message.sender_id, Message.receiver_id)).all()
+
+    assert all(count == 1 for _, count in pending)
+    sizes = sorted(Counter(tuple(sorted(pair)) for pair in pairs).values(), reverse=True)
+    assert sizes[0] >= 5 * sizes[len(sizes) // 2]
+
+
+def test_conversations_clamped_to_available_pairs(tmp_path):
+    """--conversations 가 가능한 (멘티, 멘토) 쌍 수보다 크면 그 수로 제한"""
+    engine = create_engine(f"sqlite:///{tmp_path}/seed.db")
+    seed_database(engine, 2, 3, match_requests=0, messages=100, seed=1, images=0, conversations=50)
+
+    with engine.connect() as connection:
+        pairs = connection.execute(select(Message.sender_id, Message.receiver_id).distinct()).all()
+    assert len({tuple(sorted(pair)) for pair in pairs}) <= 6
@@ -0,0 +1,95 @@
+"""
+서버 실행/상태 확인 테스트
+"""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+
+
+def test_health_endpoints(client, app):
+    """준비 상태는 startup 이후 200, 종료 중에는 503"""
+    assert client.get("/health/live").json() == {"status": "ok"}
+    assert client.get("/health/ready").status_code == 200
+
+    app.state.ready = False
+    try:
+        assert client.get("/health/ready").status_code == 503
+    finally:
+        app.state.ready = True
+
+
+def _init_worker(url):
+    env = dict(os.environ, DATABASE_URL=url)
+    return subprocess.run(
+        [sys.executable, "-c", "from database import init_db; init_db()"],
+        cwd=APP_DIR, env=env, capture_output=True, text=True,
+    )
+
+
+def test_concurrent_init_db_is_serialized(tmp_path):
+    """여러 프로세스가 동시에 init_db 를 호출해도 실패하지 않음"""
+    url = f"sqlite:///{tmp_path}/workers.db"
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(_init_worker, [url] * 4))
+
+    assert all(r.returncode == 0 for r in results), [r.stderr for r in results]
+    columns = {c["name"] for c in inspect(create_engine(url)).get_columns("users")}
+    assert "version" in columns
+    assert os.path.exists(f"{tmp_path}/workers.db.init.lock")
+
+
+def test_prepare_marks_database_ready(monkeypatch):
+    """serve.prepare 는 DB 를 한 번 초기화하고 워커가 건너뛰도록 표시"""
+    import serve
+
+    calls = []
+    monkeypatch.setattr("database.init_db", lambda: calls.append(1))
+    # prepare 가 설정한 환경변수가 테스트 후 복원되도록 monkeypatch 에 먼저 등록
+    for name in ("SERVER_DB_READY", "CACHE_TTL_SECONDS", "CACHE_BACKEND_URL", "MENTOR_DIRECTORY_REFRESH_SECONDS"):
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+    serve.prepare(workers=4, preload=False)
+
+    assert calls == [1]
+    assert os.environ["SERVER_DB_READY"] == "1"
+    assert os.environ["CACHE_TTL_SECONDS"] == str(serve.MULTI_WORKER_CACHE_TTL)
+    assert os.environ["MENTOR_DIRECTORY_REFRESH_SECONDS"] == str(serve.MULTI_WORKER_CACHE_TTL)
+
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    """앱 import 시 PIL, passlib, jose 를 불러오지 않음"""
+    code = "import sys, main; print(sorted(m for m in ('PIL', 'passlib', 'jose') if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_init_db_skips_when_schema_version_matches(tmp_path, monkeypatch):
+    """기록된 스키마 버전이 같으면 create_all 을 다시 실행하지 않음"""
+    import database
+    from models import Base
+
+    bind = create_engine(f"sqlite:///{tmp_path}/version.db")
+    database.init_db(bind)
+    assert database.stored_schema_version(bind) == database.schema_version()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("create_all should be skipped")
+
+    monkeypatch.setattr(Base.metadata, "create_all", fail)
+    database.init_db(bind)
+
+    # 모델 정의가 바뀌면 (마이그레이션 추가) 다시 초기화
+    monkeypatch.setattr(database, "COLUMN_MIGRATIONS", database.COLUMN_MIGRATIONS + [("users", "bio", "")])
+    with pytest.raises(AssertionError):
+        database.init_db(bind)
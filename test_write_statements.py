@@ -0,0 +1,68 @@
+"""
+crud 쓰기 함수의 SQL 문 수 테스트
+
+커밋 후 방금 쓴 행을 다시 SELECT 하지 않고, 상태 변경은 UPDATE ... RETURNING 한 문장으로 처리한다.
+"""
+import uuid
+
+
+def test_user_writes_are_single_statements(db, capture_statements):
+    """사용자 생성은 INSERT 하나, 세션에 있는 사용자 수정은 UPDATE 하나"""
+    from crud import create_user, update_user_profile
+
+    with capture_statements() as statements:
+        user = create_user(db, f"w-{uuid.uuid4().hex[:8]}@test.com", "hash", "작성자", "mentor")
+        assert user.id and user.created_at and user.version == 1
+    assert statements.verbs == ["INSERT"]
+
+    with capture_statements() as statements:
+        updated = update_user_profile(db, user.id, "새이름", "소개", None, "Go,Rust")
+        assert (updated.name, updated.skills, updated.version) == ("새이름", "Go,Rust", 2)
+    assert statements.verbs == ["UPDATE"]
+
+
+def test_match_request_writes(db, make_user, capture_statements):
+    """요청 생성은 중복 확인 + INSERT, 상태 변경은 UPDATE ... RETURNING 하나"""
+    from crud import create_match_request, delete_match_request, update_request_status
+    from models import MatchRequest
+
+    mentor = make_user("mentor")
+    mentees = [make_user("mentee") for _ in range(3)]
+
+    with capture_statements() as statements:
+        first = create_match_request(db, mentor["id"], mentees[0]["id"], "첫 요청")
+        assert first.id and first.status == "pending" and first.updated_at
+    assert statements.verbs == ["SELECT", "INSERT"]
+    second = create_match_request(db, mentor["id"], mentees[1]["id"], "두 번째")
+    third = create_match_request(db, mentor["id"], mentees[2]["id"], "세 번째")
+
+    with capture_statements() as statements:
+        cancelled = delete_match_request(db, third.id, mentees[2]["id"])
+        assert cancelled.status == "cancelled"
+    assert statements.verbs == ["UPDATE"]
+    # 이미 취소된 요청은 다시 취소되지 않음
+    assert delete_match_request(db, third.id, mentees[2]["id"]) is None
+
+    with capture_statements() as statements:
+        accepted = update_request_status(db, first.id, "accepted", mentor["id"])
+        assert accepted.status == "accepted"
+    # 수락은 해당 요청 갱신 + 나머지 대기 요청 거절
+    assert statements.verbs == ["UPDATE", "UPDATE"]
+    # 다른 멘토의 요청은 갱신하지 않음
+    assert update_request_status(db, first.id, "accepted", mentees[0]["id"]) is None
+
+    db.expire_all()
+    assert db.get(MatchRequest, second.id).status == "rejected"
+
+
+def test_create_message_upserts_conversation_and_inserts(db, make_user, capture_statements):
+    """메시지 생성은 대화 upsert(INSERT ... ON CONFLICT ... RETURNING) + 메시지 INSERT"""
+    from crud import create_message
+
+    sender, receiver = make_user("mentor"), make_user("mentee")
+    with capture_statements() as statements:
+        message = create_message(db, sender["id"], receiver["id"], "안녕하세요")
+        assert message.id and message.is_read == 0 and message.created_at
+        reply = create_message(db, receiver["id"], sender["id"], "반갑습니다")
+    assert statements.verbs == ["INSERT", "INSERT", "INSERT", "INSERT"]
+    assert reply.conversation_id == message.conversation_id